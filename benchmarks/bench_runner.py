@@ -659,6 +659,133 @@ def op_full_rerender(state):
     state._render_fn(state._build(state._counter), state.root)
 
 
+# ---------------------------------------------------------------------------
+# Dependency-tracking microbenchmarks
+#
+# Effects and holes that read the same three signals on every run: each
+# re-run re-reads identical sources, so it measures the cost of keeping
+# (rather than tearing down and relinking) stable dependency edges.
+# ---------------------------------------------------------------------------
+
+
+_STABLE_DEPS_COUNT = 1000
+
+
+def _setup_stable_effects(state):
+    """Create N effects that each read one shared and two own signals."""
+    rx = state._reactivity
+    shared, set_shared = rx.create_signal(0)
+    state._setter = set_shared
+    state._counter = 0
+    sink = []
+
+    def make(i):
+        left, _ = rx.create_signal(i)
+        right, _ = rx.create_signal(-i)
+        rx.create_effect(lambda: sink.append(shared() + left() + right()))
+
+    for i in range(_STABLE_DEPS_COUNT):
+        make(i)
+    sink.clear()
+
+
+def _setup_stable_holes(state):
+    """Mount N spans whose holes each read one shared and two own signals."""
+    rx = state._reactivity
+    h = state._h
+    shared, set_shared = rx.create_signal(0)
+    state._setter = set_shared
+    state._counter = 0
+
+    def span(i):
+        left, _ = rx.create_signal(f"l{i}")
+        right, _ = rx.create_signal(f"r{i}")
+        return h("span", {}, lambda: f"{left()}{shared()}{right()}")
+
+    state._render_fn(h("div", {}, *[span(i) for i in range(_STABLE_DEPS_COUNT)]), state.root)
+
+
+# A single memo reading thousands of signals: its first run links every
+# edge, and a re-run that reads them in a different order moves every
+# edge. Both should cost O(sources), not O(sources^2).
+_FAN_IN_COUNT = 16000
+
+
+def _setup_fan_in(state):
+    """Create N signals for one memo to read."""
+    rx = state._reactivity
+    state._signals = [rx.create_signal(i)[0] for i in range(_FAN_IN_COUNT)]
+
+
+def op_fan_in_first_run(state):
+    """Create a memo over all N signals and compute it once."""
+    rx = state._reactivity
+    signals = state._signals
+    total = rx.create_root(lambda dispose: rx.create_memo(lambda: sum(s() for s in signals)))
+    total()
+
+
+def _setup_fan_in_rerun(state):
+    """Compute a memo over N signals plus one trigger signal."""
+    rx = state._reactivity
+    trigger, set_trigger = rx.create_signal(0)
+    state._setter = set_trigger
+    order = [[rx.create_signal(i)[0] for i in range(_FAN_IN_COUNT)]]
+    state._order = order
+    state._total = rx.create_root(lambda dispose: rx.create_memo(lambda: trigger() + sum(s() for s in order[0])))
+    state._total()
+
+
+def _setup_fan_in_reorder(state):
+    """Like `_setup_fan_in_rerun`, but the next run reads the N signals reversed."""
+    _setup_fan_in_rerun(state)
+    state._order[0] = state._order[0][::-1]
+
+
+def op_fan_in_rerun(state):
+    """Write the trigger and recompute the memo."""
+    state._setter(1)
+    state._total()
+
+
+# ---------------------------------------------------------------------------
+# Multi-select microbenchmark
+#
+# A 10,000-row table whose rows read a shared set of checked keys through
+# `create_multi_selector`; each operation toggles one key, which should
+# touch one row rather than re-run all of them.
+# ---------------------------------------------------------------------------
+
+
+_MULTI_SELECT_ROWS = 10000
+
+
+def _setup_multi_select(state):
+    """Mount N rows whose class reflects membership in a checked-key set."""
+    rx = state._reactivity
+    h = state._h
+    checked, set_checked = rx.create_signal(frozenset(range(0, _MULTI_SELECT_ROWS, 2)))
+    is_checked = rx.create_multi_selector(checked)
+    state._set_checked = set_checked
+    state._counter = 0
+
+    def row(i):
+        return h("tr", {"class": lambda: "checked" if is_checked(i) else ""}, h("td", {}, str(i)))
+
+    state._render_fn(h("tbody", {}, *[row(i) for i in range(_MULTI_SELECT_ROWS)]), state.root)
+
+
+def op_toggle_checked(state):
+    """Toggle one row's key in the checked set."""
+    state._counter += 1
+    key = (state._counter * 7919) % _MULTI_SELECT_ROWS
+
+    def update():
+        state._set_checked(lambda keys: keys ^ {key})
+
+    state._reactivity.batch(update)
+
+
 # (name, setup_fn, operation_fn, default_warmup)
 BENCHMARKS = [
     ("create rows", _setup_empty, op_create_rows, 5),
@@ -676,6 +803,13 @@ BENCHMARKS = [
 HOLE_BENCHMARKS = [
     ("hole update (1k tree)", _setup_hole, op_hole_update, 5),
     ("full rerender (1k tree)", _setup_rerender, op_full_rerender, 5),
+    # Both reuse op_hole_update: one write re-runs all N computations.
+    ("stable-deps effects (1k)", _setup_stable_effects, op_hole_update, 5),
+    ("stable-deps holes (1k)", _setup_stable_holes, op_hole_update, 5),
+    ("wide fan-in first run (16k)", _setup_fan_in, op_fan_in_first_run, 2),
+    ("wide fan-in rerun (16k)", _setup_fan_in_rerun, op_fan_in_rerun, 2),
+    ("wide fan-in reorder (16k)", _setup_fan_in_reorder, op_fan_in_rerun, 2),
+    ("toggle multi-select (10k)", _setup_multi_select, op_toggle_checked, 5),
 ]
 
 
@@ -750,6 +884,9 @@ def run_benchmarks(warmup_override=None, iterations=10, include_memory=False, na
     memory = None
     if include_memory and (name_filter is None or "memory" in name_filter):
         memory = _measure_memory(_make_state)
+        memory.update(_measure_graph_memory(mods["wybthon.reactivity"]))
+        memory.update(_measure_list_memory(mods["wybthon.reactivity"]))
+        memory.update(_measure_pooled_cycles(_make_state, mods["wybthon.reactivity"]))
 
     return results, memory
 
@@ -780,6 +917,112 @@ def _measure_memory(make_state):
     }
 
 
+_GRAPH_NODES = 10_000
+
+
+def _measure_graph_memory(rx):
+    """Per-node cost of the reactive graph: a signal, and an effect reading three.
+
+    Effect bodies are built before tracing starts so only the graph
+    (computations, their source lists, and the signals' observer lists)
+    is counted.
+    """
+    values = range(_GRAPH_NODES)
+    bodies = []
+    for i in values:
+        bodies.append(lambda i=i: signals[i].get() + signals[i - 1].get() + signals[i - 2].get())
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    signals = [rx.Signal(i) for i in values]
+    signals_cur, _ = tracemalloc.get_traced_memory()
+    effects = [rx.effect(body) for body in bodies]
+    effects_cur, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for comp in effects:
+        comp.dispose()
+
+    return {
+        "signal_bytes": round((signals_cur - base) / _GRAPH_NODES),
+        "effect_3_sources_bytes": round((effects_cur - signals_cur) / _GRAPH_NODES),
+    }
+
+
+def _measure_list_memory(rx):
+    """Per-row cost of `map_array` and `index_array`: record, owner, and signals."""
+    source = [object() for _ in range(_GRAPH_NODES)]
+    figures = {}
+    for label, mapper in (("map_array_row_bytes", rx.map_array), ("index_array_slot_bytes", rx.index_array)):
+        items, _ = rx.create_signal(source)
+        mapped = rx.create_root(lambda dispose, mapper=mapper, items=items: mapper(items, lambda item, idx: None))
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        mapped()
+        cur, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        figures[label] = round((cur - base) / _GRAPH_NODES)
+    return figures
+
+
+def _measure_pooled_cycles(make_state, rx):
+    """Time the 5x create/clear cycle with and without row pooling.
+
+    Python has no cumulative allocation counter, so churn shows up as the
+    time the cycle spends allocating and freeing rows; the heap retained
+    afterwards shows what the pool keeps.
+    """
+
+    def cycle():
+        state = make_state()
+        start = time.perf_counter()
+        for _ in range(5):
+            state.set_data(state.build_data(1000))
+            state.set_data([])
+        elapsed = (time.perf_counter() - start) * 1000
+        state.cleanup()
+        return elapsed
+
+    def measure():
+        best = min(cycle() for _ in range(3))
+        tracemalloc.start()
+        cycle()
+        cur, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return round(best, 1), round(cur / (1024 * 1024), 2)
+
+    # The same cycle on a bare map_array (no DOM), where row records are
+    # the whole cost.
+    items, set_items = rx.create_signal([])
+    mapped = rx.create_root(lambda dispose: rx.map_array(items, lambda item, idx: None))
+
+    def rows_cycle():
+        start = time.perf_counter()
+        for _ in range(5):
+            set_items([object() for _ in range(_GRAPH_NODES)])
+            mapped()
+            set_items([])
+            mapped()
+        return (time.perf_counter() - start) * 1000
+
+    plain_ms, plain_mb = measure()
+    plain_rows_ms = min(rows_cycle() for _ in range(3))
+    rx.set_row_pooling(_GRAPH_NODES)
+    try:
+        pooled_ms, pooled_mb = measure()
+        pooled_rows_ms = min(rows_cycle() for _ in range(3))
+    finally:
+        rx.set_row_pooling(0)
+    return {
+        "create_clear_5x_ms": plain_ms,
+        "create_clear_5x_retained_mb": plain_mb,
+        "create_clear_5x_pooled_ms": pooled_ms,
+        "create_clear_5x_pooled_mb": pooled_mb,
+        "map_array_5x_10k_ms": round(plain_rows_ms, 1),
+        "map_array_5x_10k_pooled_ms": round(pooled_rows_ms, 1),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Output formatting
 # ---------------------------------------------------------------------------
@@ -815,6 +1058,20 @@ def format_table(results, memory=None):
         lines.append(f"  Ready:                   {memory['ready_mb']:>8.2f} MB")
         lines.append(f"  After 1k rows:           {memory['run_1k_mb']:>8.2f} MB")
         lines.append(f"  After 5x create/clear:   {memory['create_clear_5x_mb']:>8.2f} MB")
+        lines.append(f"  Per signal:              {memory['signal_bytes']:>8d} B")
+        lines.append(f"  Per effect (3 sources):  {memory['effect_3_sources_bytes']:>8d} B")
+        lines.append(f"  Per map_array row:       {memory['map_array_row_bytes']:>8d} B")
+        lines.append(f"  Per index_array slot:    {memory['index_array_slot_bytes']:>8d} B")
+        lines.append(
+            f"  5x create/clear:         {memory['create_clear_5x_ms']:>8.1f} ms"
+            f"  {memory['create_clear_5x_retained_mb']:>6.2f} MB retained"
+        )
+        lines.append(
+            f"    with row pooling:      {memory['create_clear_5x_pooled_ms']:>8.1f} ms"
+            f"  {memory['create_clear_5x_pooled_mb']:>6.2f} MB retained"
+        )
+        lines.append(f"  map_array 5x 10k rows:   {memory['map_array_5x_10k_ms']:>8.1f} ms")
+        lines.append(f"    with row pooling:      {memory['map_array_5x_10k_pooled_ms']:>8.1f} ms")
 
     lines.append("")
     return "\n".join(lines)
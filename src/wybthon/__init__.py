@@ -57,10 +57,13 @@ from .forms import (
     validate_form,
 )
 from .reactivity import (
+    BatchFetcher,
     Computed,
     ReactiveProps,
     Resource,
+    ResourceCache,
     Signal,
+    SignalArray,
     batch,
     catch_error,
     children,
@@ -68,12 +71,14 @@ from .reactivity import (
     create_deferred,
     create_effect,
     create_memo,
+    create_multi_selector,
     create_reaction,
     create_render_effect,
     create_resource,
     create_root,
     create_selector,
     create_signal,
+    create_signal_array,
     create_unique_id,
     get_owner,
     get_props,
@@ -86,7 +91,9 @@ from .reactivity import (
     on_mount,
     run_with_owner,
     split_props,
+    start_transition,
     untrack,
+    use_transition,
 )
 from .store import create_mutable, create_store, modify_mutable, produce, reconcile, unwrap
 
@@ -106,7 +113,7 @@ if _IN_BROWSER:
     from .context import Context, Provider, create_context, use_context
     from .dom import Element, Ref
     from .error_boundary import ErrorBoundary
-    from .events import DomEvent
+    from .events import DomEvent, listener
     from .flow import Dynamic, For, Index, Match, Show, Switch
     from .html import (
         a,
@@ -205,6 +212,8 @@ if _IN_BROWSER:
         "on_cleanup",
         "on_error",
         "untrack",
+        "start_transition",
+        "use_transition",
         "on",
         "get_props",
         "merge_props",
@@ -212,7 +221,12 @@ if _IN_BROWSER:
         "map_array",
         "index_array",
         "create_selector",
+        "create_multi_selector",
+        "create_signal_array",
+        "SignalArray",
         "Resource",
+        "ResourceCache",
+        "BatchFetcher",
         "ReactiveProps",
         "Signal",
         "Computed",
@@ -221,6 +235,7 @@ if _IN_BROWSER:
         "children",
         # Events
         "DomEvent",
+        "listener",
         # Context
         "Context",
         "create_context",
@@ -356,6 +371,8 @@ else:
         "on_cleanup",
         "on_error",
         "untrack",
+        "start_transition",
+        "use_transition",
         "on",
         "get_props",
         "merge_props",
@@ -363,7 +380,12 @@ else:
         "map_array",
         "index_array",
         "create_selector",
+        "create_multi_selector",
+        "create_signal_array",
+        "SignalArray",
         "Resource",
+        "ResourceCache",
+        "BatchFetcher",
         "ReactiveProps",
         "Signal",
         "Computed",
@@ -101,11 +101,15 @@ class Element:
     def element(self) -> Any:
         """The raw underlying DOM node, materialized on first access.
 
-        For id-backed elements this commits pending batched DOM ops
-        first, so the node exists and reflects every queued mutation.
+        For id-backed elements every access commits pending batched DOM
+        ops first, so the node exists and reflects every queued mutation
+        even under a deferred commit policy.
         """
-        if self._node is None and self._id is not None:
-            self._node = kernel.get_node(self._id)
+        if self._id is not None:
+            if self._node is None:
+                self._node = kernel.get_node(self._id)
+            else:
+                kernel.commit()
         return self._node
 
     @property
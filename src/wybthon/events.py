@@ -3,10 +3,13 @@
 Event delegation lives in the rendering kernel: one native listener per
 event type is installed on `document`, walks the ancestor chain of the
 event target natively, and calls into Python once per matched handler.
-The call carries a small JSON payload (event type, target value/checked
-state, key, mouse buttons, modifiers), so the common handler patterns
-(`evt.target.value`, `evt.key`, `evt.prevent_default()`) never touch a
-`JsProxy` at all.
+The call carries a small JSON payload holding only the fields that event
+type needs (target value/checked state for form events, key and
+modifiers for keyboard events, buttons and positions for pointer
+events), so the common handler patterns (`evt.target.value`, `evt.key`,
+`evt.prevent_default()`) never touch a `JsProxy` at all. A listener can
+declare its own field list instead, including extras like `deltaY` or
+`target.selectionStart`.
 
 Registering a handler is itself a batched op (`LISTEN`), so mounting a
 list with thousands of handlers adds nothing to the bridge-crossing
@@ -18,12 +21,18 @@ Public surface:
   exposing `type`, `target`, `current_target`, key and mouse fields,
   and helpers like [`prevent_default`][wybthon.DomEvent.prevent_default]
   and [`stop_propagation`][wybthon.DomEvent.stop_propagation].
+- [`listener`][wybthon.listener]: wraps a handler with delivery
+  options, such as coalescing `pointermove`/`scroll` to one call per
+  animation frame, passive registration, and the payload fields to
+  send.
 
 The remaining helpers are internal:
 [`set_handler`][wybthon.events.set_handler] and
 [`remove_handlers_for`][wybthon.events.remove_handlers_for] are called
 by the renderer, and [`dispatch_event`][wybthon.events.dispatch_event]
-is the entry point the kernel invokes when a native event fires.
+(or [`dispatch_path`][wybthon.events.dispatch_path] under
+`kernel.set_event_dispatch_mode("path")`) is the entry point the kernel
+invokes when a native event fires.
 
 See Also:
     - [Forms guide](../concepts/forms.md)
@@ -32,18 +41,101 @@ See Also:
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 from . import kernel
 from ._warnings import log_error
+from .reactivity import batch
 
-__all__ = ["DomEvent"]
+__all__ = ["DomEvent", "listener"]
 
 
 # Per-node handler tables: node_id -> {event_type: handler}.
 _handlers: Dict[int, Dict[str, Callable]] = {}
 
 
+class _Listener:
+    """A handler plus kernel delivery options (see [`listener`][wybthon.listener])."""
+
+    __slots__ = ("handler", "flags", "fields")
+
+    def __init__(self, handler: Callable, flags: int, fields: Optional[Tuple[str, ...]] = None) -> None:
+        self.handler = handler
+        self.flags = flags
+        self.fields = fields
+
+    def __call__(self, evt: Any) -> Any:
+        return self.handler(evt)
+
+
+def listener(
+    handler: Callable,
+    *,
+    coalesce: Optional[str] = None,
+    passive: bool = False,
+    fields: Optional[Iterable[str]] = None,
+) -> Callable:
+    """Wrap an event handler with delivery options for the kernel.
+
+    Use it as the value of an `on_*` prop:
+
+    ```python
+    h("canvas", {"on_pointermove": listener(track, coalesce="frame", passive=True)})
+    ```
+
+    Args:
+        handler: The `(DomEvent) -> None` callback.
+        coalesce: `"frame"` keeps only the latest event per node and type
+            and delivers it once per animation frame, instead of calling
+            Python for every native event. Coalesced handlers run after
+            the native event has finished, so `prevent_default`,
+            `stop_propagation`, and `DomEvent.raw` have no effect.
+        passive: Register the native root listener as passive, letting
+            the browser scroll without waiting for Python. It stays
+            passive only while every listener of that type is passive.
+        fields: Payload fields to send instead of the event type's
+            defaults (`kernel.DEFAULT_EVENT_FIELDS`), as DOM property
+            names: `"deltaY"` reads the event, `"value"`/`"checked"` and
+            `"target.selectionStart"` read the target. Read them back as
+            `evt.delta_y` or `evt.target.selection_start`.
+
+    Returns:
+        A callable usable anywhere a plain handler is.
+
+    Raises:
+        ValueError: If `coalesce` is not `None` or `"frame"`, or a field
+            name is empty or contains a comma.
+    """
+    if coalesce not in (None, "frame"):
+        raise ValueError('coalesce must be None or "frame"')
+    if fields is not None:
+        fields = tuple(fields)
+        for name in fields:
+            if not isinstance(name, str) or not name or "," in name:
+                raise ValueError(f"invalid event field name: {name!r}")
+    flags = 0
+    if coalesce == "frame":
+        flags |= kernel.LISTEN_COALESCE
+    if passive:
+        flags |= kernel.LISTEN_PASSIVE
+    return _Listener(handler, flags, fields)
+
+
+def _listen_flags(handler: Any) -> int:
+    """`OP_LISTEN` flags for `handler`, registering its payload schema if any."""
+    if not isinstance(handler, _Listener):
+        return 0
+    if handler.fields is None:
+        return handler.flags
+    return handler.flags | kernel.event_schema_id(handler.fields) << kernel.LISTEN_SCHEMA_SHIFT
+
+
+def _camel(name: str) -> str:
+    """`delta_y` -> `deltaY`; camelCase names pass through unchanged."""
+    head, *rest = name.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
 def _event_prop_to_type(name: str) -> str:
     """Normalize a prop name like `on_click` or `onClick` to a plain event type.
 
@@ -63,10 +155,11 @@ def _event_prop_to_type(name: str) -> str:
 class _EventTarget:
     """Payload-backed view of the event target.
 
-    Exposes the fields handlers actually read (`value`, `checked`)
-    straight from the dispatch payload, with no bridge crossing. The
-    raw DOM node is available through `element` as an escape hatch and
-    is materialized on first access.
+    Exposes the fields handlers actually read (`value`, `checked`, and
+    any `target.<prop>` the listener asked for) straight from the
+    dispatch payload, with no bridge crossing. Anything the payload
+    lacks is read from the raw DOM node, available through `element`
+    and materialized on first access.
     """
 
     __slots__ = ("_payload", "_element")
@@ -78,12 +171,16 @@ class _EventTarget:
     @property
     def value(self) -> Any:
         """The target's `value` at dispatch time (inputs, selects, textareas)."""
-        return self._payload.get("value")
+        if "value" in self._payload:
+            return self._payload["value"]
+        return getattr(self.element, "value", None)
 
     @property
     def checked(self) -> bool:
         """The target's `checked` state at dispatch time."""
-        return bool(self._payload.get("checked"))
+        if "checked" in self._payload:
+            return bool(self._payload["checked"])
+        return bool(getattr(self.element, "checked", False))
 
     @property
     def element(self) -> Any:
@@ -102,14 +199,31 @@ class _EventTarget:
         """`FileList` for file inputs, fetched from the raw node."""
         return getattr(self.element, "files", None)
 
+    def __getattr__(self, name: str) -> Any:
+        # `target.<prop>` payload fields, e.g. `selection_start`.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        prop = _camel(name)
+        key = "target." + prop
+        if key in self._payload:
+            return self._payload[key]
+        element = self.element
+        if element is None:
+            raise AttributeError(name)
+        return getattr(element, prop)
+
 
 class DomEvent:
     """The event object Wybthon passes to delegated handlers.
 
     Built from the kernel's dispatch payload rather than a `JsProxy`,
-    so reading it is free of bridge crossings. Use
+    so reading it is free of bridge crossings. Fields are read lazily;
+    one the listener's payload does not carry falls back to the native
+    event while it is being dispatched, and to its default afterwards.
+    Extra payload fields (see [`listener`][wybthon.listener]) read as
+    snake_case attributes, e.g. `evt.delta_y` or `evt.pointer_id`. Use
     [`raw`][wybthon.DomEvent.raw] to reach the native event object for
-    anything not covered by the payload.
+    anything else.
 
     Attributes:
         type: Event type string (e.g., `"click"`).
@@ -117,33 +231,9 @@ class DomEvent:
             exposing `value`, `checked`, `files`, and `element`.
         current_target: The element whose handler is currently running
             (an id-backed [`Element`][wybthon.Element]).
-        key: `KeyboardEvent.key`, or `None` for non-keyboard events.
-        code: `KeyboardEvent.code`, or `None`.
-        alt_key: Whether Alt was held.
-        ctrl_key: Whether Ctrl was held.
-        meta_key: Whether Meta/Cmd was held.
-        shift_key: Whether Shift was held.
-        button: `MouseEvent.button` (0 for primary).
-        client_x: Pointer x position, when applicable.
-        client_y: Pointer y position, when applicable.
     """
 
-    __slots__ = (
-        "type",
-        "target",
-        "current_target",
-        "key",
-        "code",
-        "alt_key",
-        "ctrl_key",
-        "meta_key",
-        "shift_key",
-        "button",
-        "client_x",
-        "client_y",
-        "_stopped",
-        "_default_prevented",
-    )
+    __slots__ = ("type", "target", "current_target", "_payload", "_stopped", "_default_prevented")
 
     def __init__(self, payload: Dict[str, Any], current_target: Optional[Any] = None) -> None:
         """Build an event from a dispatch payload dict.
@@ -156,18 +246,76 @@ class DomEvent:
         self.type = payload.get("type")
         self.target = _EventTarget(payload)
         self.current_target = current_target
-        self.key = payload.get("key")
-        self.code = payload.get("code")
-        self.alt_key = bool(payload.get("altKey"))
-        self.ctrl_key = bool(payload.get("ctrlKey"))
-        self.meta_key = bool(payload.get("metaKey"))
-        self.shift_key = bool(payload.get("shiftKey"))
-        self.button = payload.get("button", 0)
-        self.client_x = payload.get("clientX", 0)
-        self.client_y = payload.get("clientY", 0)
+        self._payload = payload
         self._stopped = False
         self._default_prevented = False
 
+    def _field(self, name: str, default: Any = None) -> Any:
+        payload = self._payload
+        if name in payload:
+            value = payload[name]
+        else:
+            raw = kernel.current_event()
+            value = getattr(raw, name, None) if raw is not None else None
+        return default if value is None else value
+
+    @property
+    def key(self) -> Optional[str]:
+        """`KeyboardEvent.key`, or `None` for non-keyboard events."""
+        return self._field("key")
+
+    @property
+    def code(self) -> Optional[str]:
+        """`KeyboardEvent.code`, or `None`."""
+        return self._field("code")
+
+    @property
+    def alt_key(self) -> bool:
+        """Whether Alt was held."""
+        return bool(self._field("altKey"))
+
+    @property
+    def ctrl_key(self) -> bool:
+        """Whether Ctrl was held."""
+        return bool(self._field("ctrlKey"))
+
+    @property
+    def meta_key(self) -> bool:
+        """Whether Meta/Cmd was held."""
+        return bool(self._field("metaKey"))
+
+    @property
+    def shift_key(self) -> bool:
+        """Whether Shift was held."""
+        return bool(self._field("shiftKey"))
+
+    @property
+    def button(self) -> int:
+        """`MouseEvent.button` (0 for primary)."""
+        return self._field("button", 0)
+
+    @property
+    def client_x(self) -> Any:
+        """Pointer x position, when applicable."""
+        return self._field("clientX", 0)
+
+    @property
+    def client_y(self) -> Any:
+        """Pointer y position, when applicable."""
+        return self._field("clientY", 0)
+
+    def __getattr__(self, name: str) -> Any:
+        # Extra payload fields: `delta_y` -> `deltaY`.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        prop = _camel(name)
+        if prop in self._payload:
+            return self._payload[prop]
+        raw = kernel.current_event()
+        if raw is None:
+            raise AttributeError(name)
+        return getattr(raw, prop)
+
     @property
     def raw(self) -> Any:
         """The native browser event object (escape hatch).
@@ -219,10 +367,15 @@ def set_handler(node_id: int, event_prop_name: str, handler: Optional[Callable])
     if mapping is None:
         mapping = {}
         _handlers[node_id] = mapping
-    had_previous = event_type in mapping
+    previous = mapping.get(event_type)
     mapping[event_type] = handler
-    if not had_previous:
-        kernel.emit((kernel.OP_LISTEN, node_id, event_type))
+    flags = _listen_flags(handler)
+    if previous is None:
+        kernel.emit(
+            (kernel.OP_LISTEN, node_id, event_type, flags) if flags else (kernel.OP_LISTEN, node_id, event_type)
+        )
+    elif flags != _listen_flags(previous):
+        kernel.emit((kernel.OP_LISTEN, node_id, event_type, flags))
 
 
 def remove_handlers_for(node_id: int) -> None:
@@ -264,7 +417,57 @@ def dispatch_event(node_id: int, event_type: str, payload_json: str) -> int:
         handler(evt)
     except Exception as exc:
         log_error(f"Event handler for '{event_type}' raised: {exc}", exc)
-    kernel.commit()
+    kernel.request_commit()
+
+    flags = 0
+    if evt._stopped:
+        flags |= kernel.FLAG_STOP_PROPAGATION
+    if evt._default_prevented:
+        flags |= kernel.FLAG_PREVENT_DEFAULT
+    return flags
+
+
+def dispatch_path(node_ids: Any, event_type: str, payload_json: str) -> int:
+    """Run every matched handler of one native event in a single call.
+
+    The kernel's entry point under `kernel.set_event_dispatch_mode("path")`:
+    the native walk collects the matched node ids once, and Python walks
+    the handlers here, in one `batch` with one commit at the end.
+
+    Args:
+        node_ids: Matched node ids from the target outwards, as a
+            comma-separated string (from the JS kernel) or a list.
+        event_type: DOM event type (e.g., `"click"`).
+        payload_json: JSON-encoded payload built natively by the kernel.
+
+    Returns:
+        Flag bits for the kernel, accumulated over the handlers that ran:
+        bit 1 calls `stopPropagation`, bit 2 calls `preventDefault`.
+    """
+    ids = [int(part) for part in node_ids.split(",")] if isinstance(node_ids, str) else list(node_ids)
+    payload = json.loads(payload_json) if isinstance(payload_json, str) else dict(payload_json)
+
+    from .dom import Element
+
+    # One event object for the whole walk, like the native event.
+    evt = DomEvent(payload)
+
+    def run() -> None:
+        for node_id in ids:
+            mapping = _handlers.get(node_id)
+            handler = mapping.get(event_type) if mapping is not None else None
+            if handler is None:
+                continue
+            evt.current_target = Element(node_id=node_id)
+            try:
+                handler(evt)
+            except Exception as exc:
+                log_error(f"Event handler for '{event_type}' raised: {exc}", exc)
+            if evt._stopped:
+                break
+
+    batch(run)
+    kernel.request_commit()
 
     flags = 0
     if evt._stopped:
@@ -274,4 +477,4 @@ def dispatch_event(node_id: int, event_type: str, payload_json: str) -> int:
     return flags
 
 
-kernel.set_event_dispatcher(dispatch_event)
+kernel.set_event_dispatcher(dispatch_event, dispatch_path)
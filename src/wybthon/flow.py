@@ -44,7 +44,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from ._warnings import warn_each_plain_list
 from .reactivity import ReactiveProps
-from .vnode import Fragment, VNode, dynamic, h, is_getter, to_text_vnode
+from .vnode import LIST_DELTA_PROP, Fragment, VNode, dynamic, h, is_getter, to_text_vnode
 
 __all__ = ["Show", "For", "Index", "Switch", "Match", "Dynamic"]
 
@@ -194,7 +194,7 @@ _ShowComponent._wyb_component = True  # type: ignore[attr-defined]
 # ---------------------------------------------------------------------------
 
 
-def For(each: Any = None, children: Any = None, fallback: Any = None) -> VNode:
+def For(each: Any = None, children: Any = None, fallback: Any = None, key: Any = None) -> VNode:
     """Render a list of items using a per-item mapping function.
 
     ```python
@@ -210,19 +210,36 @@ def For(each: Any = None, children: Any = None, fallback: Any = None) -> VNode:
     callback runs **exactly once per unique item** (keyed by reference
     identity), and the rendered subtree is cached. When the list
     changes, unchanged rows keep their DOM untouched; the reconciler
-    only mounts additions, unmounts removals, and moves reordered rows.
+    only mounts additions, unmounts removals, and moves reordered rows,
+    applying the change set `map_array` recorded instead of re-diffing
+    the whole list (rows that render a fragment fall back to a full
+    diff).
     When an item leaves the list, its reactive scope (including any
     effects or cleanups created inside the callback) is disposed.
 
+    For data that is refetched as fresh objects, pass `key` so rows
+    match by key instead of identity; a surviving row then sees the new
+    object through `item()` and only the holes reading changed fields
+    update:
+
+    ```python
+    For(each=users, key="id",
+        children=lambda user, index: li(lambda: user()["name"]))
+    ```
+
     Args:
         each: List getter (typically a signal accessor) or plain list.
         children: A `(item_getter, index_getter) -> VNode` callable.
         fallback: Slot rendered when the list is empty.
+        key: Optional row key, a callable or an attribute/dict-key name;
+            see [`map_array`][wybthon.map_array]. Fixed at setup.
 
     Returns:
         A component [`VNode`][wybthon.VNode].
     """
-    return h(_ForComponent, {"each": each, "children": children, "fallback": fallback})
+    # Passed as `key_fn`: a `key` prop would become the VNode's own
+    # reconciliation key.
+    return h(_ForComponent, {"each": each, "children": children, "fallback": fallback, "key_fn": key})
 
 
 def _ForComponent(props: ReactiveProps) -> Any:
@@ -239,24 +256,43 @@ def _ForComponent(props: ReactiveProps) -> Any:
     # once keeps the per-row path allocation-free.
     children_fn = _normalize_children_callback(_rx.untrack(lambda: props.value("children")))
 
+    # `last` holds the row list and fragment of the previous render; once
+    # any row is itself a fragment (flattened by the reconciler), row
+    # positions no longer line up with DOM children and `flat` turns off
+    # the change-set path for good.
+    last: List[Any] = [None, None]
+    flat = [True]
+
     def map_row(item: Callable[[], Any], index: Callable[[], int]) -> VNode:
         if children_fn is None:
             return to_text_vnode("")
         vnode = _to_vnode(children_fn(item, index))
+        if vnode.tag == "_fragment":
+            flat[0] = False
         # Mounting happens later, inside the list's re-running render
         # effect; pin it to the row's owner so row-local effects survive
         # subsequent list updates.
         vnode.owner_scope = _rx._current_owner
         return vnode
 
-    rows = _rx.map_array(source, map_row)
+    mapper = _rx._ArrayMapper(source, map_row, _rx.untrack(lambda: props.value("key_fn")))
+    rows = _rx.create_memo(mapper.compute)
 
     def render() -> VNode:
         vnodes = rows()
         if not vnodes:
+            last[0] = last[1] = None
             fb = props.value("fallback")
             return _render_slot(fb) if fb is not None else to_text_vnode("")
-        return Fragment(*vnodes)
+        frag = Fragment(*vnodes)
+        delta = mapper.delta
+        mapper.delta = None
+        if flat[0] and delta is not None and delta.base is last[0] and last[1] is not None:
+            # Let the reconciler apply the change set against the fragment
+            # it is about to patch instead of diffing every row.
+            frag.props[LIST_DELTA_PROP] = (last[1], delta)
+        last[0], last[1] = vnodes, frag
+        return frag
 
     return dynamic(render)
 
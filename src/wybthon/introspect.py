@@ -0,0 +1,177 @@
+"""Ownership-tree introspection and leak detection.
+
+Every effect, memo, component context, and list-row scope is an
+[`Owner`][wybthon.Owner] that hangs off a parent until it is disposed.
+A root that is never disposed (a forgotten `create_root`, an effect
+created outside any owner) keeps its whole subtree alive. This module
+walks the live owner trees, counts nodes by kind, and diffs two
+snapshots so growth stands out:
+
+```python
+from wybthon import introspect
+
+before = introspect.snapshot()
+for _ in range(10):
+    open_dialog()
+    close_dialog()
+assert introspect.diff(before, introspect.snapshot()) == {}
+```
+
+Root discovery scans the garbage collector's live objects, so a
+snapshot costs time proportional to the Python heap; it is a debugging
+tool, not something to call per frame.
+"""
+
+from __future__ import annotations
+
+import gc
+import reprlib
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import reactivity as _rx
+from ._warnings import component_name
+
+__all__ = ["node_kind", "live_roots", "snapshot", "diff"]
+
+
+def _closure_var(fn: Any, qualname: str, name: str) -> Any:
+    """Return free variable `name` of `fn` if `fn` is the wybthon closure `qualname`."""
+    if getattr(fn, "__qualname__", None) != qualname or not getattr(fn, "__module__", "").startswith("wybthon."):
+        return None
+    code = fn.__code__
+    return fn.__closure__[code.co_freevars.index(name)].cell_contents
+
+
+def _hole_getter(fn: Any) -> Any:
+    """Return the getter a reactive hole's effect body re-evaluates, or `None`."""
+    return _closure_var(fn, "_hole_updater.<locals>.update", "getter")
+
+
+def _wrapped_fn(fn: Any) -> Any:
+    """Return the user function behind an effect body (unwrapping `prev`-arg effects)."""
+    inner = _closure_var(fn, "_create_effect_impl.<locals>.wrapped", "fn")
+    return inner if inner is not None else fn
+
+
+def node_kind(owner: Any) -> str:
+    """Classify an owner node.
+
+    Returns:
+        One of `"component"`, `"row"` (a `For`/`Index`, `map_array`, or
+        `index_array` row scope), `"hole"`, `"memo"`, `"computed"`,
+        `"render effect"`, `"effect"`, `"computation"`, or `"owner"`
+        (other plain scopes: `Show` branches, `create_root` and
+        `catch_error` scopes).
+    """
+    if isinstance(owner, _rx._ComponentContext):
+        return "component"
+    if isinstance(owner, _rx._RowOwner):
+        return "row"
+    if not isinstance(owner, _rx.Computation):
+        return "owner"
+    if owner._is_memo:
+        return "memo"
+    if _hole_getter(owner._fn) is not None:
+        return "hole"
+    if owner._is_pure:
+        return "computed"
+    if owner._is_render:
+        return "render effect"
+    if owner._is_effect:
+        return "effect"
+    return "computation"
+
+
+def live_roots() -> List[_rx.Owner]:
+    """Return every live, undisposed owner that has no parent.
+
+    Runs a full garbage collection first, so unreachable trees don't
+    count.
+    """
+    gc.collect()
+    return [obj for obj in gc.get_objects() if isinstance(obj, _rx.Owner) and obj._parent is None and not obj._disposed]
+
+
+def _describe(node: Any) -> str:
+    if isinstance(node, _rx.Signal):
+        return f"Signal({reprlib.repr(node._value)})"
+    fn = _wrapped_fn(node._fn)
+    return f"{node_kind(node)} {getattr(fn, '__qualname__', None) or component_name(fn)}"
+
+
+def snapshot(roots: Optional[Iterable[_rx.Owner]] = None, *, observer_threshold: int = 100) -> Dict[str, Any]:
+    """Count the nodes of the live owner trees.
+
+    Args:
+        roots: Owners to walk. Defaults to [`live_roots`][wybthon.introspect.live_roots].
+        observer_threshold: Signals and memos with at least this many
+            observers are listed under `"observed"`.
+
+    Returns:
+        A dict with:
+
+        - `roots`: how many roots were walked.
+        - `nodes`: `{kind: count}` over every owner in those trees (see
+          [`node_kind`][wybthon.introspect.node_kind]).
+        - `components`: `{component name: live instances}`.
+        - `signals`: how many `Signal` objects are alive.
+        - `observed`: `(description, observer count)` pairs for the
+          signals and memos at or over `observer_threshold`, largest
+          first.
+
+        The snapshot holds no references to graph nodes, so keeping it
+        around doesn't keep anything alive.
+    """
+    if roots is None:
+        roots = live_roots()
+    else:
+        gc.collect()
+    roots = list(roots)
+    nodes: Dict[str, int] = {}
+    components: Dict[str, int] = {}
+    stack: List[Any] = list(roots)
+    while stack:
+        owner = stack.pop()
+        kind = node_kind(owner)
+        nodes[kind] = nodes.get(kind, 0) + 1
+        if kind == "component":
+            vnode = owner._vnode
+            name = component_name(vnode.tag) if vnode is not None else "<component>"
+            components[name] = components.get(name, 0) + 1
+        if owner._children:
+            stack.extend(owner._children.values())
+
+    signals = 0
+    observed = []
+    for obj in gc.get_objects():
+        if isinstance(obj, _rx.Signal):
+            signals += 1
+        elif not (isinstance(obj, _rx.Computation) and obj._is_memo):
+            continue
+        count = len(obj._observers or ()) // 2
+        if count >= observer_threshold:
+            observed.append((_describe(obj), count))
+    observed.sort(key=lambda item: item[1], reverse=True)
+    return {"roots": len(roots), "nodes": nodes, "components": components, "signals": signals, "observed": observed}
+
+
+def diff(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, int]:
+    """Return what changed between two snapshots.
+
+    Keys are `"roots"`, `"signals"`, each node kind, and
+    `"component <name>"`; only nonzero changes are included, so an
+    empty dict means nothing grew or shrank.
+    """
+    changes: Dict[str, int] = {}
+
+    def compare(key: str, old: int, new: int) -> None:
+        if new != old:
+            changes[key] = new - old
+
+    compare("roots", before["roots"], after["roots"])
+    compare("signals", before["signals"], after["signals"])
+    for kind in sorted(set(before["nodes"]) | set(after["nodes"])):
+        compare(kind, before["nodes"].get(kind, 0), after["nodes"].get(kind, 0))
+    for name in sorted(set(before["components"]) | set(after["components"])):
+        compare(f"component {name}", before["components"].get(name, 0), after["components"].get(name, 0))
+    return changes
@@ -14,14 +14,26 @@ Core concepts:
 - **Node handles.** DOM nodes are referred to by integer ids allocated
   on the Python side. The kernel keeps an `id -> Node` registry, so no
   `JsProxy` objects flow through the hot path.
-- **Ops.** Each operation is a small tuple, `(opcode, ...args)`,
-  serialized as a JSON array. See the `OP_*` constants.
+- **Ops.** Each operation is a small tuple, `(opcode, ...args)`. See
+  the `OP_*` constants.
+- **Wire format.** By default a batch travels as one binary buffer: an
+  int32 opcode/id stream plus a side table of the batch's strings (see
+  [`encode_ops`][wybthon.kernel.encode_ops]). The JS kernel decodes it
+  in a tight loop without `JSON.parse`. The JSON encoding stays
+  available as a fallback via
+  [`set_wire_format`][wybthon.kernel.set_wire_format].
 - **Backends.** [`BrowserBackend`][wybthon.kernel.BrowserBackend]
   drives the real DOM through the embedded JS kernel.
   [`PythonBackend`][wybthon.kernel.PythonBackend] is a reference
   interpreter that applies the same ops to any DOM-like stub document;
   it backs the unit tests and the stubbed benchmark so both exercise
   the exact protocol the browser sees.
+- **Commit policy.** Renderer-driven commits (end of an effect flush,
+  end of an event handler) go through
+  [`request_commit`][wybthon.kernel.request_commit], which flushes
+  immediately by default or once per microtask / animation frame under
+  [`set_commit_policy`][wybthon.kernel.set_commit_policy]. Synchronous
+  DOM reads always commit first.
 - **Events.** Event delegation lives in the kernel: one native listener
   per event type walks the ancestor chain natively and calls into
   Python once per matched handler with a JSON payload. See
@@ -34,13 +46,27 @@ the reconciler, `wybthon.props`, and `wybthon.events`.
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Dict, List, Optional, Set
+import sys
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 __all__ = [
     "commit",
+    "release",
+    "request_commit",
+    "set_commit_policy",
+    "set_event_dispatch_mode",
+    "ManualDriver",
     "PythonBackend",
     "BrowserBackend",
     "set_backend",
+    "set_wire_format",
+    "set_optimize",
+    "optimize_ops",
+    "stats",
+    "reset_stats",
+    "encode_ops",
+    "decode_ops",
     "reset",
 ]
 
@@ -62,10 +88,20 @@ OP_SET_TEXT = 7  # [op, id, text]
 OP_SET_ATTR = 8  # [op, id, name, value_or_None]  (None removes)
 OP_SET_PROP = 9  # [op, id, name, value]  (DOM property assignment)
 OP_SET_STYLE = 10  # [op, id, {prop: value_or_None}]  (kebab-case, None removes)
-OP_LISTEN = 11  # [op, id, event_type]
+OP_LISTEN = 11  # [op, id, event_type, flags?]  (``LISTEN_*`` bits; omitted means 0)
 OP_UNLISTEN = 12  # [op, id, event_type]
 OP_RELEASE = 13  # [op, [ids...]]  (drop registry entries and listener sets)
 OP_REGISTER_TPL = 14  # [op, tpl_id, html]  (parse once; cloned by OP_CLONE_TPL)
+OP_REGISTER_STR = 15  # [op, name_id, text]  (binary wire only; see ``encode_ops``)
+# [op, first_id, per_count, tpl_id, n, parent_id, anchor_id_or_None, [text_offsets], [texts]]
+# Clone ``tpl_id`` n times into one dense id block (clone r owns ids
+# ``first_id + r * per_count ...``), set the text node at each offset from
+# ``texts`` (row-major, ``len(text_offsets)`` values per clone), and insert
+# every clone before the anchor in one go.
+OP_CLONE_TPL_BULK = 16
+OP_CLEAR = 17  # [op, parent_id]  (drop every child: ``textContent = ""``)
+OP_REMOVE_RANGE = 18  # [op, first_id, last_id]  (detach the sibling run first..last, inclusive)
+OP_EVENT_FIELDS = 19  # [op, schema_id, "field,field,..."]  (payload schema for LISTEN flags)
 
 # ---------------------------------------------------------------------------
 # Module state
@@ -78,12 +114,31 @@ _ops: List[Any] = []
 
 _next_id: int = 1
 
+# Recycled node ids. ``release`` files each run of consecutive released
+# ids here (single ids in ``_free_ids``, longer runs by length in
+# ``_free_runs``) and the allocators reuse them before growing
+# ``_next_id``, so the backends' array registries stay dense in apps that
+# create and clear lists all day.
+_free_ids: List[int] = []
+_free_runs: Dict[int, List[int]] = {}
+_free_count: int = 0
+
 # Registered template skeletons: html -> tpl_id. The backend parses each
 # skeleton once (OP_REGISTER_TPL) and clones it per mount (OP_CLONE_TPL).
 # Bounded by the number of distinct static skeletons in the app.
 _tpl_ids: Dict[str, int] = {}
 _next_tpl_id: int = 1
 
+# Registered event payload schemas: comma-joined field list -> schema id.
+# ``LISTEN`` flags carry the id above ``LISTEN_SCHEMA_SHIFT``; 0 selects the
+# event type's default fields. Cleared with the backend, like templates.
+_schema_ids: Dict[str, int] = {}
+
+# Interned names (tags, attribute names, event types, ...): text -> name
+# id. Mirrors the active backend's table, so it is cleared whenever the
+# backend changes.
+_name_ids: Dict[str, int] = {}
+
 _backend: Optional[Any] = None
 
 # Dispatcher installed by ``wybthon.events`` (kernel can't import events;
@@ -92,26 +147,162 @@ _backend: Optional[Any] = None
 # ``preventDefault``.
 _event_dispatcher: Optional[Callable[[int, str, str], int]] = None
 
+# Path dispatcher, also installed by ``wybthon.events``. Signature:
+# ``(node_ids, event_type, payload_json) -> int flags``, where ``node_ids``
+# lists every matched node from the target outwards (a comma-separated
+# string from the JS kernel). Used under the ``"path"`` dispatch mode.
+_path_dispatcher: Optional[Callable[[Any, str, str], int]] = None
+
+# ``"node"`` (default) calls ``_event_dispatcher`` once per matched node;
+# ``"path"`` calls ``_path_dispatcher`` once per native event.
+_dispatch_mode: str = "node"
+
 FLAG_STOP_PROPAGATION = 1
 FLAG_PREVENT_DEFAULT = 2
 
+# ``OP_LISTEN`` flag bits. A coalesced listener keeps only the latest
+# payload per (node, type) and is dispatched once per animation frame; a
+# passive one lets the root listener be registered ``{passive: true}``
+# (kept only while every listener of that type is passive; the root goes
+# back to passive when the last non-passive listener leaves).
+LISTEN_COALESCE = 1
+LISTEN_PASSIVE = 2
+LISTEN_SCHEMA_SHIFT = 8
+
+# Payload fields built for a listener without its own schema, by event
+# type. Names are DOM property names: plain ones read the event, `value`
+# and `checked` read the target, and `target.<prop>` reads any target
+# property. `type` and `targetId` are always sent. Types missing here get
+# ``_FULL_EVENT_FIELDS``. Shared with the JS kernel (see ``_KERNEL_JS``).
+_MODIFIER_FIELDS = ("altKey", "ctrlKey", "metaKey", "shiftKey")
+_POINTER_FIELDS = ("button", "clientX", "clientY") + _MODIFIER_FIELDS
+_FULL_EVENT_FIELDS = ("value", "checked", "key", "code") + _POINTER_FIELDS
+_PRESS_FIELDS = _POINTER_FIELDS + ("value", "checked")
+_MOVE_FIELDS = _POINTER_FIELDS
+_KEY_FIELDS = ("key", "code") + _MODIFIER_FIELDS + ("value",)
+_FORM_FIELDS = ("value", "checked")
+DEFAULT_EVENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    **dict.fromkeys(("click", "dblclick", "contextmenu", "mousedown", "mouseup"), _PRESS_FIELDS),
+    **dict.fromkeys(("pointerdown", "pointerup", "pointercancel"), _PRESS_FIELDS),
+    **dict.fromkeys(("mousemove", "mouseover", "mouseout", "pointermove", "pointerover", "pointerout"), _MOVE_FIELDS),
+    "wheel": _MOVE_FIELDS + ("deltaX", "deltaY"),
+    **dict.fromkeys(("keydown", "keyup", "keypress"), _KEY_FIELDS),
+    **dict.fromkeys(("input", "change", "beforeinput"), _FORM_FIELDS),
+    **dict.fromkeys(("submit", "reset", "focusin", "focusout", "scroll"), ()),
+}
+# Values `PythonBackend` reports for fields the simulated event lacks.
+_EVENT_FIELD_DEFAULTS: Dict[str, Any] = {
+    **dict.fromkeys(_MODIFIER_FIELDS, False),
+    **dict.fromkeys(("button", "clientX", "clientY", "deltaX", "deltaY"), 0),
+}
+
+# Wire format used by ``commit``: ``"binary"`` (default) hands backends one
+# buffer from ``encode_ops``; ``"json"`` hands them the op list as-is and
+# lets the backend serialize it. Backends without ``apply_binary`` always
+# receive the op list.
+_wire_format: str = "binary"
+
+# Whether ``commit`` runs ``optimize_ops`` over each batch (opt-in).
+_optimize: bool = False
+
+# Commit policy used by ``request_commit``: ``"sync"`` (default) commits
+# immediately; ``"microtask"`` and ``"frame"`` hand one deferred commit at
+# a time to ``_driver`` and let ops accumulate until it fires.
+_commit_policy: str = "sync"
+_driver: Optional[Any] = None
+_commit_scheduled: bool = False
+
+# Commit counters reported by ``stats``.
+_stats: Dict[str, int] = {"commits": 0, "ops_emitted": 0, "ops_eliminated": 0}
+
 
 def alloc_id() -> int:
-    """Allocate one fresh node id."""
-    global _next_id
+    """Allocate one node id, reusing a released one when available."""
+    global _next_id, _free_count
+    if _free_ids:
+        _free_count -= 1
+        return _free_ids.pop()
+    if _free_runs:
+        return _take_run(1)
     nid = _next_id
     _next_id = nid + 1
     return nid
 
 
 def alloc_ids(count: int) -> int:
-    """Allocate a dense block of `count` ids; returns the first id."""
+    """Allocate a dense block of `count` ids; returns the first id.
+
+    A released run at least `count` long is reused (and split) before
+    the id space grows.
+    """
     global _next_id
+    if count > 1 and _free_runs:
+        first = _take_run(count)
+        if first:
+            return first
+    elif count == 1:
+        return alloc_id()
     first = _next_id
     _next_id = first + count
     return first
 
 
+def _take_run(count: int) -> int:
+    """Pop a free run of at least `count` ids; returns 0 when none fits."""
+    global _free_count
+    length = count
+    firsts = _free_runs.get(count)
+    if firsts is None:
+        # Distinct run lengths are few; first fit is good enough.
+        for length in _free_runs:
+            if length > count:
+                break
+        else:
+            return 0
+        firsts = _free_runs[length]
+    first = firsts.pop()
+    if not firsts:
+        del _free_runs[length]
+    _free_count -= count
+    if length > count:
+        _file_run(first + count, length - count)
+    return first
+
+
+def _file_run(first: int, length: int) -> None:
+    if length == 1:
+        _free_ids.append(first)
+    else:
+        _free_runs.setdefault(length, []).append(first)
+
+
+def release(ids: List[int]) -> None:
+    """Queue an `OP_RELEASE` for `ids` and recycle them for later allocations.
+
+    Callers must not touch the ids afterwards: the next `alloc_id` may
+    hand any of them to a new node (in the same batch, after the release
+    op, which both backends apply in order).
+    """
+    global _free_count
+    if not ids:
+        return
+    _ops.append((OP_RELEASE, ids))
+    ordered = sorted(ids)
+    start = prev = ordered[0]
+    for nid in ordered[1:]:
+        if nid == prev + 1:
+            prev = nid
+            continue
+        if nid == prev:
+            # Defensive: a duplicate id must not be handed out twice.
+            continue
+        _file_run(start, prev - start + 1)
+        _free_count += prev - start + 1
+        start = prev = nid
+    _file_run(start, prev - start + 1)
+    _free_count += prev - start + 1
+
+
 def template_id(html: str) -> int:
     """Return the template id for `html`, registering it on first use.
 
@@ -128,6 +319,21 @@ def template_id(html: str) -> int:
     return tid
 
 
+def event_schema_id(fields: Tuple[str, ...]) -> int:
+    """Return the payload schema id for `fields`, registering it on first use.
+
+    Like `template_id`, the `OP_EVENT_FIELDS` registration rides the
+    batch of the `LISTEN` that needs it.
+    """
+    key = ",".join(fields)
+    sid = _schema_ids.get(key)
+    if sid is None:
+        sid = len(_schema_ids) + 1
+        _schema_ids[key] = sid
+        _ops.append((OP_EVENT_FIELDS, sid, key))
+    return sid
+
+
 def emit(op: Any) -> None:
     """Queue one op tuple for the next commit."""
     _ops.append(op)
@@ -145,7 +351,44 @@ def commit() -> None:
     backend = _backend if _backend is not None else _ensure_backend()
     ops = list(_ops)
     _ops.clear()
-    backend.apply(ops)
+    _stats["commits"] += 1
+    _stats["ops_emitted"] += len(ops)
+    if _optimize:
+        count = len(ops)
+        ops = optimize_ops(ops)
+        _stats["ops_eliminated"] += count - len(ops)
+        if not ops:
+            return
+    if _wire_format == "binary" and hasattr(backend, "apply_binary"):
+        backend.apply_binary(encode_ops(ops, _name_ids))
+    else:
+        backend.apply(ops)
+
+
+def request_commit() -> None:
+    """Commit now, or schedule one commit under a deferred policy.
+
+    The renderer calls this at the end of every effect flush and event
+    handler. Under the default `"sync"` policy it is `commit()`; under
+    `"microtask"` or `"frame"` the ops stay buffered and a single commit
+    is scheduled on the policy's driver, however many flushes happen
+    before it fires.
+    """
+    global _commit_scheduled
+    if _commit_policy == "sync":
+        commit()
+        return
+    if _commit_scheduled or not _ops:
+        return
+    _commit_scheduled = True
+    assert _driver is not None
+    _driver.schedule(_scheduled_commit)
+
+
+def _scheduled_commit() -> None:
+    global _commit_scheduled
+    _commit_scheduled = False
+    commit()
 
 
 def get_node(node_id: int) -> Any:
@@ -194,35 +437,216 @@ def current_event() -> Any:
     return _backend.current_event()
 
 
-def set_event_dispatcher(fn: Callable[[int, str, str], int]) -> None:
-    """Install the Python-side event dispatcher (called by `wybthon.events`)."""
-    global _event_dispatcher
+def set_event_dispatcher(
+    fn: Callable[[int, str, str], int], path_fn: Optional[Callable[[Any, str, str], int]] = None
+) -> None:
+    """Install the Python-side event dispatchers (called by `wybthon.events`)."""
+    global _event_dispatcher, _path_dispatcher
     _event_dispatcher = fn
+    _path_dispatcher = path_fn
+    if _backend is not None:
+        _backend.set_dispatcher(fn, path_fn)
+
+
+def set_event_dispatch_mode(mode: str) -> None:
+    """Choose how native events cross into Python.
+
+    Args:
+        mode: `"node"` (default) calls Python once per node with a
+            matching handler as the event bubbles. `"path"` collects the
+            matched node ids natively and calls Python once per event;
+            the handlers then run in one `batch` with a single commit,
+            and the returned flags still drive `preventDefault` and
+            `stopPropagation` on the native event.
+
+    Raises:
+        ValueError: If `mode` is not a known dispatch mode.
+    """
+    global _dispatch_mode
+    if mode not in ("node", "path"):
+        raise ValueError('event dispatch mode must be "node" or "path"')
+    _dispatch_mode = mode
     if _backend is not None:
-        _backend.set_dispatcher(fn)
+        _backend.set_dispatch_mode(mode)
+
+
+def set_wire_format(fmt: str) -> None:
+    """Choose how `commit` ships op batches to the backend.
+
+    Args:
+        fmt: `"binary"` (default) encodes each batch into one buffer
+            with [`encode_ops`][wybthon.kernel.encode_ops]; `"json"`
+            falls back to the JSON array encoding.
+
+    Raises:
+        ValueError: If `fmt` is not a known wire format.
+    """
+    global _wire_format
+    if fmt not in ("binary", "json"):
+        raise ValueError('wire format must be "binary" or "json"')
+    _wire_format = fmt
+
+
+def set_optimize(enabled: bool) -> None:
+    """Enable or disable the peephole optimizer run by `commit`.
+
+    When enabled, every batch goes through
+    [`optimize_ops`][wybthon.kernel.optimize_ops] before it is encoded.
+    The savings show up in [`stats`][wybthon.kernel.stats] as
+    `ops_eliminated`.
+    """
+    global _optimize
+    _optimize = bool(enabled)
+
+
+def set_commit_policy(policy: str, driver: Optional[Any] = None) -> None:
+    """Choose when renderer-driven commits reach the backend.
+
+    Args:
+        policy: `"sync"` (default) commits at the end of every effect
+            flush and event handler. `"microtask"` and `"frame"` let ops
+            accumulate and flush them once per microtask or animation
+            frame. Reads (`get_node`, `query`, and `Element` queries)
+            still commit immediately under every policy.
+        driver: Object with a `schedule(fn)` method that calls `fn` once
+            later. Defaults to `queueMicrotask` / `requestAnimationFrame`
+            in the browser; tests pass a
+            [`ManualDriver`][wybthon.kernel.ManualDriver].
+
+    Raises:
+        ValueError: If `policy` is not a known commit policy.
+    """
+    global _commit_policy, _driver, _commit_scheduled
+    if policy not in ("sync", "microtask", "frame"):
+        raise ValueError('commit policy must be "sync", "microtask", or "frame"')
+    # Anything buffered under the old policy goes out before switching.
+    commit()
+    _commit_policy = policy
+    _driver = None if policy == "sync" else (driver if driver is not None else _BrowserDriver(policy))
+    _commit_scheduled = False
+
+
+class ManualDriver:
+    """Deterministic commit driver with a fake clock, for tests.
+
+    Scheduled callbacks run only when [`tick`][wybthon.kernel.ManualDriver.tick]
+    is called, which also advances `now()` by one frame.
+
+    Args:
+        frame_ms: Milliseconds each `tick` adds to the clock.
+    """
+
+    def __init__(self, frame_ms: float = 16.0) -> None:
+        self.frame_ms = frame_ms
+        self.frames = 0
+        self._now = 0.0
+        self._pending: List[Callable[[], None]] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of callbacks waiting for the next `tick`."""
+        return len(self._pending)
+
+    def schedule(self, fn: Callable[[], None]) -> None:
+        """Queue `fn` for the next `tick`."""
+        self._pending.append(fn)
+
+    def now(self) -> float:
+        """Return the fake clock in milliseconds."""
+        return self._now
+
+    def tick(self) -> None:
+        """Advance one frame and run the callbacks queued before it."""
+        pending = self._pending
+        self._pending = []
+        self._now += self.frame_ms
+        self.frames += 1
+        for fn in pending:
+            fn()
+
+
+class _BrowserDriver:
+    """Schedules callbacks with `queueMicrotask` or `requestAnimationFrame`."""
+
+    def __init__(self, policy: str) -> None:
+        self._policy = policy
+
+    def schedule(self, fn: Callable[[], None]) -> None:
+        import js
+        from pyodide.ffi import create_once_callable
+
+        if self._policy == "frame":
+            js.requestAnimationFrame(create_once_callable(lambda _ts: fn()))
+        else:
+            js.queueMicrotask(create_once_callable(fn))
+
+
+def stats() -> Dict[str, int]:
+    """Return a snapshot of the commit counters and the id registry gauges.
+
+    Returns:
+        A dict with `commits` (non-empty batches flushed), `ops_emitted`
+        (ops queued by the renderer), `ops_eliminated` (ops dropped by
+        the optimizer before reaching the backend), plus `live_nodes`
+        (ids allocated and not released), `free_slots` (released ids
+        waiting for reuse), and `high_water` (the largest id ever
+        handed out, i.e. the backends' registry size).
+    """
+    snapshot = dict(_stats)
+    high_water = _next_id - 1
+    snapshot["live_nodes"] = high_water - _free_count
+    snapshot["free_slots"] = _free_count
+    snapshot["high_water"] = high_water
+    return snapshot
+
+
+def reset_stats() -> None:
+    """Zero the counters reported by [`stats`][wybthon.kernel.stats].
+
+    The registry gauges describe live state and are left alone.
+    """
+    for key in _stats:
+        _stats[key] = 0
 
 
 def set_backend(backend: Any) -> None:
     """Install a rendering backend (tests pass a `PythonBackend`).
 
-    Clears the template registry: a fresh backend has no registered
-    skeletons, so they must be re-sent on next use.
+    Clears the template registry, the event schema registry, and the name
+    intern table: a fresh backend has no registered skeletons, schemas,
+    or names, so they must be re-sent on next use.
     """
     global _backend
     _backend = backend
     _tpl_ids.clear()
+    _name_ids.clear()
+    _schema_ids.clear()
     if _event_dispatcher is not None:
-        backend.set_dispatcher(_event_dispatcher)
+        backend.set_dispatcher(_event_dispatcher, _path_dispatcher)
+    backend.set_dispatch_mode(_dispatch_mode)
 
 
 def reset(backend: Optional[Any] = None) -> None:
     """Test helper: clear the op buffer, id counters, and template registry."""
-    global _next_id, _next_tpl_id, _backend
+    global _next_id, _next_tpl_id, _backend, _wire_format, _optimize
+    global _commit_policy, _driver, _commit_scheduled, _free_count, _dispatch_mode
     _ops.clear()
     _next_id = 1
+    _free_ids.clear()
+    _free_runs.clear()
+    _free_count = 0
     _next_tpl_id = 1
     _tpl_ids.clear()
+    _name_ids.clear()
+    _schema_ids.clear()
     _backend = None
+    _wire_format = "binary"
+    _optimize = False
+    _commit_policy = "sync"
+    _driver = None
+    _commit_scheduled = False
+    _dispatch_mode = "node"
+    reset_stats()
     if backend is not None:
         set_backend(backend)
 
@@ -242,29 +666,594 @@ def _ensure_backend() -> Any:
     return _backend
 
 
+# ---------------------------------------------------------------------------
+# Peephole optimizer
+#
+# Two passes over one batch, both semantics-preserving for the final DOM:
+#
+# 1. Lifecycle elimination. A node created in the batch (CREATE_* or one
+#    CLONE_TPL block) and RELEASEd before it ends never reaches the screen,
+#    so its creation, inserts, removes, writes, and listener ops can all be
+#    dropped. A candidate is kept ("pinned") when a surviving op still needs
+#    it: it parents or anchors a surviving node, or it is still attached to
+#    a surviving parent when released. Pins propagate to a fixpoint; clone
+#    blocks live or die as a unit. Ids are tracked per incarnation, so an
+#    id released and re-created in the same batch is two separate nodes.
+# 2. Last-write-wins. Repeated SET_TEXT, SET_ATTR, and SET_PROP writes to
+#    the same target keep only the final one (a CREATE_TEXT absorbs later
+#    SET_TEXTs), and SET_STYLE decls for one node merge into a single op.
+#    An attribute and a property of the same name order against each
+#    other, as do SET_STYLE and a SET_ATTR of ``style``.
+# ---------------------------------------------------------------------------
+
+
+class _Life:
+    """One incarnation of a node created inside the batch being optimized."""
+
+    __slots__ = ("released", "pinned", "parent", "block")
+
+    def __init__(self, block: Optional[List["_Life"]] = None) -> None:
+        self.released = False
+        self.pinned = False
+        # None (detached), _ATTACHED_LIVE (under a node from before the
+        # batch), or the _Life of a parent created in the batch.
+        self.parent: Any = None
+        self.block = block
+
+    def pin(self) -> None:
+        if self.block is None:
+            self.pinned = True
+        else:
+            for life in self.block:
+                life.pinned = True
+
+
+_ATTACHED_LIVE = object()
+
+
+def optimize_ops(ops: List[Any]) -> List[Any]:
+    """Return an equivalent, usually shorter, op batch.
+
+    Applying the result leaves the DOM, the node registry, and the
+    listener bookkeeping in the same final state as applying `ops`.
+
+    Args:
+        ops: One batch of op tuples, in emission order.
+
+    Returns:
+        A new list; `ops` is not modified.
+    """
+    survivors = _drop_dead_lifecycles(ops)
+    return _collapse_writes(survivors)
+
+
+def _drop_dead_lifecycles(ops: List[Any]) -> List[Any]:
+    born: Dict[int, _Life] = {}
+    lives: List[_Life] = []
+    # Per op index: (subject life or None, dependency lives) for ops that
+    # touch batch-created nodes; RELEASE ops map to their per-id lives.
+    refs: Dict[int, Any] = {}
+    releases: Dict[int, List[Optional[_Life]]] = {}
+
+    for i, op in enumerate(ops):
+        code = op[0]
+        if code == OP_CREATE_ELEMENT or code == OP_CREATE_TEXT or code == OP_CREATE_COMMENT:
+            life = _Life()
+            born[op[1]] = life
+            lives.append(life)
+            refs[i] = (life, ())
+        elif code == OP_CLONE_TPL:
+            block: List[_Life] = []
+            first = op[1]
+            for k in range(op[2]):
+                life = _Life(block)
+                block.append(life)
+                born[first + k] = life
+            root = block[0] if block else None
+            for life in block[1:]:
+                life.parent = root
+            lives.extend(block)
+            refs[i] = (root, ())
+        elif code == OP_CLONE_TPL_BULK:
+            # Bulk clones are inserted at once; they're never elimination
+            # candidates, but they keep their parent and anchor alive.
+            anchor = None if op[6] is None else born.get(op[6])
+            refs[i] = (None, (born.get(op[5]), anchor))
+        elif code == OP_CLEAR or code == OP_REMOVE_RANGE:
+            # Detaches nodes the pass doesn't track by id; always kept.
+            refs[i] = (None, tuple(born.get(node_id) for node_id in op[1:]))
+        elif code == OP_INSERT:
+            child = born.get(op[2])
+            parent = born.get(op[1])
+            anchor = None if op[3] is None else born.get(op[3])
+            if child is not None:
+                child.parent = parent if parent is not None else _ATTACHED_LIVE
+            if child is not None or parent is not None or anchor is not None:
+                refs[i] = (child, (parent, anchor))
+        elif code == OP_RELEASE:
+            per_id: List[Optional[_Life]] = []
+            for node_id in op[1]:
+                life = born.pop(node_id, None)
+                if life is not None:
+                    life.released = True
+                per_id.append(life)
+            releases[i] = per_id
+        elif code == OP_REGISTER_TPL or code == OP_EVENT_FIELDS:
+            continue
+        else:
+            life = born.get(op[1])
+            if life is not None:
+                if code == OP_REMOVE:
+                    life.parent = None
+                refs[i] = (life, ())
+
+    candidates = [life for life in lives if life.released]
+    if not candidates:
+        return ops
+    for life in lives:
+        if not life.released:
+            life.pinned = True
+
+    changed = True
+    while changed:
+        changed = False
+        for subject, deps in refs.values():
+            if subject is None or subject.pinned:
+                for dep in deps:
+                    if dep is not None and not dep.pinned:
+                        dep.pin()
+                        changed = True
+        for life in candidates:
+            if life.pinned:
+                continue
+            parent = life.parent
+            if parent is _ATTACHED_LIVE or (parent is not None and parent.pinned):
+                life.pin()
+                changed = True
+
+    out: List[Any] = []
+    for i, op in enumerate(ops):
+        per_id = releases.get(i)
+        if per_id is not None:
+            ids = [nid for nid, life in zip(op[1], per_id) if life is None or life.pinned]
+            if ids:
+                out.append(op if len(ids) == len(per_id) else (OP_RELEASE, ids))
+            continue
+        ref = refs.get(i)
+        if ref is not None and ref[0] is not None and not ref[0].pinned:
+            continue
+        out.append(op)
+    return out
+
+
+def _collapse_writes(ops: List[Any]) -> List[Any]:
+    out: List[Any] = []
+    text_at: Dict[int, int] = {}
+    attr_at: Dict[Any, int] = {}
+    prop_at: Dict[Any, int] = {}
+    style_at: Dict[int, int] = {}
+    dropped = 0
+
+    for op in ops:
+        code = op[0]
+        if code == OP_SET_TEXT:
+            node_id = op[1]
+            j = text_at.get(node_id)
+            if j is not None:
+                prev = out[j]
+                if prev[0] == OP_CREATE_TEXT:
+                    out[j] = (OP_CREATE_TEXT, node_id, op[2])
+                    dropped += 1
+                    continue
+                out[j] = None
+                dropped += 1
+            text_at[node_id] = len(out)
+        elif code == OP_CREATE_TEXT:
+            text_at[op[1]] = len(out)
+        elif code == OP_SET_ATTR or code == OP_SET_PROP:
+            key = (op[1], op[2])
+            if code == OP_SET_ATTR:
+                same, other = attr_at, prop_at
+                if op[2] == "style":
+                    style_at.pop(op[1], None)
+            else:
+                same, other = prop_at, attr_at
+            j = same.get(key)
+            if j is not None:
+                out[j] = None
+                dropped += 1
+            other.pop(key, None)
+            same[key] = len(out)
+        elif code == OP_SET_STYLE:
+            node_id = op[1]
+            j = style_at.get(node_id)
+            if j is not None:
+                merged = dict(out[j][2])
+                merged.update(op[2])
+                op = (OP_SET_STYLE, node_id, merged)
+                out[j] = None
+                dropped += 1
+            style_at[node_id] = len(out)
+            key = (node_id, "style")
+            attr_at.pop(key, None)
+        elif code == OP_RELEASE:
+            for node_id in op[1]:
+                text_at.pop(node_id, None)
+                style_at.pop(node_id, None)
+            if attr_at or prop_at:
+                released = set(op[1])
+                for table in (attr_at, prop_at):
+                    for key in [k for k in table if k[0] in released]:
+                        del table[key]
+        out.append(op)
+
+    if not dropped:
+        return out
+    return [op for op in out if op is not None]
+
+
+# ---------------------------------------------------------------------------
+# Binary wire format
+#
+# One batch is one little-endian buffer:
+#
+#     int32 header  [WIRE_VERSION, n_ints, n_strings]
+#     int32 stream  n_ints words: opcode followed by its operands
+#     int32 lengths n_strings words: UTF-16 length of each string
+#     utf-8 blob    every string of the batch, concatenated
+#
+# Node ids, template ids, and counts travel inline. Strings are replaced
+# by their index into the batch's string table (deduplicated, so a text
+# repeated across a 1,000-row mount is sent once). The lengths are UTF-16
+# code units so the JS side can decode the blob once and slice it without
+# re-measuring. Optional operands use sentinels: a ``None`` anchor is
+# ``0`` (ids start at 1) and a ``None`` string is ``-1``.
+#
+# Names (tags, attribute and property names, style keys, event types) are
+# interned across batches: the first use of a name sends
+# ``REGISTER_STR name_id, s(text)`` and every later op refers to the
+# persistent ``name_id``. Names past ``MAX_INTERNED_NAMES`` fall back to
+# the batch table, encoded as ``-2 - s``. Per-op layout (``s`` = string
+# index, ``n`` = name reference):
+#
+#     CREATE_ELEMENT  id, n(tag)          SET_PROP   id, n(name), vtag, v
+#     CREATE_TEXT     id, s(text)         SET_STYLE  id, k, k * (n(key), s(value))
+#     CREATE_COMMENT  id                  LISTEN     id, n(type), flags
+#     CLONE_TPL       first, count, tpl   UNLISTEN   id, n(type)
+#     INSERT          parent, id, anchor  RELEASE    k, k * id
+#     REMOVE          id                  REGISTER_TPL tpl, s(html)
+#     SET_TEXT        id, s(text)         REGISTER_STR name_id, s(text)
+#     SET_ATTR        id, n(name), s(value)
+#     CLONE_TPL_BULK  first, per, tpl, count, parent, anchor, m, m * offset,
+#                     count * m * s(text)
+#     CLEAR           parent              REMOVE_RANGE first, last
+#     EVENT_FIELDS    schema, s(fields)
+#
+# ``SET_PROP`` values carry a type tag (``VAL_*``) since DOM properties can
+# be strings, booleans, or numbers.
+# ---------------------------------------------------------------------------
+
+WIRE_VERSION = 1
+
+# Upper bound on the persistent name table; keeps apps that generate
+# attribute names (``data-*`` keys, custom properties) from growing it
+# without limit.
+MAX_INTERNED_NAMES = 4096
+
+VAL_NULL = 0
+VAL_STR = 1  # operand: string index
+VAL_FALSE = 2
+VAL_TRUE = 3
+VAL_INT = 4  # operand: the int32 itself
+VAL_JSON = 5  # operand: string index of the JSON text (floats, big ints, ...)
+
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+def _utf16_len(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def encode_ops(ops: List[Any], names: Optional[Dict[str, int]] = None) -> bytes:
+    """Encode an op batch into the binary wire format.
+
+    Args:
+        ops: Op tuples as queued by `emit`.
+        names: Persistent intern table (`text -> name id`) shared with
+            the receiving backend. Names seen for the first time are
+            added to it and announced with an `OP_REGISTER_STR` in the
+            stream. When `None`, names travel in the batch string table.
+
+    Returns:
+        One buffer holding the int32 stream and the batch's string table.
+
+    Raises:
+        ValueError: If an op has an unknown opcode.
+    """
+    ints: List[int] = []
+    push = ints.append
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+
+    def sid(text: str) -> int:
+        i = index.get(text)
+        if i is None:
+            i = index[text] = len(strings)
+            strings.append(text)
+        return i
+
+    def nid(text: str) -> int:
+        if names is not None:
+            n = names.get(text)
+            if n is not None:
+                return n
+            if len(names) < MAX_INTERNED_NAMES:
+                n = names[text] = len(names)
+                ints.extend((OP_REGISTER_STR, n, sid(text)))
+                return n
+        return -2 - sid(text)
+
+    for op in ops:
+        code = op[0]
+        if code == OP_INSERT:
+            anchor = op[3]
+            ints += (code, op[1], op[2], 0 if anchor is None else anchor)
+        elif code == OP_SET_TEXT or code == OP_CREATE_TEXT:
+            text = op[2]
+            i = index.get(text)
+            if i is None:
+                i = index[text] = len(strings)
+                strings.append(text)
+            ints += (code, op[1], i)
+        elif code == OP_CLONE_TPL:
+            ints += (code, op[1], op[2], op[3])
+        elif code == OP_SET_ATTR:
+            value = op[3]
+            name = nid(op[2])
+            ints += (code, op[1], name, -1 if value is None else sid(value))
+        elif code == OP_REMOVE or code == OP_CREATE_COMMENT or code == OP_CLEAR:
+            push(code)
+            push(op[1])
+        elif code == OP_REMOVE_RANGE:
+            ints += (code, op[1], op[2])
+        elif code == OP_CREATE_ELEMENT or code == OP_UNLISTEN:
+            name = nid(op[2])
+            ints += (code, op[1], name)
+        elif code == OP_LISTEN:
+            name = nid(op[2])
+            ints += (code, op[1], name, op[3] if len(op) > 3 else 0)
+        elif code == OP_RELEASE:
+            ids = op[1]
+            push(code)
+            push(len(ids))
+            ints += ids
+        elif code == OP_SET_STYLE:
+            pairs = [(nid(key), -1 if value is None else sid(value)) for key, value in op[2].items()]
+            ints += (code, op[1], len(pairs))
+            for pair in pairs:
+                ints += pair
+        elif code == OP_SET_PROP:
+            name = nid(op[2])
+            ints += (code, op[1], name)
+            value = op[3]
+            if value is None:
+                ints += (VAL_NULL, 0)
+            elif value is True:
+                ints += (VAL_TRUE, 0)
+            elif value is False:
+                ints += (VAL_FALSE, 0)
+            elif isinstance(value, str):
+                ints += (VAL_STR, sid(value))
+            elif type(value) is int and _INT32_MIN <= value <= _INT32_MAX:
+                ints += (VAL_INT, value)
+            else:
+                ints += (VAL_JSON, sid(json.dumps(value, separators=(",", ":"), ensure_ascii=False)))
+        elif code == OP_REGISTER_TPL or code == OP_EVENT_FIELDS:
+            ints += (code, op[1], sid(op[2]))
+        elif code == OP_CLONE_TPL_BULK:
+            anchor = op[6]
+            offsets = op[7]
+            ints += (code, op[1], op[2], op[3], op[4], op[5], 0 if anchor is None else anchor, len(offsets))
+            ints += offsets
+            for text in op[8]:
+                i = index.get(text)
+                if i is None:
+                    i = index[text] = len(strings)
+                    strings.append(text)
+                push(i)
+        else:
+            raise ValueError(f"wybthon kernel: unknown op {code}")
+
+    words = array("i", (WIRE_VERSION, len(ints), len(strings)))
+    words.extend(ints)
+    words.extend([_utf16_len(t) for t in strings])
+    if _SWAP_BYTES:
+        words.byteswap()
+    return words.tobytes() + "".join(strings).encode("utf-8")
+
+
+def decode_ops(buf: bytes, names: Optional[List[str]] = None) -> List[Any]:
+    """Decode a buffer produced by [`encode_ops`][wybthon.kernel.encode_ops].
+
+    Args:
+        buf: The encoded batch.
+        names: The receiving side's persistent intern table (`name id ->
+            text`), extended in place by `OP_REGISTER_STR` entries. Pass
+            the same list for every batch from one encoder table.
+
+    Returns:
+        Op tuples equal to the ones that were encoded (`SET_STYLE` decls
+        come back as a dict, `RELEASE` ids as a list). Interning is
+        transparent: no `OP_REGISTER_STR` tuples are returned.
+
+    Raises:
+        ValueError: On a version mismatch or an unknown opcode.
+    """
+    header = array("i")
+    header.frombytes(bytes(buf[:12]))
+    if _SWAP_BYTES:
+        header.byteswap()
+    version, n_ints, n_strings = header
+    if version != WIRE_VERSION:
+        raise ValueError(f"wybthon kernel: unsupported wire version {version}")
+    body_end = 12 + 4 * (n_ints + n_strings)
+    words = array("i")
+    words.frombytes(bytes(buf[12:body_end]))
+    if _SWAP_BYTES:
+        words.byteswap()
+    ints = words[:n_ints]
+    lengths = words[n_ints:]
+    blob = bytes(buf[body_end:]).decode("utf-8")
+
+    strings: List[str] = []
+    if sum(lengths) == len(blob):
+        pos = 0
+        for n in lengths:
+            strings.append(blob[pos : pos + n])
+            pos += n
+    else:
+        # Astral characters count twice in UTF-16; slice the UTF-16 form.
+        wide = blob.encode("utf-16-le")
+        pos = 0
+        for n in lengths:
+            strings.append(wide[pos : pos + 2 * n].decode("utf-16-le"))
+            pos += 2 * n
+
+    table: List[str] = [] if names is None else names
+
+    def name(ref: int) -> str:
+        return table[ref] if ref >= 0 else strings[-2 - ref]
+
+    ops: List[Any] = []
+    out = ops.append
+    i = 0
+    while i < n_ints:
+        code = ints[i]
+        if code == OP_INSERT:
+            anchor = ints[i + 3]
+            out((code, ints[i + 1], ints[i + 2], None if anchor == 0 else anchor))
+            i += 4
+        elif code == OP_SET_TEXT or code == OP_CREATE_TEXT:
+            out((code, ints[i + 1], strings[ints[i + 2]]))
+            i += 3
+        elif code == OP_CREATE_ELEMENT or code == OP_UNLISTEN:
+            out((code, ints[i + 1], name(ints[i + 2])))
+            i += 3
+        elif code == OP_LISTEN:
+            flags = ints[i + 3]
+            out((code, ints[i + 1], name(ints[i + 2])) if flags == 0 else (code, ints[i + 1], name(ints[i + 2]), flags))
+            i += 4
+        elif code == OP_CLONE_TPL:
+            out((code, ints[i + 1], ints[i + 2], ints[i + 3]))
+            i += 4
+        elif code == OP_SET_ATTR:
+            ref = ints[i + 3]
+            out((code, ints[i + 1], name(ints[i + 2]), None if ref < 0 else strings[ref]))
+            i += 4
+        elif code == OP_REMOVE or code == OP_CREATE_COMMENT or code == OP_CLEAR:
+            out((code, ints[i + 1]))
+            i += 2
+        elif code == OP_REMOVE_RANGE:
+            out((code, ints[i + 1], ints[i + 2]))
+            i += 3
+        elif code == OP_RELEASE:
+            n = ints[i + 1]
+            out((code, list(ints[i + 2 : i + 2 + n])))
+            i += 2 + n
+        elif code == OP_SET_STYLE:
+            n = ints[i + 2]
+            decls: Dict[str, Optional[str]] = {}
+            j = i + 3
+            for _ in range(n):
+                ref = ints[j + 1]
+                decls[name(ints[j])] = None if ref < 0 else strings[ref]
+                j += 2
+            out((code, ints[i + 1], decls))
+            i = j
+        elif code == OP_SET_PROP:
+            tag = ints[i + 3]
+            raw = ints[i + 4]
+            value: Any
+            if tag == VAL_NULL:
+                value = None
+            elif tag == VAL_STR:
+                value = strings[raw]
+            elif tag == VAL_TRUE:
+                value = True
+            elif tag == VAL_FALSE:
+                value = False
+            elif tag == VAL_INT:
+                value = raw
+            else:
+                value = json.loads(strings[raw])
+            out((code, ints[i + 1], name(ints[i + 2]), value))
+            i += 5
+        elif code == OP_REGISTER_TPL or code == OP_EVENT_FIELDS:
+            out((code, ints[i + 1], strings[ints[i + 2]]))
+            i += 3
+        elif code == OP_CLONE_TPL_BULK:
+            anchor = ints[i + 6]
+            m = ints[i + 7]
+            offsets = list(ints[i + 8 : i + 8 + m])
+            j = i + 8 + m
+            k = ints[i + 4] * m
+            texts = [strings[t] for t in ints[j : j + k]]
+            anchor_id = None if anchor == 0 else anchor
+            out((code, ints[i + 1], ints[i + 2], ints[i + 3], ints[i + 4], ints[i + 5], anchor_id, offsets, texts))
+            i = j + k
+        elif code == OP_REGISTER_STR:
+            slot = ints[i + 1]
+            if slot == len(table):
+                table.append(strings[ints[i + 2]])
+            else:
+                table[slot] = strings[ints[i + 2]]
+            i += 3
+        else:
+            raise ValueError(f"wybthon kernel: unknown op {code}")
+    return ops
+
+
 # ---------------------------------------------------------------------------
 # JavaScript kernel
 #
 # A single IIFE evaluated once in the page. It owns the id -> Node registry,
 # the registered-template protos for OP_CLONE_TPL, and native event
-# delegation. The Python side talks to it through ``apply(json)`` plus a
-# handful of synchronous helpers.
+# delegation. The Python side talks to it through ``applyBinary(bytes)``
+# (or ``apply(json)`` in the JSON wire format) plus a handful of
+# synchronous helpers.
 # ---------------------------------------------------------------------------
 
 _KERNEL_JS = r"""
 (() => {
-  const nodes = new Map();          // id -> Node
-  const listenTypes = new Map();    // id -> Set<eventType>
+  // id -> Node. A dense array: Python recycles released ids, so the
+  // registry stays as long as the high-water mark of live nodes.
+  const nodes = [];
+  let live = 0;
+  const listenTypes = new Map();    // id -> Map<eventType, LISTEN flags>
   const typeCounts = new Map();     // eventType -> number of listening nodes
-  const rootListeners = new Map();  // eventType -> native listener
+  const activeCounts = new Map();   // eventType -> number of non-passive listeners
+  const rootListeners = new Map();  // eventType -> [native listener, passive]
+  const coalesced = new Map();      // "id type" -> [id, type, latest payload]
+  let frameScheduled = false;
   const tplProtos = new Map();      // tpl_id -> parsed root node (cloned per mount)
+  const names = [];                 // name_id -> interned string (OP_REGISTER_STR)
+  const schemas = [null];           // schema_id -> payload field list (OP_EVENT_FIELDS)
+  const typeFields = __DEFAULT_EVENT_FIELDS__;  // eventType -> default field list
+  const fullFields = __FULL_EVENT_FIELDS__;
   let dispatcher = null;            // Python callback (id, type, payloadJson) -> flags
+  let pathDispatcher = null;        // Python callback (idsCsv, type, payloadJson) -> flags
+  let pathMode = false;             // one pathDispatcher call per native event
   let currentEvent = null;
 
   const doc = document;
 
   function reg(id, node) {
-    nodes.set(id, node);
+    if (nodes[id] === undefined) live++;
+    nodes[id] = node;
     node.__wybId = id;
   }
 
@@ -300,34 +1289,74 @@ _KERNEL_JS = r"""
     walkAssign(root, firstId, count);
   }
 
-  function listen(id, type) {
-    let set = listenTypes.get(id);
-    if (set === undefined) {
-      set = new Set();
-      listenTypes.set(id, set);
+  // `texts` is any indexable of strings, or a function k -> string (the
+  // binary decoder resolves string indices lazily).
+  function cloneTplBulk(firstId, per, tplId, n, parentId, anchorId, offsets, texts) {
+    const proto = tplProtos.get(tplId);
+    const frag = doc.createDocumentFragment();
+    const m = offsets.length;
+    const text = typeof texts === "function" ? texts : (k) => texts[k];
+    let id = firstId;
+    let t = 0;
+    for (let r = 0; r < n; r++) {
+      const root = proto.cloneNode(true);
+      walkAssign(root, id, per);
+      for (let k = 0; k < m; k++) nodes[id + offsets[k]].nodeValue = text(t++);
+      frag.appendChild(root);
+      id += per;
+    }
+    const anchor = anchorId === null ? null : nodes[anchorId];
+    nodes[parentId].insertBefore(frag, anchor === undefined ? null : anchor);
+  }
+
+  function listen(id, type, flags) {
+    let types = listenTypes.get(id);
+    if (types === undefined) {
+      types = new Map();
+      listenTypes.set(id, types);
     }
-    if (set.has(type)) return;
-    set.add(type);
-    const n = (typeCounts.get(type) || 0) + 1;
-    typeCounts.set(type, n);
-    if (n === 1) installRoot(type);
+    const prev = types.get(type);
+    if (prev === flags) return;
+    types.set(type, flags);
+    if (prev === undefined) typeCounts.set(type, (typeCounts.get(type) || 0) + 1);
+    if (!(flags & 2)) activeCounts.set(type, (activeCounts.get(type) || 0) + 1);
+    if (prev !== undefined && !(prev & 2)) dropActive(type);
+    const root = rootListeners.get(type);
+    // Reinstall non-passive once any listener of the type may preventDefault.
+    if (root === undefined || (root[1] && !(flags & 2))) installRoot(type, (flags & 2) !== 0);
   }
 
   function unlisten(id, type) {
-    const set = listenTypes.get(id);
-    if (set === undefined || !set.has(type)) return;
-    set.delete(type);
-    if (set.size === 0) listenTypes.delete(id);
+    const types = listenTypes.get(id);
+    if (types === undefined || !types.has(type)) return;
+    const flags = types.get(type);
+    types.delete(type);
+    if (types.size === 0) listenTypes.delete(id);
+    coalesced.delete(id + " " + type);
     dropTypeCount(type);
+    if (!(flags & 2)) dropActive(type);
+  }
+
+  // The last non-passive listener of a type is gone: if others remain,
+  // let the browser scroll without waiting on them again.
+  function dropActive(type) {
+    const n = (activeCounts.get(type) || 0) - 1;
+    if (n <= 0) {
+      activeCounts.delete(type);
+      const root = rootListeners.get(type);
+      if (root !== undefined && !root[1]) installRoot(type, true);
+    } else {
+      activeCounts.set(type, n);
+    }
   }
 
   function dropTypeCount(type) {
     const n = (typeCounts.get(type) || 0) - 1;
     if (n <= 0) {
       typeCounts.delete(type);
-      const l = rootListeners.get(type);
-      if (l !== undefined) {
-        doc.removeEventListener(type, l);
+      const root = rootListeners.get(type);
+      if (root !== undefined) {
+        doc.removeEventListener(type, root[0]);
         rootListeners.delete(type);
       }
     } else {
@@ -338,63 +1367,162 @@ _KERNEL_JS = r"""
   function release(ids) {
     for (let i = 0; i < ids.length; i++) {
       const id = ids[i];
-      nodes.delete(id);
-      const set = listenTypes.get(id);
-      if (set !== undefined) {
+      const n = nodes[id];
+      if (n !== undefined) {
+        nodes[id] = undefined;
+        live--;
+        // The id may be recycled; a detached node must not keep claiming it.
+        if (n.__wybId === id) n.__wybId = undefined;
+      }
+      const types = listenTypes.get(id);
+      if (types !== undefined) {
         listenTypes.delete(id);
-        for (const type of set) dropTypeCount(type);
+        for (const [type, flags] of types) {
+          coalesced.delete(id + " " + type);
+          dropTypeCount(type);
+          if (!(flags & 2)) dropActive(type);
+        }
       }
     }
   }
 
-  function buildPayload(ev) {
+  // Deliver the latest payload of every coalesced (node, type) once per
+  // frame. Flags are ignored: the native event is long gone.
+  function flushCoalesced() {
+    frameScheduled = false;
+    if (dispatcher === null) {
+      coalesced.clear();
+      return;
+    }
+    const batch = Array.from(coalesced.values());
+    coalesced.clear();
+    for (let i = 0; i < batch.length; i++) dispatcher(batch[i][0], batch[i][1], batch[i][2]);
+  }
+
+  function fieldsFor(schemaId, type) {
+    if (schemaId !== 0) return schemas[schemaId];
+    const f = typeFields[type];
+    return f === undefined ? fullFields : f;
+  }
+
+  function readField(ev, t, f) {
+    let v;
+    if (f === "value" || f === "checked") v = t ? t[f] : undefined;
+    else if (f.startsWith("target.")) v = t ? t[f.slice(7)] : undefined;
+    else v = ev[f];
+    return v === undefined ? null : v;
+  }
+
+  // Only the requested fields are read and serialized.
+  function buildPayload(ev, fields) {
     const t = ev.target;
-    return JSON.stringify({
-      type: ev.type,
-      value: t && t.value !== undefined ? t.value : null,
-      checked: t && t.checked !== undefined ? !!t.checked : false,
-      key: ev.key !== undefined ? ev.key : null,
-      code: ev.code !== undefined ? ev.code : null,
-      altKey: !!ev.altKey,
-      ctrlKey: !!ev.ctrlKey,
-      metaKey: !!ev.metaKey,
-      shiftKey: !!ev.shiftKey,
-      button: ev.button !== undefined ? ev.button : 0,
-      clientX: ev.clientX !== undefined ? ev.clientX : 0,
-      clientY: ev.clientY !== undefined ? ev.clientY : 0,
-      targetId: t && t.__wybId !== undefined ? t.__wybId : null,
-    });
+    const out = { type: ev.type, targetId: t && t.__wybId !== undefined ? t.__wybId : null };
+    for (let i = 0; i < fields.length; i++) out[fields[i]] = readField(ev, t, fields[i]);
+    return JSON.stringify(out);
   }
 
-  function installRoot(type) {
+  function installRoot(type, passive) {
+    const old = rootListeners.get(type);
+    if (old !== undefined) doc.removeEventListener(type, old[0]);
     const fn = (ev) => {
       if (dispatcher === null) return;
       let node = ev.target;
-      let payload = null;
+      const payloads = new Map();  // schema id -> payload, built once per event
+      const payloadFor = (sid) => {
+        let p = payloads.get(sid);
+        if (p === undefined) {
+          p = buildPayload(ev, fieldsFor(sid, type));
+          payloads.set(sid, p);
+        }
+        return p;
+      };
+      const path = pathMode && pathDispatcher !== null ? [] : null;
+      const pathSchemas = new Set();
       currentEvent = ev;
       try {
         while (node !== null) {
           const id = node.__wybId;
           if (id !== undefined) {
-            const set = listenTypes.get(id);
-            if (set !== undefined && set.has(type)) {
-              if (payload === null) payload = buildPayload(ev);
-              const flags = dispatcher(id, type, payload);
-              if (flags & 2) ev.preventDefault();
+            const types = listenTypes.get(id);
+            const flags = types !== undefined ? types.get(type) : undefined;
+            if (flags !== undefined) {
+              const sid = flags >>> 8;
               if (flags & 1) {
-                ev.stopPropagation();
-                return;
+                coalesced.set(id + " " + type, [id, type, payloadFor(sid)]);
+                if (!frameScheduled) {
+                  frameScheduled = true;
+                  requestAnimationFrame(flushCoalesced);
+                }
+              } else if (path !== null) {
+                path.push(id);
+                pathSchemas.add(sid);
+              } else {
+                const res = dispatcher(id, type, payloadFor(sid));
+                if (res & 2) ev.preventDefault();
+                if (res & 1) {
+                  ev.stopPropagation();
+                  return;
+                }
               }
             }
           }
           node = node.parentNode;
         }
+        if (path !== null && path.length > 0) {
+          let payload;
+          if (pathSchemas.size === 1) {
+            payload = payloadFor(pathSchemas.values().next().value);
+          } else {
+            // One payload serves the whole path: the union of the schemas.
+            const fields = new Set();
+            for (const sid of pathSchemas) for (const f of fieldsFor(sid, type)) fields.add(f);
+            payload = buildPayload(ev, Array.from(fields));
+          }
+          const res = pathDispatcher(path.join(","), type, payload);
+          if (res & 2) ev.preventDefault();
+          if (res & 1) ev.stopPropagation();
+        }
       } finally {
         currentEvent = null;
       }
     };
-    doc.addEventListener(type, fn);
-    rootListeners.set(type, fn);
+    doc.addEventListener(type, fn, { passive });
+    rootListeners.set(type, [fn, passive]);
+  }
+
+  function insert(parentId, id, anchorId) {
+    const anchor = anchorId === null ? null : nodes[anchorId];
+    nodes[parentId].insertBefore(nodes[id], anchor === undefined ? null : anchor);
+  }
+
+  function detach(id) {
+    const n = nodes[id];
+    if (n !== undefined && n.parentNode !== null) n.parentNode.removeChild(n);
+  }
+
+  function clear(id) {
+    nodes[id].textContent = "";
+  }
+
+  function removeRange(firstId, lastId) {
+    const first = nodes[firstId];
+    const last = nodes[lastId];
+    if (first === undefined || last === undefined || first.parentNode === null) return;
+    const range = doc.createRange();
+    range.setStartBefore(first);
+    range.setEndAfter(last);
+    range.deleteContents();
+  }
+
+  function setAttr(id, name, value) {
+    const n = nodes[id];
+    if (value === null) n.removeAttribute(name);
+    else n.setAttribute(name, value);
+  }
+
+  function setStyle(style, key, value) {
+    if (value === null) style.removeProperty(key);
+    else style.setProperty(key, value);
   }
 
   function apply(opsJson) {
@@ -419,42 +1547,33 @@ _KERNEL_JS = r"""
           break;
         }
         case 5: { // INSERT
-          const parent = nodes.get(op[1]);
-          const anchor = op[3] === null ? null : nodes.get(op[3]);
-          parent.insertBefore(nodes.get(op[2]), anchor === undefined ? null : anchor);
+          insert(op[1], op[2], op[3]);
           break;
         }
         case 6: { // REMOVE
-          const n = nodes.get(op[1]);
-          if (n !== undefined && n.parentNode !== null) n.parentNode.removeChild(n);
+          detach(op[1]);
           break;
         }
         case 7: { // SET_TEXT
-          nodes.get(op[1]).nodeValue = op[2];
+          nodes[op[1]].nodeValue = op[2];
           break;
         }
         case 8: { // SET_ATTR
-          const n = nodes.get(op[1]);
-          if (op[3] === null) n.removeAttribute(op[2]);
-          else n.setAttribute(op[2], op[3]);
+          setAttr(op[1], op[2], op[3]);
           break;
         }
         case 9: { // SET_PROP
-          nodes.get(op[1])[op[2]] = op[3];
+          nodes[op[1]][op[2]] = op[3];
           break;
         }
         case 10: { // SET_STYLE
-          const style = nodes.get(op[1]).style;
+          const style = nodes[op[1]].style;
           const decls = op[2];
-          for (const k in decls) {
-            const v = decls[k];
-            if (v === null) style.removeProperty(k);
-            else style.setProperty(k, v);
-          }
+          for (const k in decls) setStyle(style, k, decls[k]);
           break;
         }
         case 11: { // LISTEN
-          listen(op[1], op[2]);
+          listen(op[1], op[2], op.length > 3 ? op[3] : 0);
           break;
         }
         case 12: { // UNLISTEN
@@ -469,15 +1588,163 @@ _KERNEL_JS = r"""
           registerTpl(op[1], op[2]);
           break;
         }
+        case 19: { // EVENT_FIELDS
+          schemas[op[1]] = op[2] === "" ? [] : op[2].split(",");
+          break;
+        }
+        case 16: { // CLONE_TPL_BULK
+          cloneTplBulk(op[1], op[2], op[3], op[4], op[5], op[6], op[7], op[8]);
+          break;
+        }
+        case 17: { // CLEAR
+          clear(op[1]);
+          break;
+        }
+        case 18: { // REMOVE_RANGE
+          removeRange(op[1], op[2]);
+          break;
+        }
         default:
           throw new Error(`wybthon kernel: unknown op ${op[0]}`);
       }
     }
   }
 
+  // Binary wire format; layout documented next to ``encode_ops`` in Python.
+  const textDecoder = new TextDecoder();
+
+  function applyBinary(bytes) {
+    if (bytes.byteOffset % 4 !== 0) bytes = bytes.slice();
+    const base = bytes.byteOffset;
+    const head = new Int32Array(bytes.buffer, base, 3);
+    if (head[0] !== 1) throw new Error(`wybthon kernel: unsupported wire version ${head[0]}`);
+    const nInts = head[1];
+    const nStrs = head[2];
+    const w = new Int32Array(bytes.buffer, base + 12, nInts);
+    const lens = new Int32Array(bytes.buffer, base + 12 + 4 * nInts, nStrs);
+    const blob = textDecoder.decode(bytes.subarray(12 + 4 * (nInts + nStrs)));
+    const strs = new Array(nStrs);
+    for (let k = 0, off = 0; k < nStrs; k++) {
+      strs[k] = blob.substring(off, off + lens[k]);
+      off += lens[k];
+    }
+    const name = (ref) => (ref >= 0 ? names[ref] : strs[-2 - ref]);
+    let i = 0;
+    while (i < nInts) {
+      switch (w[i]) {
+        case 1: // CREATE_ELEMENT
+          reg(w[i + 1], doc.createElement(name(w[i + 2])));
+          i += 3;
+          break;
+        case 2: // CREATE_TEXT
+          reg(w[i + 1], doc.createTextNode(strs[w[i + 2]]));
+          i += 3;
+          break;
+        case 3: // CREATE_COMMENT
+          reg(w[i + 1], doc.createComment(""));
+          i += 2;
+          break;
+        case 4: // CLONE_TPL
+          cloneTpl(w[i + 1], w[i + 2], w[i + 3]);
+          i += 4;
+          break;
+        case 5: // INSERT
+          insert(w[i + 1], w[i + 2], w[i + 3] === 0 ? null : w[i + 3]);
+          i += 4;
+          break;
+        case 6: // REMOVE
+          detach(w[i + 1]);
+          i += 2;
+          break;
+        case 7: // SET_TEXT
+          nodes[w[i + 1]].nodeValue = strs[w[i + 2]];
+          i += 3;
+          break;
+        case 8: // SET_ATTR
+          setAttr(w[i + 1], name(w[i + 2]), w[i + 3] < 0 ? null : strs[w[i + 3]]);
+          i += 4;
+          break;
+        case 9: { // SET_PROP
+          const tag = w[i + 3];
+          const raw = w[i + 4];
+          let v;
+          if (tag === 0) v = null;
+          else if (tag === 1) v = strs[raw];
+          else if (tag === 2) v = false;
+          else if (tag === 3) v = true;
+          else if (tag === 4) v = raw;
+          else v = JSON.parse(strs[raw]);
+          nodes[w[i + 1]][name(w[i + 2])] = v;
+          i += 5;
+          break;
+        }
+        case 10: { // SET_STYLE
+          const style = nodes[w[i + 1]].style;
+          const n = w[i + 2];
+          i += 3;
+          for (let k = 0; k < n; k++, i += 2) {
+            setStyle(style, name(w[i]), w[i + 1] < 0 ? null : strs[w[i + 1]]);
+          }
+          break;
+        }
+        case 11: // LISTEN
+          listen(w[i + 1], name(w[i + 2]), w[i + 3]);
+          i += 4;
+          break;
+        case 12: // UNLISTEN
+          unlisten(w[i + 1], name(w[i + 2]));
+          i += 3;
+          break;
+        case 13: { // RELEASE
+          const n = w[i + 1];
+          release(w.subarray(i + 2, i + 2 + n));
+          i += 2 + n;
+          break;
+        }
+        case 14: // REGISTER_TPL
+          registerTpl(w[i + 1], strs[w[i + 2]]);
+          i += 3;
+          break;
+        case 19: { // EVENT_FIELDS
+          const f = strs[w[i + 2]];
+          schemas[w[i + 1]] = f === "" ? [] : f.split(",");
+          i += 3;
+          break;
+        }
+        case 15: // REGISTER_STR
+          names[w[i + 1]] = strs[w[i + 2]];
+          i += 3;
+          break;
+        case 16: { // CLONE_TPL_BULK
+          const m = w[i + 7];
+          const offsets = w.subarray(i + 8, i + 8 + m);
+          const base = i + 8 + m;
+          const n = w[i + 4];
+          cloneTplBulk(
+            w[i + 1], w[i + 2], w[i + 3], n, w[i + 5], w[i + 6] === 0 ? null : w[i + 6],
+            offsets, (k) => strs[w[base + k]]
+          );
+          i = base + n * m;
+          break;
+        }
+        case 17: // CLEAR
+          clear(w[i + 1]);
+          i += 2;
+          break;
+        case 18: // REMOVE_RANGE
+          removeRange(w[i + 1], w[i + 2]);
+          i += 3;
+          break;
+        default:
+          throw new Error(`wybthon kernel: unknown op ${w[i]}`);
+      }
+    }
+  }
+
   return {
     apply,
-    getNode: (id) => nodes.get(id),
+    applyBinary,
+    getNode: (id) => nodes[id],
     adopt: (id, node) => { reg(id, node); },
     adoptQuery: (id, selector) => {
       const n = doc.querySelector(selector);
@@ -485,30 +1752,41 @@ _KERNEL_JS = r"""
       reg(id, n);
       return true;
     },
-    setDispatcher: (fn) => { dispatcher = fn; },
+    setDispatcher: (fn, pathFn) => {
+      dispatcher = fn;
+      pathDispatcher = pathFn === undefined ? null : pathFn;
+    },
+    setDispatchMode: (mode) => { pathMode = mode === "path"; },
     getCurrentEvent: () => currentEvent,
     stats: () => JSON.stringify({
-      nodes: nodes.size,
+      nodes: live,
+      highWater: Math.max(nodes.length - 1, 0),
       listeners: listenTypes.size,
       types: typeCounts.size,
       templates: tplProtos.size,
+      names: names.length,
     }),
   };
 })()
 """
+_KERNEL_JS = _KERNEL_JS.replace(
+    "__DEFAULT_EVENT_FIELDS__", json.dumps({k: list(v) for k, v in DEFAULT_EVENT_FIELDS.items()})
+).replace("__FULL_EVENT_FIELDS__", json.dumps(list(_FULL_EVENT_FIELDS)))
 
 
 class BrowserBackend:
     """Backend that drives the real DOM through the embedded JS kernel.
 
-    Created automatically on first use inside Pyodide. Every `apply`
-    serializes the op list to JSON and makes exactly one call across
-    the bridge.
+    Created automatically on first use inside Pyodide. Every commit
+    makes exactly one call across the bridge: `apply_binary` hands the
+    encoded buffer over as a `Uint8Array`, and `apply` (the JSON
+    fallback) serializes the op list to a string.
     """
 
     def __init__(self) -> None:
         self._kernel = self._eval_kernel()
         self._dispatch_proxy: Any = None
+        self._path_proxy: Any = None
 
     @staticmethod
     def _eval_kernel() -> Any:
@@ -525,6 +1803,12 @@ class BrowserBackend:
         """Serialize `ops` to JSON and apply them in one kernel call."""
         self._kernel.apply(json.dumps(ops, separators=(",", ":"), ensure_ascii=False))
 
+    def apply_binary(self, buf: bytes) -> None:
+        """Apply a batch encoded by `encode_ops` in one kernel call."""
+        from pyodide.ffi import to_js
+
+        self._kernel.applyBinary(to_js(buf))
+
     def get_node(self, node_id: int) -> Any:
         """Return the raw DOM node registered under `node_id`."""
         return self._kernel.getNode(node_id)
@@ -541,17 +1825,25 @@ class BrowserBackend:
         """The browser can always parse template HTML."""
         return True
 
-    def set_dispatcher(self, fn: Callable[[int, str, str], int]) -> None:
-        """Install the Python event dispatcher as the kernel's callback proxy."""
+    def set_dispatcher(
+        self, fn: Callable[[int, str, str], int], path_fn: Optional[Callable[[Any, str, str], int]] = None
+    ) -> None:
+        """Install the Python event dispatchers as the kernel's callback proxies."""
         from pyodide.ffi import create_proxy
 
-        if self._dispatch_proxy is not None:
-            try:
-                self._dispatch_proxy.destroy()
-            except Exception:
-                pass
+        for proxy in (self._dispatch_proxy, self._path_proxy):
+            if proxy is not None:
+                try:
+                    proxy.destroy()
+                except Exception:
+                    pass
         self._dispatch_proxy = create_proxy(fn)
-        self._kernel.setDispatcher(self._dispatch_proxy)
+        self._path_proxy = create_proxy(path_fn) if path_fn is not None else None
+        self._kernel.setDispatcher(self._dispatch_proxy, self._path_proxy)
+
+    def set_dispatch_mode(self, mode: str) -> None:
+        """Switch the kernel between per-node and per-event dispatch."""
+        self._kernel.setDispatchMode(mode)
 
     def current_event(self) -> Any:
         """Return the native event currently being dispatched, or `None`."""
@@ -570,14 +1862,22 @@ class PythonBackend:
 
     def __init__(self, document: Any) -> None:
         self._doc = document
-        self._nodes: Dict[int, Any] = {}
-        self._listen: Dict[int, Set[str]] = {}
+        # id -> node, dense like the JS kernel's array registry (slot 0 unused).
+        self._nodes: List[Any] = [None]
+        self._listen: Dict[int, Dict[str, int]] = {}
         self._type_counts: Dict[str, int] = {}
+        self._active_counts: Dict[str, int] = {}
         self._root_listeners: Dict[str, Any] = {}
+        self._root_passive: Dict[str, bool] = {}
+        self._coalesced: Dict[Tuple[int, str], str] = {}
         self._dispatcher: Optional[Callable[[int, str, str], int]] = None
+        self._path_dispatcher: Optional[Callable[[Any, str, str], int]] = None
+        self._path_mode = False
         self._current_event: Any = None
         self._tpl = self._probe_template(document)
         self._tpl_protos: Dict[int, Any] = {}
+        self._names: List[str] = []
+        self._schemas: Dict[int, Tuple[str, ...]] = {}
 
     @staticmethod
     def _probe_template(document: Any) -> Any:
@@ -609,10 +1909,10 @@ class PythonBackend:
             elif code == OP_CLONE_TPL:
                 self._clone_tpl(op[1], op[2], op[3])
             elif code == OP_INSERT:
-                anchor = None if op[3] is None else nodes.get(op[3])
+                anchor = None if op[3] is None else self.get_node(op[3])
                 nodes[op[1]].insertBefore(nodes[op[2]], anchor)
             elif code == OP_REMOVE:
-                node = nodes.get(op[1])
+                node = self.get_node(op[1])
                 if node is not None and getattr(node, "parentNode", None) is not None:
                     node.parentNode.removeChild(node)
             elif code == OP_SET_TEXT:
@@ -632,19 +1932,36 @@ class PythonBackend:
                     else:
                         style.setProperty(key, value)
             elif code == OP_LISTEN:
-                self._listen_op(op[1], op[2])
+                self._listen_op(op[1], op[2], op[3] if len(op) > 3 else 0)
             elif code == OP_UNLISTEN:
                 self._unlisten_op(op[1], op[2])
             elif code == OP_RELEASE:
                 self._release(op[1])
             elif code == OP_REGISTER_TPL:
                 self._register_tpl(op[1], op[2])
+            elif code == OP_CLONE_TPL_BULK:
+                self._clone_tpl_bulk(*op[1:])
+            elif code == OP_CLEAR:
+                self._clear(op[1])
+            elif code == OP_REMOVE_RANGE:
+                self._remove_range(op[1], op[2])
+            elif code == OP_EVENT_FIELDS:
+                self._schemas[op[1]] = tuple(op[2].split(",")) if op[2] else ()
             else:
                 raise ValueError(f"wybthon kernel: unknown op {code}")
 
+    def apply_binary(self, buf: bytes) -> None:
+        """Decode a binary batch and interpret it like `apply`."""
+        self.apply(decode_ops(buf, self._names))
+
     def get_node(self, node_id: int) -> Any:
         """Return the stub node registered under `node_id`, or `None`."""
-        return self._nodes.get(node_id)
+        nodes = self._nodes
+        return nodes[node_id] if 0 < node_id < len(nodes) else None
+
+    def live_count(self) -> int:
+        """Number of ids currently registered (for leak checks in tests)."""
+        return sum(1 for node in self._nodes if node is not None)
 
     def adopt(self, node_id: int, node: Any) -> None:
         """Register an existing stub node under `node_id`."""
@@ -662,9 +1979,16 @@ class PythonBackend:
         """Whether the stub document parses `<template>` innerHTML."""
         return self._tpl is not None
 
-    def set_dispatcher(self, fn: Callable[[int, str, str], int]) -> None:
-        """Install the Python event dispatcher used by `dispatch`."""
+    def set_dispatcher(
+        self, fn: Callable[[int, str, str], int], path_fn: Optional[Callable[[Any, str, str], int]] = None
+    ) -> None:
+        """Install the Python event dispatchers used by `dispatch`."""
         self._dispatcher = fn
+        self._path_dispatcher = path_fn
+
+    def set_dispatch_mode(self, mode: str) -> None:
+        """Switch `dispatch` between per-node and per-event calls."""
+        self._path_mode = mode == "path"
 
     def current_event(self) -> Any:
         """Return the raw event passed to the in-flight `dispatch`, or `None`."""
@@ -673,7 +1997,10 @@ class PythonBackend:
     # -- internals ----------------------------------------------------------
 
     def _reg(self, node_id: int, node: Any) -> None:
-        self._nodes[node_id] = node
+        nodes = self._nodes
+        if node_id >= len(nodes):
+            nodes.extend([None] * (node_id + 1 - len(nodes)))
+        nodes[node_id] = node
         try:
             node._wyb_id = node_id
         except Exception:
@@ -704,6 +2031,46 @@ class PythonBackend:
                 f"wybthon kernel: template node count mismatch (expected {count}, got {node_id - first_id})"
             )
 
+    def _clone_tpl_bulk(
+        self,
+        first_id: int,
+        per_count: int,
+        tpl_id: int,
+        n: int,
+        parent_id: int,
+        anchor_id: Optional[int],
+        offsets: List[int],
+        texts: List[str],
+    ) -> None:
+        nodes = self._nodes
+        parent = nodes[parent_id]
+        anchor = None if anchor_id is None else self.get_node(anchor_id)
+        m = len(offsets)
+        node_id = first_id
+        for r in range(n):
+            self._clone_tpl(node_id, per_count, tpl_id)
+            row_texts = texts[r * m : (r + 1) * m]
+            for offset, text in zip(offsets, row_texts):
+                nodes[node_id + offset].nodeValue = text
+            parent.insertBefore(nodes[node_id], anchor)
+            node_id += per_count
+
+    def _clear(self, parent_id: int) -> None:
+        parent = self._nodes[parent_id]
+        for node in list(parent.childNodes):
+            parent.removeChild(node)
+
+    def _remove_range(self, first_id: int, last_id: int) -> None:
+        first = self.get_node(first_id)
+        last = self.get_node(last_id)
+        parent = getattr(first, "parentNode", None)
+        if parent is None or last is None:
+            return
+        kids = parent.childNodes
+        start = kids.index(first)
+        for node in kids[start : kids.index(last, start) + 1]:
+            parent.removeChild(node)
+
     def _clone_node(self, node: Any) -> Any:
         """Structural deep copy through the stub document's factories.
 
@@ -740,29 +2107,49 @@ class PythonBackend:
             clone.appendChild(self._clone_node(child))
         return clone
 
-    def _listen_op(self, node_id: int, event_type: str) -> None:
-        types = self._listen.setdefault(node_id, set())
-        if event_type in types:
+    def _listen_op(self, node_id: int, event_type: str, flags: int) -> None:
+        types = self._listen.setdefault(node_id, {})
+        prev = types.get(event_type)
+        if prev == flags:
             return
-        types.add(event_type)
-        count = self._type_counts.get(event_type, 0) + 1
-        self._type_counts[event_type] = count
-        if count == 1:
-            self._install_root(event_type)
+        types[event_type] = flags
+        if prev is None:
+            self._type_counts[event_type] = self._type_counts.get(event_type, 0) + 1
+        if not flags & LISTEN_PASSIVE:
+            self._active_counts[event_type] = self._active_counts.get(event_type, 0) + 1
+        if prev is not None and not prev & LISTEN_PASSIVE:
+            self._drop_active(event_type)
+        passive = self._root_passive.get(event_type)
+        if passive is None or (passive and not flags & LISTEN_PASSIVE):
+            self._install_root(event_type, bool(flags & LISTEN_PASSIVE))
 
     def _unlisten_op(self, node_id: int, event_type: str) -> None:
         types = self._listen.get(node_id)
         if types is None or event_type not in types:
             return
-        types.discard(event_type)
+        flags = types.pop(event_type)
         if not types:
             self._listen.pop(node_id, None)
+        self._coalesced.pop((node_id, event_type), None)
         self._drop_type_count(event_type)
+        if not flags & LISTEN_PASSIVE:
+            self._drop_active(event_type)
+
+    def _drop_active(self, event_type: str) -> None:
+        count = self._active_counts.get(event_type, 0) - 1
+        if count <= 0:
+            self._active_counts.pop(event_type, None)
+            # Listeners of this type remain, all passive: so is the root.
+            if self._root_passive.get(event_type) is False:
+                self._install_root(event_type, True)
+        else:
+            self._active_counts[event_type] = count
 
     def _drop_type_count(self, event_type: str) -> None:
         count = self._type_counts.get(event_type, 0) - 1
         if count <= 0:
             self._type_counts.pop(event_type, None)
+            self._root_passive.pop(event_type, None)
             listener = self._root_listeners.pop(event_type, None)
             if listener is not None:
                 try:
@@ -773,14 +2160,33 @@ class PythonBackend:
             self._type_counts[event_type] = count
 
     def _release(self, ids: List[int]) -> None:
+        nodes = self._nodes
         for node_id in ids:
-            self._nodes.pop(node_id, None)
+            node = nodes[node_id] if node_id < len(nodes) else None
+            if node is not None:
+                nodes[node_id] = None
+                # The id may be recycled; a detached node must not keep claiming it.
+                if getattr(node, "_wyb_id", None) == node_id:
+                    try:
+                        node._wyb_id = None
+                    except Exception:
+                        pass
             types = self._listen.pop(node_id, None)
             if types:
-                for event_type in types:
+                for event_type, flags in types.items():
+                    self._coalesced.pop((node_id, event_type), None)
                     self._drop_type_count(event_type)
+                    if not flags & LISTEN_PASSIVE:
+                        self._drop_active(event_type)
+
+    def _install_root(self, event_type: str, passive: bool) -> None:
+        old = self._root_listeners.get(event_type)
+        if old is not None:
+            try:
+                self._doc.removeEventListener(event_type, old)
+            except Exception:
+                pass
 
-    def _install_root(self, event_type: str) -> None:
         def listener(event: Any) -> None:
             self.dispatch(event_type, getattr(event, "target", None), event)
 
@@ -789,36 +2195,59 @@ class PythonBackend:
         except Exception:
             pass
         self._root_listeners[event_type] = listener
+        self._root_passive[event_type] = passive
+
+    def _fields_for(self, schema_id: int, event_type: str) -> Tuple[str, ...]:
+        if schema_id:
+            return self._schemas[schema_id]
+        return DEFAULT_EVENT_FIELDS.get(event_type, _FULL_EVENT_FIELDS)
+
+    @staticmethod
+    def _build_payload(event_type: str, target: Any, overrides: Optional[dict], fields: Tuple[str, ...]) -> str:
+        # Same field rules as the JS kernel's buildPayload; `overrides` stands
+        # in for the properties a real event would carry.
+        out: Dict[str, Any] = {"type": event_type, "targetId": getattr(target, "_wyb_id", None)}
+        for field in fields:
+            if overrides and field in overrides:
+                value = overrides[field]
+            elif field == "checked":
+                value = bool(getattr(target, "checked", False))
+            elif field == "value":
+                value = getattr(target, "value", None)
+            elif field.startswith("target."):
+                value = getattr(target, field[7:], None)
+            else:
+                value = _EVENT_FIELD_DEFAULTS.get(field)
+            out[field] = value
+        return json.dumps(out)
 
     # -- test helper ---------------------------------------------------------
 
-    def dispatch(self, event_type: str, target: Any, raw_event: Any = None, payload: Optional[dict] = None) -> None:
+    def dispatch(self, event_type: str, target: Any, raw_event: Any = None, payload: Optional[dict] = None) -> int:
         """Simulate a bubbling native event dispatch for tests.
 
         Walks the stub-node ancestor chain from `target`, invoking the
         Python dispatcher for every registered `(node, event_type)`
-        handler, exactly like the JS kernel's root listener.
+        handler (or the path dispatcher once, in `"path"` mode), exactly
+        like the JS kernel's root listener.
+
+        Returns:
+            The `FLAG_*` bits that would be applied to the native event.
         """
         if self._dispatcher is None:
-            return
-        base = {
-            "type": event_type,
-            "value": getattr(target, "value", None),
-            "checked": bool(getattr(target, "checked", False)),
-            "key": None,
-            "code": None,
-            "altKey": False,
-            "ctrlKey": False,
-            "metaKey": False,
-            "shiftKey": False,
-            "button": 0,
-            "clientX": 0,
-            "clientY": 0,
-            "targetId": getattr(target, "_wyb_id", None),
-        }
-        if payload:
-            base.update(payload)
-        payload_json = json.dumps(base)
+            return 0
+        payloads: Dict[int, str] = {}
+
+        def payload_for(schema_id: int) -> str:
+            p = payloads.get(schema_id)
+            if p is None:
+                p = self._build_payload(event_type, target, payload, self._fields_for(schema_id, event_type))
+                payloads[schema_id] = p
+            return p
+
+        path_schemas: List[int] = []
+        path: Optional[List[int]] = [] if self._path_mode and self._path_dispatcher is not None else None
+        applied = 0
         self._current_event = raw_event
         try:
             node = target
@@ -826,10 +2255,48 @@ class PythonBackend:
                 node_id = getattr(node, "_wyb_id", None)
                 if node_id is not None:
                     types = self._listen.get(node_id)
-                    if types and event_type in types:
-                        flags = self._dispatcher(node_id, event_type, payload_json)
-                        if flags & FLAG_STOP_PROPAGATION:
-                            return
+                    listen_flags = types.get(event_type) if types else None
+                    if listen_flags is not None:
+                        schema_id = listen_flags >> LISTEN_SCHEMA_SHIFT
+                        if listen_flags & LISTEN_COALESCE:
+                            # Latest payload wins; delivered by flush_coalesced.
+                            self._coalesced[(node_id, event_type)] = payload_for(schema_id)
+                        elif path is not None:
+                            path.append(node_id)
+                            if schema_id not in path_schemas:
+                                path_schemas.append(schema_id)
+                        else:
+                            flags = self._dispatcher(node_id, event_type, payload_for(schema_id))
+                            applied |= flags
+                            if flags & FLAG_STOP_PROPAGATION:
+                                return applied
                 node = getattr(node, "parentNode", None)
+            if path and self._path_dispatcher is not None:
+                if len(path_schemas) == 1:
+                    payload_json = payload_for(path_schemas[0])
+                else:
+                    union = dict.fromkeys(f for sid in path_schemas for f in self._fields_for(sid, event_type))
+                    payload_json = self._build_payload(event_type, target, payload, tuple(union))
+                applied = self._path_dispatcher(",".join(map(str, path)), event_type, payload_json)
         finally:
             self._current_event = None
+        return applied
+
+    def flush_coalesced(self) -> int:
+        """Deliver pending coalesced payloads, as the JS kernel does per frame.
+
+        Returns:
+            The number of handler calls made.
+        """
+        pending = self._coalesced
+        if not pending or self._dispatcher is None:
+            pending.clear()
+            return 0
+        self._coalesced = {}
+        for (node_id, event_type), payload_json in pending.items():
+            self._dispatcher(node_id, event_type, payload_json)
+        return len(pending)
+
+    def root_is_passive(self, event_type: str) -> Optional[bool]:
+        """Whether the root listener for `event_type` is passive (`None` if absent)."""
+        return self._root_passive.get(event_type)
@@ -24,6 +24,8 @@ Core types:
 - [`Computation`][wybthon.reactivity.Computation]: a reactive computation
   (effect or memo) that is itself an ownership scope.
 - [`Resource`][wybthon.Resource]: async data wrapper with `data`/`error`/`loading`.
+- [`ResourceCache`][wybthon.ResourceCache]: shared cache that de-duplicates resource fetches.
+- [`BatchFetcher`][wybthon.BatchFetcher]: fetcher that merges one tick's resource requests into one call.
 
 Public primitives:
 
@@ -37,7 +39,8 @@ Public primitives:
 - [`merge_props`][wybthon.merge_props] / [`split_props`][wybthon.split_props]:
   prop composition helpers.
 - [`map_array`][wybthon.map_array] / [`index_array`][wybthon.index_array] /
-  [`create_selector`][wybthon.create_selector]: reactive list primitives.
+  [`create_selector`][wybthon.create_selector] /
+  [`create_multi_selector`][wybthon.create_multi_selector]: reactive list primitives.
 
 Example:
     A counter with a derived doubled value::
@@ -53,9 +56,14 @@ Example:
 
 from __future__ import annotations
 
+import time
 import weakref
+from bisect import bisect_left
 from collections.abc import Awaitable as AbcAwaitable
-from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar, Union, cast
+from collections.abc import Mapping as AbcMapping
+from itertools import compress, count
+from operator import is_not, ne
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Generic, List, Optional, Set, Tuple, TypeVar, Union, cast
 
 __all__ = [
     "Owner",
@@ -65,6 +73,8 @@ __all__ = [
     "ReactiveProps",
     "batch",
     "Resource",
+    "ResourceCache",
+    "BatchFetcher",
     "create_resource",
     "create_signal",
     "create_effect",
@@ -90,6 +100,15 @@ __all__ = [
     "map_array",
     "index_array",
     "create_selector",
+    "create_multi_selector",
+    "SignalArray",
+    "create_signal_array",
+    "set_time_slicing",
+    "set_auto_batching",
+    "flush_sync",
+    "set_row_pooling",
+    "start_transition",
+    "use_transition",
 ]
 
 T = TypeVar("T")
@@ -97,10 +116,11 @@ T = TypeVar("T")
 _DEFAULT_EQUALS = object()
 _MISSING = object()
 
-# The DOM command buffer's commit function. Effects emit batched DOM ops;
-# committing at the end of each flush ships them across the bridge in one
-# crossing. A no-op when the buffer is empty (e.g. pure-CPython usage).
-from .kernel import commit as _kernel_commit  # noqa: E402
+# The DOM command buffer's commit entry point. Effects emit batched DOM
+# ops; committing at the end of each flush ships them across the bridge in
+# one crossing (or schedules one, under a deferred commit policy). A no-op
+# when the buffer is empty (e.g. pure-CPython usage).
+from .kernel import request_commit as _kernel_commit  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Reactive node states (graph coloring)
@@ -138,12 +158,43 @@ _current_observer: Optional["Computation"] = None
 #    emit DOM ops.
 # 3. **Commit**: ship the buffered DOM ops across the bridge.
 # 4. **User** (``create_effect``): observe the committed DOM.
-_pure_queue: List["Computation"] = []
-_render_effect_queue: List["Computation"] = []
-_effect_queue: List["Computation"] = []
+#
+# Each priority lane has its own ``(pure, render, user)`` queues. Within a
+# phase, more urgent lanes drain first; the idle lane is left for a later
+# tick (see ``batch(priority=...)``).
+_PHASE_PURE = 0
+_PHASE_RENDER = 1
+_PHASE_USER = 2
+
+_LANES: Dict[str, int] = {"user-blocking": 0, "normal": 1, "idle": 2}
+_LANE_NORMAL = 1
+_LANE_IDLE = 2
+
+_lane_queues: List[Tuple[List["Computation"], List["Computation"], List["Computation"]]] = [
+    ([], [], []) for _ in _LANES
+]
+# Lane that computations marked stale right now are queued in.
+_update_lane: int = _LANE_NORMAL
+# Bumped on every enqueue, so a flush knows when to look for new work in
+# a queue it has already drained.
+_enqueued: int = 0
+_idle_scheduled: bool = False
 _running_effects: bool = False
 _batch_depth: int = 0
 
+# Opt-in time slicing (see ``set_time_slicing``). While a budget is set, a
+# flush that overruns it commits the render effects run so far and asks
+# ``_slice_driver`` to resume the remaining queues on a later tick.
+_slice_budget: Optional[float] = None
+_slice_driver: Optional[Any] = None
+_slice_scheduled: bool = False
+
+# Opt-in automatic batching (see ``set_auto_batching``). While a driver is
+# set, a write outside any batch or flush schedules one flush on it instead
+# of flushing synchronously, so every write until it fires shares it.
+_auto_batch_driver: Optional[Any] = None
+_auto_flush_scheduled: bool = False
+
 # Re-entrant counter incremented while inside :func:`untrack`.  Used by
 # the dev-mode "destructured prop" warning to detect intentional
 # untracked reads and stay quiet.
@@ -197,12 +248,25 @@ def _changed(equals: Any, old: Any, new: Any) -> bool:
 
 
 def _run_effects_if_idle() -> None:
-    """Flush the effect queue unless we're batching or already flushing."""
+    """Flush the effect queue unless we're batching or already flushing.
+
+    Under automatic batching the flush is scheduled instead.
+    """
     if _batch_depth == 0 and not _running_effects:
-        _flush_effects()
+        if _auto_batch_driver is not None:
+            _schedule_auto_flush()
+        else:
+            _flush_effects()
+
+
+def _lane_index(priority: str) -> int:
+    try:
+        return _LANES[priority]
+    except KeyError:
+        raise ValueError('priority must be "user-blocking", "normal", or "idle"') from None
 
 
-def _flush_effects() -> None:
+def _flush_effects(include_idle: bool = False) -> None:
     """Run all queued effects to completion (the "effects" phase).
 
     Pure computations (``create_computed``) drain first, then render
@@ -213,47 +277,219 @@ def _flush_effects() -> None:
     updated DOM. A user effect that writes a signal re-drains the pure
     and render phases (and re-commits) before the next user effect,
     giving synchronous settling within one logical update.
+
+    Under [`set_time_slicing`][wybthon.reactivity.set_time_slicing], a
+    flush that runs past its budget stops between two render or user
+    effects, once the pure phase has settled. The DOM ops emitted so far
+    are committed and the unrun effects stay queued for the next slice.
+
+    Within each phase, queues drain in lane order (`"user-blocking"`
+    before `"normal"`). The `"idle"` lane only drains when `include_idle`
+    is set, which a flush scheduled for a later tick does.
     """
     global _running_effects
     if _running_effects:
         return
     _running_effects = True
+    paused = False
+    lanes = _lane_queues if include_idle else _lane_queues[:_LANE_IDLE]
+    # Every queue this flush drains, in the order it drains them, with a
+    # read cursor each; user queues start at ``user_start``.
+    order = [lane[phase] for phase in (_PHASE_PURE, _PHASE_RENDER, _PHASE_USER) for lane in lanes]
+    pos = [0] * len(order)
+    user_start = 2 * len(lanes)
+    n = len(order)
     try:
-        pi = 0
-        ri = 0
-        ei = 0
         guard = 0
-        pure_queue = _pure_queue
-        render_queue = _render_effect_queue
-        queue = _effect_queue
-        while pi < len(pure_queue) or ri < len(render_queue) or ei < len(queue):
+        # A transition's flush never yields: its ops ship together.
+        driver = _slice_driver if not _commit_hold else None
+        deadline = driver.now() + _slice_budget if driver is not None else 0.0
+        # The queue being drained and its cursor, kept in locals and
+        # written back to ``pos`` whenever we move to another queue.
+        k = 0
+        queue = order[0]
+        i = 0
+        seen = _enqueued
+        while True:
+            if i >= len(queue) or _enqueued != seen:
+                pos[k] = i
+                if _enqueued != seen:
+                    # Something was queued, maybe in a more urgent queue.
+                    seen = _enqueued
+                    k = 0
+                while k < n and pos[k] >= len(order[k]):
+                    k += 1
+                if k == n:
+                    break
+                queue = order[k]
+                i = pos[k]
             guard += 1
             if guard > _MAX_FLUSH_ITER:
                 raise RuntimeError(
                     "Wybthon: reactive update did not stabilize " "(possible cyclic effect writing its own dependency)."
                 )
-            if pi < len(pure_queue):
-                comp = pure_queue[pi]
-                pi += 1
-            elif ri < len(render_queue):
-                comp = render_queue[ri]
-                ri += 1
-            else:
+            comp = queue[i]
+            i += 1
+            if k >= user_start:
                 # Pure and render phases are settled: commit the DOM ops
                 # so the next user effect observes the updated DOM.
                 # A no-op when the buffer is empty.
-                _kernel_commit()
-                comp = queue[ei]
-                ei += 1
+                if not _commit_hold:
+                    _kernel_commit()
             if not comp._disposed:
                 comp._update_if_necessary()
+            if driver is not None and driver.now() >= deadline:
+                pos[k] = i
+                if _may_yield(order, pos, len(lanes)):
+                    paused = True
+                    break
     finally:
-        _pure_queue.clear()
-        _render_effect_queue.clear()
-        _effect_queue.clear()
+        if paused:
+            for queue, i in zip(order, pos):
+                del queue[:i]
+        else:
+            for queue in order:
+                queue.clear()
         _running_effects = False
     # Ship any remaining DOM ops across the bridge in one batch.
     _kernel_commit()
+    if paused:
+        _schedule_slice()
+    elif any(_lane_queues[_LANE_IDLE]):
+        _schedule_idle()
+
+
+def _may_yield(order: List[List["Computation"]], pos: List[int], pure_count: int) -> bool:
+    """Return True when the pure phase has settled and other work remains."""
+    for k, queue in enumerate(order):
+        if pos[k] < len(queue):
+            return k >= pure_count
+    return False
+
+
+def _schedule_idle() -> None:
+    global _idle_scheduled
+    if not _idle_scheduled:
+        _idle_scheduled = True
+        (_slice_driver or _AsyncioDriver()).schedule(_run_idle)
+
+
+def _run_idle() -> None:
+    global _idle_scheduled
+    _idle_scheduled = False
+    if _batch_depth == 0 and not _running_effects:
+        _flush_effects(include_idle=True)
+
+
+def _schedule_slice() -> None:
+    global _slice_scheduled
+    if not _slice_scheduled and _slice_driver is not None:
+        _slice_scheduled = True
+        _slice_driver.schedule(_run_slice)
+
+
+def _run_slice() -> None:
+    global _slice_scheduled
+    _slice_scheduled = False
+    if _batch_depth == 0 and not _running_effects:
+        _flush_effects()
+
+
+def _schedule_auto_flush() -> None:
+    global _auto_flush_scheduled
+    if not _auto_flush_scheduled and _auto_batch_driver is not None:
+        _auto_flush_scheduled = True
+        _auto_batch_driver.schedule(_run_auto_flush)
+
+
+def _run_auto_flush() -> None:
+    global _auto_flush_scheduled
+    _auto_flush_scheduled = False
+    if _batch_depth == 0 and not _running_effects:
+        _flush_effects()
+
+
+def set_time_slicing(budget_ms: Optional[float], driver: Optional[Any] = None) -> None:
+    """Opt into cooperative, time-sliced effect flushing.
+
+    With a budget set, a flush that has run for `budget_ms` stops after
+    the current effect, commits the DOM ops emitted so far, and resumes
+    the remaining effects on a later tick, so a write that touches
+    thousands of holes no longer blocks the main thread for the whole
+    update. Pure computations (`create_computed`) always settle before a
+    flush yields, render effects still finish before any user effect
+    runs, and memos stay glitch-free because they're pulled lazily.
+
+    Args:
+        budget_ms: Milliseconds of effect work per slice, or `None`
+            (the default) to flush every update to completion.
+        driver: Object with `now()` (milliseconds) and `schedule(fn)`
+            methods. Defaults to `time.perf_counter` and the asyncio
+            event loop; tests pass a
+            [`ManualDriver`][wybthon.kernel.ManualDriver].
+
+    Raises:
+        ValueError: If `budget_ms` is negative.
+    """
+    global _slice_budget, _slice_driver, _slice_scheduled
+    if budget_ms is not None and budget_ms < 0:
+        raise ValueError("time slice budget must be >= 0")
+    _slice_budget = budget_ms
+    _slice_driver = None if budget_ms is None else (driver if driver is not None else _AsyncioDriver())
+    _slice_scheduled = False
+    # Work left over from a sliced flush runs under the new setting now.
+    if any(queue for lane in _lane_queues[:_LANE_IDLE] for queue in lane):
+        _run_slice()
+
+
+def set_auto_batching(enabled: bool, driver: Optional[Any] = None) -> None:
+    """Opt into automatic batching of signal writes.
+
+    By default every write outside a [`batch`][wybthon.batch] flushes
+    its effects (and commits) before returning, so an asyncio callback
+    that sets ten signals pays for ten flushes. With automatic batching
+    on, such a write schedules a single flush for the next tick instead,
+    and every write made before it fires joins that flush. Memos are
+    pulled lazily, so reading one right after a write already sees the
+    new value; only effects and holes wait. An explicit `batch` still
+    flushes when it exits, and [`flush_sync`][wybthon.reactivity.flush_sync]
+    flushes on demand.
+
+    Args:
+        enabled: `True` to schedule flushes, `False` (the default) to
+            flush every write synchronously.
+        driver: Object with a `schedule(fn)` method. Defaults to the
+            asyncio event loop's `call_soon`; tests pass a
+            [`ManualDriver`][wybthon.kernel.ManualDriver].
+    """
+    global _auto_batch_driver, _auto_flush_scheduled
+    _auto_batch_driver = (driver if driver is not None else _AsyncioDriver()) if enabled else None
+    _auto_flush_scheduled = False
+    # A flush that was waiting for the old driver runs now.
+    if any(queue for lane in _lane_queues[:_LANE_IDLE] for queue in lane):
+        _run_effects_if_idle()
+
+
+class _AsyncioDriver:
+    """Resumes sliced flushes on the asyncio loop, timed by `perf_counter`."""
+
+    def now(self) -> float:
+        return time.perf_counter() * 1000.0
+
+    def schedule(self, fn: Callable[[], None]) -> None:
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop (e.g., synchronous test code): queue on the
+            # policy loop so the slice runs once it starts.
+            try:
+                loop = asyncio.get_event_loop()
+            except Exception:
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+        loop.call_soon(fn)
 
 
 # ---------------------------------------------------------------------------
@@ -365,6 +601,21 @@ class Owner:
 # ---------------------------------------------------------------------------
 
 
+def _swap_remove_observer(source: Any, j: int) -> None:
+    """Unlink the observer whose pair starts at `j` in `source._observers`.
+
+    The last pair moves into the hole in O(1), and the moved observer's
+    back-index (the slot after `source` in its `_sources`) follows it.
+    """
+    obs = source._observers
+    last_slot = obs.pop()
+    last = obs.pop()
+    if j < len(obs):
+        obs[j] = last
+        obs[j + 1] = last_slot
+        last._sources[last_slot + 1] = j
+
+
 class Computation(Owner):
     """Reactive computation that tracks sources and re-runs when they change.
 
@@ -376,22 +627,44 @@ class Computation(Owner):
 
     Attributes:
         _fn: The callback executed by `_update()`.
-        _sources: Sources (signals or memos) read during the last run.
-            An insertion-ordered dict used as an ordered set, allocated
-            lazily on the first tracked read.
+        _sources: Sources (signals or memos) read during the last run,
+            in first-read order and without duplicates; allocated lazily
+            on the first tracked read. Stored flat as ``[source, slot,
+            ...]`` pairs, where ``slot`` is the index of our pair in that
+            source's `_observers`, so either end unlinks an edge in O(1).
+        _src_index: While running, the end of the leading `_sources`
+            pairs the current run has re-read in the same order (-1 when
+            idle).
+        _src_end: While running, the length of `_sources` the previous
+            run left; sources first read this run are appended past it.
+        _src_pos: While running, once a read leaves the in-order path,
+            the position of each source in `_sources`, so checking a
+            read against the sources already linked is O(1); `None`
+            otherwise.
         _state: One of `_CLEAN` / `_CHECK` / `_DIRTY`.
         _is_effect: True for effects (scheduled in the effects phase).
         _is_memo: True for memos (carry a value and observers).
+        _lane: Fixed priority lane for effects created with `priority=`,
+            or `None` to take the lane of whichever update marks it stale.
+        _queued_lane: The lane the effect was last queued in; for other
+            computations, the most urgent lane they were marked stale in.
+        _observers: Computations reading this memo, as flat
+            ``[computation, slot, ...]`` pairs mirroring `_sources`.
     """
 
     __slots__ = (
         "_fn",
         "_sources",
+        "_src_index",
+        "_src_end",
+        "_src_pos",
         "_state",
         "_is_effect",
         "_is_render",
         "_is_pure",
         "_is_memo",
+        "_lane",
+        "_queued_lane",
         "_value",
         "_observers",
         "_equals",
@@ -407,49 +680,121 @@ class Computation(Owner):
         is_memo: bool = False,
         value: Any = None,
         equals: Any = _DEFAULT_EQUALS,
+        lane: Optional[int] = None,
     ) -> None:
         super().__init__()
         self._fn = fn
-        self._sources: Optional[Dict[Any, None]] = None
+        self._sources: Optional[List[Any]] = None
+        self._src_index = -1
+        self._src_end = 0
+        self._src_pos: Optional[Dict[Any, int]] = None
         self._state: int = _DIRTY
         self._is_effect = is_effect
         self._is_render = is_render
         self._is_pure = is_pure
         self._is_memo = is_memo
+        self._lane = lane
+        self._queued_lane = _LANE_NORMAL
         self._value: Any = value
-        self._observers: Optional[Dict[Computation, None]] = None
+        self._observers: Optional[List[Any]] = None
         self._equals = equals
 
     # -- source side (memos act as sources for other computations) ----------
 
-    def _add_observer(self, comp: "Computation") -> None:
+    def _add_observer(self, comp: "Computation", slot: int) -> int:
         obs = self._observers
         if obs is None:
-            self._observers = {comp: None}
-        else:
-            obs[comp] = None
+            self._observers = [comp, slot]
+            return 0
+        obs.append(comp)
+        obs.append(slot)
+        return len(obs) - 2
 
-    def _remove_observer(self, comp: "Computation") -> None:
-        obs = self._observers
-        if obs is not None:
-            obs.pop(comp, None)
+    def _remove_observer(self, j: int) -> None:
+        _swap_remove_observer(self, j)
 
     # -- observer side -------------------------------------------------------
 
     def _add_source(self, source: Any) -> None:
+        # Re-runs usually read the same sources in the same order: each read
+        # that matches the previous run's source at the cursor just moves
+        # the cursor, leaving the edge in place. Other reads are linked
+        # right away (a write to them during the run must still re-dirty
+        # us) and appended past the previous run's sources; a re-read of a
+        # not-yet-reached old source moves its pair there, leaving a None
+        # hole. `_finish_sources` then unlinks what's left and closes the gap.
+        # Off the in-order path, `_src_pos` finds a source's pair without
+        # scanning `_sources` (a wide first run would otherwise be O(n^2)).
         srcs = self._sources
         if srcs is None:
-            self._sources = {source: None}
-            source._add_observer(self)
-        elif source not in srcs:
-            srcs[source] = None
-            source._add_observer(self)
+            srcs = self._sources = []
+        i = self._src_index
+        end = self._src_end
+        n = len(srcs)
+        if n == end and i < n and srcs[i] is source:
+            self._src_index = i + 2
+            return
+        pos = self._src_pos
+        if pos is None:
+            pos = self._src_pos = {srcs[q]: q for q in range(0, n, 2) if srcs[q] is not None}
+        p = pos.get(source)
+        if p is not None:
+            if p < i or p >= end:
+                return
+            slot = srcs[p + 1]
+            srcs[p] = None
+            source._observers[slot + 1] = n
+            srcs.append(source)
+            srcs.append(slot)
+            pos[source] = n
+            return
+        srcs.append(source)
+        srcs.append(source._add_observer(self, n))
+        pos[source] = n
+
+    def _finish_sources(self) -> None:
+        """Unlink the sources the run did not re-read and close the gap."""
+        self._src_pos = None
+        srcs = self._sources
+        if srcs is None:
+            return
+        i = self._src_index
+        n = len(srcs)
+        if i == n:
+            return
+        end = self._src_end
+        for p in range(i, end, 2):
+            src = srcs[p]
+            if src is not None:
+                src._remove_observer(srcs[p + 1])
+        if end > i:
+            shift = end - i
+            for q in range(end, n, 2):
+                srcs[q]._observers[srcs[q + 1] + 1] = q - shift
+            del srcs[i:end]
+
+    def _drop_source(self, p: int) -> None:
+        """Forget the disposed source at `p` without unlinking it (it is going away)."""
+        self._src_pos = None
+        srcs = self._sources
+        for q in range(p + 2, len(srcs), 2):
+            src = srcs[q]
+            if src is not None:
+                src._observers[srcs[q + 1] + 1] = q - 2
+        del srcs[p : p + 2]
+        if p < self._src_index:
+            self._src_index -= 2
+        if p < self._src_end:
+            self._src_end -= 2
 
     def _clear_sources(self) -> None:
+        self._src_pos = None
         srcs = self._sources
         if srcs:
-            for src in srcs:
-                src._remove_observer(self)
+            for p in range(0, len(srcs), 2):
+                src = srcs[p]
+                if src is not None:
+                    src._remove_observer(srcs[p + 1])
             srcs.clear()
 
     # -- scheduling ----------------------------------------------------------
@@ -460,23 +805,61 @@ class Computation(Owner):
         On the first transition away from CLEAN we enqueue effects and push
         a CHECK marker to observers. Subsequent escalations (CHECK -> DIRTY)
         don't need to re-notify observers, which are already marked.
+
+        Effects queue in their fixed lane, else in the current update's
+        lane. An effect already queued in a less urgent lane is queued
+        again in the more urgent one, whether or not its state rises;
+        whichever entry runs first leaves it CLEAN, so the other is a
+        no-op. A memo already stale from a less urgent update passes the
+        more urgent lane on to its observers the same way.
         """
+        global _enqueued
         if self._disposed:
             return
         if self._state < state:
             was_clean = self._state == _CLEAN
             self._state = state
             if was_clean:
-                if self._is_effect:
+                if not self._is_effect:
+                    self._queued_lane = _update_lane
+                else:
+                    # `_enqueue`, inlined: this runs once per stale effect.
+                    lane = self._lane
+                    if lane is None:
+                        lane = _update_lane
+                    _enqueued += 1
+                    self._queued_lane = lane
+                    queues = _lane_queues[lane]
                     if self._is_pure:
-                        _pure_queue.append(self)
+                        queues[_PHASE_PURE].append(self)
                     elif self._is_render:
-                        _render_effect_queue.append(self)
+                        queues[_PHASE_RENDER].append(self)
                     else:
-                        _effect_queue.append(self)
+                        queues[_PHASE_USER].append(self)
                 if self._observers:
-                    for o in list(self._observers):
+                    for o in self._observers[::2]:
                         o._stale(_CHECK)
+                return
+        if _update_lane < self._queued_lane:
+            if not self._is_effect:
+                self._queued_lane = _update_lane
+                if self._observers:
+                    for o in self._observers[::2]:
+                        o._stale(_CHECK)
+            elif self._lane is None:
+                self._enqueue(_update_lane)
+
+    def _enqueue(self, lane: int) -> None:
+        global _enqueued
+        _enqueued += 1
+        self._queued_lane = lane
+        queues = _lane_queues[lane]
+        if self._is_pure:
+            queues[_PHASE_PURE].append(self)
+        elif self._is_render:
+            queues[_PHASE_RENDER].append(self)
+        else:
+            queues[_PHASE_USER].append(self)
 
     def _update_if_necessary(self) -> None:
         """Bring this node up to date by pulling sources (glitch-free).
@@ -492,7 +875,9 @@ class Computation(Owner):
         if self._state == _CHECK:
             srcs = self._sources
             if srcs:
-                for src in list(srcs):
+                for src in srcs[::2]:
+                    if src is None:
+                        continue
                     src._update_if_necessary()
                     if self._state == _DIRTY:
                         break
@@ -524,8 +909,10 @@ class Computation(Owner):
         """Re-execute the tracked function, refreshing its dependency set.
 
         Disposes child owners and runs cleanups before each re-run so that
-        conditional effects don't leak. The previous dependency edges are
-        torn down and rebuilt while the body executes under this owner.
+        conditional effects don't leak. Dependency edges are diffed against
+        the previous run by read position: edges the body reads again in
+        the same order stay linked, and only sources that were dropped or
+        newly read are unlinked or linked.
 
         Exceptions raised by effect bodies are routed to the nearest
         ancestor error handler (`ErrorBoundary` / `catch_error`); when no
@@ -535,7 +922,14 @@ class Computation(Owner):
             return
         self._dispose_children()
         self._run_cleanups()
-        self._clear_sources()
+        # Re-entered from its own body (a write to a dependency flushed
+        # effects synchronously): settle the outer run's reads first, and
+        # let the outer run only add sources once the inner one is done.
+        reentered = self._src_index >= 0
+        if reentered:
+            self._finish_sources()
+        self._src_index = 0
+        self._src_end = len(self._sources or ())
         global _current_owner, _current_observer
         prev_owner = _current_owner
         prev_obs = _current_observer
@@ -550,18 +944,27 @@ class Computation(Owner):
         finally:
             _current_owner = prev_owner
             _current_observer = prev_obs
+            self._finish_sources()
+            if reentered:
+                self._src_index = self._src_end = len(self._sources or ())
+            else:
+                self._src_index = -1
         if self._is_memo:
             if _changed(self._equals, self._value, new_value):
                 self._value = new_value
                 # A real value change escalates observers from CHECK to
                 # DIRTY so they recompute; an unchanged value leaves them
-                # CHECK (and they may resolve to CLEAN without work).
+                # CHECK (and they may resolve to CLEAN without work). A
+                # CLEAN observer is the one running and reading us now.
                 if self._observers:
-                    for o in self._observers:
-                        o._state = _DIRTY
+                    for o in self._observers[::2]:
+                        if o._state == _CHECK:
+                            o._state = _DIRTY
 
     def _read(self) -> Any:
         """Read a memo's value: ensure it's current, then subscribe the reader."""
+        if _transition_running:
+            return _transition_memo(self)
         self._update_if_necessary()
         obs = _current_observer
         if obs is not None and obs is not self and not self._disposed:
@@ -579,10 +982,8 @@ class Computation(Owner):
         self._clear_sources()
         obs = self._observers
         if obs:
-            for o in list(obs):
-                o_srcs = o._sources
-                if o_srcs is not None:
-                    o_srcs.pop(self, None)
+            for j in range(0, len(obs), 2):
+                obs[j]._drop_source(obs[j + 1])
             obs.clear()
         super().dispose()
 
@@ -610,20 +1011,22 @@ class Signal(Generic[T]):
 
     def __init__(self, value: T, *, equals: Any = _DEFAULT_EQUALS) -> None:
         self._value: T = value
-        self._observers: Optional[Dict[Computation, None]] = None
+        # Flat ``[computation, slot, ...]`` pairs; ``slot`` is the index of
+        # this signal's pair in that computation's `_sources`.
+        self._observers: Optional[List[Any]] = None
         self._equals = equals
 
-    def _add_observer(self, comp: "Computation") -> None:
+    def _add_observer(self, comp: "Computation", slot: int) -> int:
         obs = self._observers
         if obs is None:
-            self._observers = {comp: None}
-        else:
-            obs[comp] = None
+            self._observers = [comp, slot]
+            return 0
+        obs.append(comp)
+        obs.append(slot)
+        return len(obs) - 2
 
-    def _remove_observer(self, comp: "Computation") -> None:
-        obs = self._observers
-        if obs is not None:
-            obs.pop(comp, None)
+    def _remove_observer(self, j: int) -> None:
+        _swap_remove_observer(self, j)
 
     def _update_if_necessary(self) -> None:
         """Source-interface no-op; a signal's value is always current."""
@@ -642,30 +1045,40 @@ class Signal(Generic[T]):
         obs = _current_observer
         if obs is not None:
             obs._add_source(self)
+        if _transition_running:
+            return cast(T, _transition_value(self))
         return self._value
 
     def peek(self) -> T:
         """Return the current value without subscribing the active computation."""
+        if _transition_running:
+            return cast(T, _transition_value(self))
         return self._value
 
     def set(self, value: T) -> None:
-        """Write a new value and synchronously notify observers if it changed.
+        """Write a new value and notify observers if it changed.
 
         Equality is determined by the `equals` policy passed to the
         constructor (default: `is` then `==`, with `equals=False` to
-        bypass the check entirely). Outside a [`batch`][wybthon.batch],
-        dependent memos become readable immediately and effects run before
-        this call returns.
+        bypass the check entirely). Dependent memos see the new value
+        as soon as this returns. Effects, outside a [`batch`][wybthon.batch],
+        run before it returns too, unless
+        [`set_auto_batching`][wybthon.reactivity.set_auto_batching] is
+        on: then they run in one flush scheduled for the next tick, and
+        [`flush_sync`][wybthon.reactivity.flush_sync] runs them now.
 
         Args:
             value: The new value to store.
         """
+        if _transition_running:
+            _transition_write(self, value)
+            return
         if not _changed(self._equals, self._value, value):
             return
         self._value = value
         observers = self._observers
         if observers:
-            for o in list(observers):
+            for o in observers[::2]:
                 o._stale(_DIRTY)
             _run_effects_if_idle()
 
@@ -949,6 +1362,8 @@ class _Computed(Generic[T]):
 
     def peek(self) -> T:
         """Return the current (recomputed if stale) value without subscribing."""
+        if _transition_running:
+            return cast(T, _transition_memo(self._comp))
         self._comp._update_if_necessary()
         return cast(T, self._comp._value)
 
@@ -1020,21 +1435,30 @@ class _Batch:
 
     Returned by [`batch()`][wybthon.batch] when called with no arguments.
     Increments a depth counter on `__enter__` and flushes pending
-    effects exactly once when the outermost batch exits.
+    effects exactly once when the outermost batch exits. With a lane,
+    computations marked stale inside the block queue in that lane.
     """
 
+    def __init__(self, lane: Optional[int] = None) -> None:
+        self._lane = lane
+        self._prev_lane = _LANE_NORMAL
+
     def __enter__(self) -> None:
-        global _batch_depth
+        global _batch_depth, _update_lane
         _batch_depth += 1
+        self._prev_lane = _update_lane
+        if self._lane is not None:
+            _update_lane = self._lane
 
     def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        global _batch_depth
+        global _batch_depth, _update_lane
+        _update_lane = self._prev_lane
         _batch_depth -= 1
         if _batch_depth == 0:
             _flush_effects()
 
 
-def batch(fn: Optional[Callable[[], T]] = None) -> Union[T, _Batch]:
+def batch(fn: Optional[Callable[[], T]] = None, *, priority: Optional[str] = None) -> Union[T, _Batch]:
     """Batch signal updates so dependent effects flush once at the end.
 
     Two call shapes are supported:
@@ -1054,27 +1478,77 @@ def batch(fn: Optional[Callable[[], T]] = None) -> Union[T, _Batch]:
     Effects are flushed synchronously when the outermost batch exits,
     matching SolidJS semantics.
 
+    A `priority` tags every computation the batch marks stale. Within
+    each flush phase, `"user-blocking"` work runs before `"normal"`
+    work, while `"idle"` work waits for a later event-loop tick:
+
+    ```python
+    with batch(priority="idle"):
+        set_rows(fresh_rows)  # re-renders after more urgent updates
+    ```
+
     Args:
         fn: Optional zero-arg callable. When omitted, returns a context
             manager.
+        priority: `"user-blocking"`, `"normal"`, or `"idle"`. Defaults to
+            the enclosing batch's priority (`"normal"` at top level).
 
     Returns:
         Either a `_Batch` context manager (when `fn is None`) or the
         return value of `fn`.
+
+    Raises:
+        ValueError: If `priority` is not a known lane.
     """
+    lane = None if priority is None else _lane_index(priority)
     if fn is None:
-        return _Batch()
-    global _batch_depth
+        return _Batch(lane)
+    global _batch_depth, _update_lane
     _batch_depth += 1
+    prev_lane = _update_lane
+    if lane is not None:
+        _update_lane = lane
     try:
         result = fn()
     finally:
+        _update_lane = prev_lane
         _batch_depth -= 1
         if _batch_depth == 0:
             _flush_effects()
     return result
 
 
+def flush_sync(fn: Optional[Callable[[], T]] = None) -> Optional[T]:
+    """Run `fn`, then flush its effects before returning.
+
+    The escape hatch from [`set_auto_batching`][wybthon.reactivity.set_auto_batching]:
+    writes made inside `fn` (and any still waiting for a scheduled
+    flush) have run their effects and committed their DOM ops by the
+    time `flush_sync` returns. Inside a batch or a flush the work joins
+    the enclosing one, as with [`batch`][wybthon.batch].
+
+    Args:
+        fn: Optional zero-arg callable making the writes. Omit it to
+            just flush pending work.
+
+    Returns:
+        Whatever `fn` returns, or `None`.
+
+    Example:
+        ```python
+        set_auto_batching(True)
+        flush_sync(lambda: set_open(True))
+        # The panel's holes have run and its DOM ops are committed here.
+        ```
+    """
+    if fn is None:
+        if _batch_depth == 0 and not _running_effects:
+            _flush_effects()
+        return None
+    with _Batch():
+        return fn()
+
+
 def untrack(fn: Callable[[], T]) -> T:
     """Run `fn` without tracking any signal reads.
 
@@ -1108,6 +1582,202 @@ def untrack(fn: Callable[[], T]) -> T:
         _current_observer = prev
 
 
+# ---------------------------------------------------------------------------
+# Transitions
+#
+# A transition forks the graph. Signal writes made inside one land in a
+# shadow layer instead of the live value: reads inside the transition see
+# the shadow values (memos recompute against them, untracked, so live
+# dependency edges are left alone), while holes, effects, and event
+# handlers keep running against the live graph. Resource source watchers
+# downstream of a shadowed write re-run inside the transition, so their
+# fetches start at once and the transition waits for them. When every
+# such fetch has settled, the shadow values are written for real in one
+# batch and the resulting DOM ops ship in a single commit.
+# ---------------------------------------------------------------------------
+
+
+class _Transition:
+    """Shadow state of the in-flight transition."""
+
+    __slots__ = ("values", "memos", "watchers", "resources")
+
+    def __init__(self) -> None:
+        # Signal -> shadow value, in first-write order.
+        self.values: Dict[Signal[Any], Any] = {}
+        # Memo -> value recomputed against `values`; cleared on every write.
+        self.memos: Dict[Computation, Any] = {}
+        # Resources whose source may have changed, awaiting a refetch.
+        self.watchers: Dict["Resource[Any]", None] = {}
+        # Resource -> version of the fetch the transition waits on.
+        self.resources: Dict["Resource[Any]", int] = {}
+
+
+_transition: Optional[_Transition] = None
+_transition_running: bool = False
+_transition_pending: Signal[bool] = Signal(False)
+# Nonzero while a transition's writes flush: user effects don't commit
+# between each other, so the whole update lands in one commit.
+_commit_hold: int = 0
+
+
+def _transition_value(sig: Signal[Any]) -> Any:
+    values = _transition.values
+    if sig in values:
+        return values[sig]
+    return sig._value
+
+
+def _transition_write(sig: Signal[Any], value: Any) -> None:
+    t = _transition
+    assert t is not None
+    if not _changed(sig._equals, _transition_value(sig), value):
+        return
+    t.values[sig] = value
+    t.memos.clear()
+    # Walk the live graph downstream of `sig` for resource watchers.
+    # Other effects just wait: they see the value when it commits.
+    stack: List[Any] = [sig]
+    seen: Set[Computation] = set()
+    while stack:
+        observers = stack.pop()._observers
+        if not observers:
+            continue
+        for o in observers[::2]:
+            if o in seen:
+                continue
+            seen.add(o)
+            if o._is_memo:
+                stack.append(o)
+            else:
+                resource = getattr(o._fn, "_wyb_resource", None)
+                if resource is not None:
+                    t.watchers[resource] = None
+
+
+def _transition_memo(comp: Computation) -> Any:
+    """Return a memo's value as of the shadow layer, without tracking."""
+    global _current_owner, _current_observer
+    memos = _transition.memos
+    if comp in memos:
+        return memos[comp]
+    if comp._disposed:
+        return comp._value
+    prev_owner = _current_owner
+    prev_obs = _current_observer
+    _current_owner = None
+    _current_observer = None
+    try:
+        value = comp._fn()
+    finally:
+        _current_owner = prev_owner
+        _current_observer = prev_obs
+    memos[comp] = value
+    return value
+
+
+def _run_in_transition(t: _Transition, fn: Callable[[], Any]) -> None:
+    """Run `fn` against `t`'s shadow layer, then commit `t` if it has settled."""
+    global _transition_running, _current_observer, _batch_depth
+    outer = _transition_running
+    prev_obs = _current_observer
+    _transition_running = True
+    _current_observer = None
+    # Shadow writes queue nothing, and a batch exiting inside `fn` must
+    # not flush live effects while reads still see the shadow layer.
+    _batch_depth += 1
+    try:
+        fn()
+        while t.watchers:
+            resource = next(iter(t.watchers))
+            del t.watchers[resource]
+            resource._transition_refetch()
+    finally:
+        _batch_depth -= 1
+        _current_observer = prev_obs
+        _transition_running = outer
+        t.memos.clear()
+    if outer:
+        return
+    if not t.resources:
+        _commit_transition(t)
+    elif not _transition_pending.peek():
+        _transition_pending.set(True)
+
+
+def _commit_transition(t: _Transition) -> None:
+    """Write `t`'s shadow values for real and flush them as one update."""
+    global _transition, _commit_hold
+    if _transition is t:
+        _transition = None
+    _commit_hold += 1
+    try:
+        with _Batch():
+            for sig, value in t.values.items():
+                sig.set(value)
+            _transition_pending.set(False)
+    finally:
+        _commit_hold -= 1
+    _kernel_commit()
+
+
+def start_transition(fn: Callable[[], Any]) -> None:
+    """Run `fn` as a transition: apply its writes once their data has loaded.
+
+    Signal writes inside `fn` go to a shadow copy of the graph. Reads
+    inside `fn` see the new values and memos recompute against them,
+    but the rest of the app keeps rendering the current state and stays
+    interactive. Resources whose source depends on a written signal
+    start fetching straight away; once every such fetch has settled,
+    all the writes (and the fetched data) apply together and the DOM
+    updates in a single commit. With nothing to wait for, that happens
+    before `start_transition` returns.
+
+    Starting a transition while one is pending joins it. Writes made
+    outside the transition apply immediately as usual; where both touch
+    the same signal, the transition's value wins when it commits.
+
+    Args:
+        fn: Zero-arg callable making the writes. Its reads are untracked.
+
+    Example:
+        ```python
+        pending, start = use_transition()
+        user = create_resource(user_id, load_user)
+
+        def on_select(uid):
+            start(lambda: set_user_id(uid))  # old profile stays up until the new one loads
+        ```
+    """
+    global _transition
+    t = _transition
+    if t is None:
+        t = _transition = _Transition()
+    _run_in_transition(t, fn)
+
+
+def use_transition() -> Tuple[Callable[[], bool], Callable[[Callable[[], Any]], None]]:
+    """Return `(pending, start)` for driving updates through transitions.
+
+    `pending` is a tracked getter that is `True` while a transition is
+    waiting on data; `start` is [`start_transition`][wybthon.start_transition].
+
+    Example:
+        ```python
+        pending, start = use_transition()
+        span(lambda: "Loading..." if pending() else "")
+        button("Next", on_click=lambda e: start(lambda: set_page(page() + 1)))
+        ```
+    """
+
+    def pending() -> bool:
+        return _transition_pending.get()
+
+    pending.peek = _transition_pending.peek  # type: ignore[attr-defined]
+    pending._wyb_getter = True  # type: ignore[attr-defined]
+    return pending, start_transition
+
+
 # ---------------------------------------------------------------------------
 # Async resource
 # ---------------------------------------------------------------------------
@@ -1160,6 +1830,8 @@ class Resource(Generic[R]):
         source: Optional[Callable[[], Any]] = None,
         *,
         initial_value: Any = _MISSING,
+        cache: Optional["ResourceCache"] = None,
+        key: Any = None,
     ) -> None:
         import asyncio
         import inspect
@@ -1189,9 +1861,16 @@ class Resource(Generic[R]):
         self._loading: Signal[bool] = Signal(False)
         self._state: Signal[str] = Signal("ready" if has_initial else "unresolved")
         self._has_value: bool = has_initial
+        # Source value a transition already fetched for, so the watcher
+        # doesn't refetch when that transition commits the same value.
+        self._transition_source: Any = _MISSING
+        self._cache = cache
+        self._cache_name: Any = key if key is not None else fetcher
+        # Cache key of the value currently shown or being fetched.
+        self._cache_key: Any = None
 
         if source is None:
-            self.refetch()
+            self._refetch_with(None)
         else:
             self._setup_source_tracking()
 
@@ -1233,6 +1912,8 @@ class Resource(Generic[R]):
     def _register_with_suspense(self) -> None:
         if self._state.peek() != "pending":
             return
+        if self._cache is not None and self._adopt_cached():
+            return
         owner = _current_owner
         if owner is None:
             return
@@ -1240,6 +1921,24 @@ class Resource(Generic[R]):
         if collector is not None:
             collector.register(self)
 
+    def _adopt_cached(self) -> bool:
+        """Show data the cache already holds for our pending key.
+
+        A shared fetch fills the cache before each waiting resource's
+        task resumes; a read in between takes the value here rather than
+        suspending.
+        """
+        entry = self._cache._hit(self._cache_key)
+        if entry is None:
+            return False
+        with _Batch():
+            self._has_value = True
+            self._data.set(entry.value)
+            self._error.set(None)
+            self._loading.set(False)
+            self._state.set("ready")
+        return True
+
     # -- writing ------------------------------------------------------------
 
     def mutate(self, value: Union[R, Callable[[Optional[R]], R]]) -> Optional[R]:
@@ -1278,55 +1977,113 @@ class Resource(Generic[R]):
         def watcher() -> None:
             assert self._source is not None
             value = self._source()
+            fetched = self._transition_source
+            self._transition_source = _MISSING
             if value is None or value is False:
                 return
+            if fetched is not _MISSING and fetched == value:
+                return
             self._refetch_with(value)
 
+        watcher._wyb_resource = self  # type: ignore[attr-defined]
         effect(watcher)
 
-    async def _run(self, current_version: int, controller: Any, source_value: Any) -> None:
+    def _transition_refetch(self) -> None:
+        """Refetch against a transition's shadow values, if the source changed."""
+        assert self._source is not None
+        value = self._source()
+        if value is None or value is False:
+            return
+        self._transition_source = value
+        self._refetch_with(value)
+
+    def _settle(self, current_version: int, fn: Callable[[], None]) -> None:
+        """Apply a finished fetch, inside the transition waiting on it if any."""
+        t = _transition
+        if t is not None and t.resources.get(self) == current_version:
+            del t.resources[self]
+            _run_in_transition(t, fn)
+        else:
+            fn()
+
+    async def _fetch(self, controller: Any, source_value: Any) -> R:
+        args: List[Any] = []
+        kwargs: Dict[str, Any] = {}
+        if self._fetcher_takes_source and self._source is not None:
+            args.append(source_value)
+        if self._fetcher_takes_signal:
+            kwargs["signal"] = getattr(controller, "signal", None)
+        coro_or_val = self._fetcher(*args, **kwargs)
+
+        if isinstance(coro_or_val, AbcAwaitable):
+            return await coro_or_val
+        return cast(R, coro_or_val)
+
+    async def _run(self, current_version: int, controller: Any, source_value: Any, cache_key: Any = None) -> None:
         try:
-            args: List[Any] = []
-            kwargs: Dict[str, Any] = {}
-            if self._fetcher_takes_source and self._source is not None:
-                args.append(source_value)
-            if self._fetcher_takes_signal:
-                kwargs["signal"] = getattr(controller, "signal", None)
-            coro_or_val = self._fetcher(*args, **kwargs)
-
-            if isinstance(coro_or_val, AbcAwaitable):
-                result = await coro_or_val
+            if self._cache is not None:
+                # Shared with every resource waiting on the same key, so no
+                # single subscriber's abort signal applies to it.
+                result = await self._cache._load(cache_key, lambda: self._fetch(None, source_value))
             else:
-                result = cast(R, coro_or_val)
+                result = await self._fetch(controller, source_value)
 
             if current_version == self._version:
-                with _Batch():
-                    self._has_value = True
-                    self._error.set(None)
-                    self._data.set(result)
-                    self._loading.set(False)
-                    self._state.set("ready")
-        except Exception as e:
+
+                def resolve() -> None:
+                    with _Batch():
+                        self._has_value = True
+                        self._error.set(None)
+                        self._data.set(result)
+                        self._loading.set(False)
+                        self._state.set("ready")
+
+                self._settle(current_version, resolve)
+        except Exception as exc:
             if current_version != self._version:
                 return
-            with _Batch():
-                self._error.set(e)
-                self._loading.set(False)
-                self._state.set("errored")
+            # `exc` is unbound when the except block ends; `reject` may run later.
+            error = exc
+
+            def reject() -> None:
+                with _Batch():
+                    self._error.set(error)
+                    self._loading.set(False)
+                    self._state.set("errored")
+
+            self._settle(current_version, reject)
 
     def refetch(self) -> None:
         """Cancel any in-flight request and start a new fetch.
 
         The resource enters `"pending"` (first fetch) or `"refreshing"`
         (data already present). Older in-flight tasks are ignored when
-        they resolve.
+        they resolve. With a cache, this always fetches (joining a
+        request already in flight for the same key) rather than serving
+        the cached value.
         """
         source_value = untrack(self._source) if self._source is not None else None
-        self._refetch_with(source_value)
+        self._refetch_with(source_value, force=True)
 
-    def _refetch_with(self, source_value: Any) -> None:
+    def _refetch_with(self, source_value: Any, force: bool = False) -> None:
         self.cancel()
         self._version += 1
+        cache = self._cache
+        cache_key = None
+        if cache is not None:
+            cache_key = cache._subscribe(self, source_value)
+            entry = None if force else cache._hit(cache_key)
+            if entry is not None:
+                # Serve the cached value now; only a stale one revalidates.
+                fresh = cache._is_fresh(entry)
+                with _Batch():
+                    self._has_value = True
+                    self._data.set(entry.value)
+                    self._error.set(None)
+                    if fresh:
+                        self._state.set("ready")
+                if fresh:
+                    return
         with _Batch():
             self._loading.set(True)
             self._error.set(None)
@@ -1335,9 +2092,11 @@ class Resource(Generic[R]):
         controller = self._make_abort_controller()
         self._abort_controller = controller
         version = self._version
+        if _transition_running:
+            _transition.resources[self] = version
 
         async def runner() -> None:
-            await self._run(version, controller, source_value)
+            await self._run(version, controller, source_value, cache_key)
 
         try:
             self._task = self._asyncio.create_task(runner())
@@ -1378,6 +2137,347 @@ class Resource(Generic[R]):
                     self._state.set("ready" if self._has_value else "unresolved")
         except Exception:
             pass
+        # A transition no longer waits on a fetch that was abandoned.
+        t = _transition
+        if t is not None and t.resources.pop(self, None) is not None:
+            if not t.resources and not _transition_running:
+                _commit_transition(t)
+
+
+class _CacheEntry:
+    """One `ResourceCache` slot: the cached value and any shared fetch in flight."""
+
+    __slots__ = ("value", "has_value", "updated", "task")
+
+    def __init__(self) -> None:
+        self.value: Any = None
+        self.has_value = False
+        self.updated = 0.0
+        self.task: Any = None
+
+
+class ResourceCache:
+    """Shared cache for resources: de-duplicated fetches and stale-while-revalidate.
+
+    Resources created with `create_resource(..., cache=cache)` share
+    entries keyed by `(key, source value)`, where `key` defaults to the
+    fetcher itself. Then:
+
+    - Concurrent fetches for one key run once; every resource waiting
+      on it gets the result.
+    - A resource whose key is cached shows the value immediately, state
+      `"ready"`, so it never triggers a [`Suspense`][wybthon.Suspense]
+      fallback. Once the value is older than `stale_time` it is still
+      shown, but the resource goes `"refreshing"` and refetches in the
+      background.
+    - Entries expire `ttl` seconds after they were fetched, and the
+      least recently used beyond `max_entries` are evicted.
+    - [`invalidate`][wybthon.ResourceCache.invalidate] drops entries by
+      key prefix and refetches the live resources showing them.
+
+    Source values must be hashable. Shared fetches receive
+    `signal=None`: one subscriber cancelling doesn't abort the request
+    for the others.
+
+    Example:
+        ```python
+        users = ResourceCache(stale_time=30, ttl=300)
+
+        user = create_resource(user_id, load_user, cache=users, key="user")
+        # elsewhere, the same user id: no second request
+        avatar_user = create_resource(user_id, load_user, cache=users, key="user")
+
+        users.invalidate("user")  # after a write: refetch every user
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = 100,
+        ttl: Optional[float] = None,
+        stale_time: float = 0.0,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Most entries kept, least recently used evicted
+                first; `None` for no limit.
+            ttl: Seconds after a fetch that its value expires and is no
+                longer served; `None` keeps values until evicted.
+            stale_time: Seconds a value is served without revalidating.
+                The default `0` revalidates on every use.
+            clock: Zero-arg function returning seconds; defaults to
+                `time.monotonic`.
+        """
+        from collections import OrderedDict
+
+        self._entries: "OrderedDict[Any, _CacheEntry]" = OrderedDict()
+        # Live resources and the key each shows; dropped with the resource.
+        self._subscribers: "weakref.WeakKeyDictionary[Resource[Any], Any]" = weakref.WeakKeyDictionary()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_time = stale_time
+        self._clock = clock if clock is not None else time.monotonic
+
+    @staticmethod
+    def _key(name: Any, source_value: Any) -> Tuple[Any, Any]:
+        return (name, source_value)
+
+    @staticmethod
+    def _matches(key: Tuple[Any, Any], prefix: Tuple[Any, ...]) -> bool:
+        """Whether `key` falls under an `invalidate` prefix `(name, *leading source items)`."""
+        if not prefix:
+            return True
+        if key[0] != prefix[0]:
+            return False
+        rest = prefix[1:]
+        if not rest:
+            return True
+        value = key[1]
+        if isinstance(value, tuple):
+            return value[: len(rest)] == rest
+        return len(rest) == 1 and value == rest[0]
+
+    def _subscribe(self, resource: Resource[Any], source_value: Any) -> Tuple[Any, ...]:
+        """Record which key `resource` now shows, and return that key."""
+        key = self._key(resource._cache_name, source_value)
+        resource._cache_key = self._subscribers[resource] = key
+        return key
+
+    def _hit(self, key: Any) -> Optional[_CacheEntry]:
+        """Return the entry for `key` if it holds an unexpired value."""
+        entry = self._entries.get(key)
+        if entry is None or not entry.has_value:
+            return None
+        if self.ttl is not None and self._clock() - entry.updated > self.ttl:
+            entry.has_value = False
+            entry.value = None
+            if entry.task is None:
+                del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _is_fresh(self, entry: _CacheEntry) -> bool:
+        return self._clock() - entry.updated <= self.stale_time
+
+    async def _load(self, key: Any, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the shared fetch for `key`, starting it if none is in flight."""
+        import asyncio
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _CacheEntry()
+        task = entry.task
+        if task is None:
+            task = entry.task = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._finish(key, entry, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Any, entry: _CacheEntry, task: Any) -> None:
+        if entry.task is not task:
+            return
+        entry.task = None
+        failed = task.cancelled() or task.exception() is not None
+        if self._entries.get(key) is not entry:
+            return
+        if failed:
+            if not entry.has_value:
+                del self._entries[key]
+            return
+        entry.value = task.result()
+        entry.has_value = True
+        entry.updated = self._clock()
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        limit = self.max_entries
+        if limit is None or len(self._entries) <= limit:
+            return
+        for key in [k for k, e in self._entries.items() if e.task is None][: len(self._entries) - limit]:
+            del self._entries[key]
+
+    def get(self, key: Tuple[Any, Any], default: Any = None) -> Any:
+        """Return the cached value for a `(key name, source value)` pair, or `default`."""
+        entry = self._hit(key)
+        return entry.value if entry is not None else default
+
+    def set(self, key: Tuple[Any, Any], value: Any) -> None:
+        """Store `value` under a `(key name, source value)` pair, as if just fetched.
+
+        Resources already showing that key keep their data until they
+        next fetch; use it to seed the cache or after an optimistic write.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _CacheEntry()
+        entry.value = value
+        entry.has_value = True
+        entry.updated = self._clock()
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def invalidate(self, prefix: Any = ()) -> int:
+        """Drop every entry matching `prefix` and refetch its resources.
+
+        Args:
+            prefix: A `key=` name alone, or a tuple `(name, *items)`
+                matching that name's entries whose source value equals
+                the single item or, for tuple source values, starts with
+                the items: `("api", "user")` matches the sources
+                `"user"` and `("user", 42)`. The default `()` matches
+                everything.
+
+        Returns:
+            How many entries were dropped.
+        """
+        if not isinstance(prefix, tuple):
+            prefix = (prefix,)
+        matches = self._matches
+        dropped = [key for key in self._entries if matches(key, prefix)]
+        for key in dropped:
+            del self._entries[key]
+        # Resources showing a dropped key refetch; an in-flight request
+        # started before the invalidation no longer counts for them.
+        stale = [r for r, key in list(self._subscribers.items()) if matches(key, prefix)]
+        for resource in stale:
+            resource.refetch()
+        return len(dropped)
+
+    def clear(self) -> None:
+        """Drop every entry without refetching anything."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._hit(key) is not None
+
+
+class BatchFetcher:
+    """Resource fetcher that batches the keys requested in one event-loop tick.
+
+    Use an instance as the fetcher of many `create_resource(source,
+    fetcher)` calls. Each resource asks for its source value; the
+    fetcher collects every key requested before the event loop moves on
+    and calls `batch_fetch(keys)` once with them (duplicates merged),
+    then hands each resource its own result:
+
+    - `batch_fetch` may be sync or async and returns either a mapping
+      from key to value or a sequence of values in `keys` order.
+    - A value that is an exception instance fails only that key's
+      resources; a key missing from a returned mapping fails with
+      `KeyError`. If `batch_fetch` raises, every key in the batch fails.
+    - A resource cancelled (`Resource.cancel`, or a source change that
+      refetches) before the batch goes out drops its key from it.
+
+    Keys must be hashable. Pair it with a
+    [`ResourceCache`][wybthon.ResourceCache] to also skip keys already
+    fetched.
+
+    Example:
+        ```python
+        async def load_users(ids):
+            rows = await api.get("/users", params={"id": ids})
+            return {row["id"]: row for row in rows}
+
+        load_user = BatchFetcher(load_users)
+
+        def row(item, index):
+            user = create_resource(lambda: item()["user_id"], load_user)
+            ...  # 200 rows mounted together make one request
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_fetch: Callable[[List[Any]], Any],
+        *,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """Wrap `batch_fetch`.
+
+        Args:
+            batch_fetch: Called with a list of distinct keys; returns
+                (or resolves to) their values as described above.
+            max_batch_size: Most keys passed to one `batch_fetch` call;
+                larger batches are split into concurrent calls. `None`
+                for no limit.
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._batch_fetch = batch_fetch
+        self.max_batch_size = max_batch_size
+        # Key -> futures of the resources waiting on it, until dispatch.
+        self._pending: Dict[Any, List[Any]] = {}
+        self._scheduled = False
+
+    async def __call__(self, key: Any) -> Any:
+        """Queue `key` for this tick's batch and return its value once the batch resolves.
+
+        Raises:
+            Exception: The key's error value, or the exception
+                `batch_fetch` raised for the whole batch.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiters = self._pending.get(key)
+        if waiters is None:
+            self._pending[key] = [waiter]
+        else:
+            waiters.append(waiter)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return await waiter
+
+    def _dispatch(self) -> None:
+        import asyncio
+
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        # Cancelling a resource cancels the future its fetch awaits right
+        # away, before its task gets to run again; drop those here.
+        batch: Dict[Any, List[Any]] = {}
+        for key, waiters in pending.items():
+            live = [w for w in waiters if not w.done()]
+            if live:
+                batch[key] = live
+        if not batch:
+            return
+        keys = list(batch)
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            chunk = keys[start : start + size]
+            asyncio.ensure_future(self._load(chunk, batch))
+
+    async def _load(self, keys: List[Any], batch: Dict[Any, List[Any]]) -> None:
+        try:
+            result = self._batch_fetch(list(keys))
+            if isinstance(result, AbcAwaitable):
+                result = await result
+            if isinstance(result, AbcMapping):
+                values = [result[key] if key in result else KeyError(key) for key in keys]
+            else:
+                values = list(result)
+                if len(values) != len(keys):
+                    raise ValueError(f"batch_fetch returned {len(values)} values for {len(keys)} keys")
+        except Exception as exc:
+            values = [exc] * len(keys)
+        for key, value in zip(keys, values):
+            for waiter in batch[key]:
+                if waiter.done():
+                    continue
+                if isinstance(value, BaseException):
+                    waiter.set_exception(value)
+                else:
+                    waiter.set_result(value)
 
 
 def create_resource(
@@ -1385,6 +2485,8 @@ def create_resource(
     fetcher: Optional[Callable[..., Awaitable[R]]] = None,
     *,
     initial_value: Any = _MISSING,
+    cache: Optional[ResourceCache] = None,
+    key: Any = None,
 ) -> Resource[R]:
     """Create an async [`Resource`][wybthon.Resource] accessor.
 
@@ -1411,6 +2513,12 @@ def create_resource(
             triggers a [`Suspense`][wybthon.Suspense] fallback; the
             first fetch runs as a `"refreshing"` state instead of
             `"pending"`, matching SolidJS's `initialValue` option.
+        cache: Optional [`ResourceCache`][wybthon.ResourceCache] shared
+            with other resources: identical requests run once and cached
+            values show immediately while revalidating.
+        key: Name for this resource's cache entries (the first element
+            of each cache key, and what `cache.invalidate(key)` matches).
+            Defaults to the fetcher function.
 
     Returns:
         A `Resource[R]`. Call it to read the data; read `.loading`,
@@ -1429,8 +2537,8 @@ def create_resource(
         ```
     """
     if fetcher is None:
-        return Resource(source_or_fetcher, initial_value=initial_value)
-    return Resource(fetcher, source=source_or_fetcher, initial_value=initial_value)
+        return Resource(source_or_fetcher, initial_value=initial_value, cache=cache, key=key)
+    return Resource(fetcher, source=source_or_fetcher, initial_value=initial_value, cache=cache, key=key)
 
 
 # ---------------------------------------------------------------------------
@@ -1599,12 +2707,19 @@ def create_signal(value: T, *, equals: Any = _DEFAULT_EQUALS) -> tuple:
         obs = _current_observer
         if obs is not None:
             obs._add_source(sig)
+        if _transition_running:
+            return _transition_value(sig)
         return sig._value
 
     getter.peek = sig.peek  # type: ignore[attr-defined]
     getter._wyb_getter = True  # type: ignore[attr-defined]
 
     def setter(new_value: Any) -> Any:
+        if _transition_running:
+            if callable(new_value):
+                new_value = new_value(_transition_value(sig))
+            _transition_write(sig, new_value)
+            return _transition_value(sig)
         if callable(new_value):
             new_value = new_value(sig._value)
         sig.set(new_value)
@@ -1648,8 +2763,15 @@ def _accepts_prev_arg(fn: Callable[..., Any]) -> bool:
     return result
 
 
-def _create_effect_impl(fn: Callable[..., Any], *, is_render: bool = False, is_pure: bool = False) -> Computation:
+def _create_effect_impl(
+    fn: Callable[..., Any],
+    *,
+    is_render: bool = False,
+    is_pure: bool = False,
+    priority: Optional[str] = None,
+) -> Computation:
     """Shared implementation for `create_effect`, `create_render_effect`, and `create_computed`."""
+    lane = None if priority is None else _lane_index(priority)
     if _accepts_prev_arg(fn):
         _prev: List[Any] = [None]
 
@@ -1660,14 +2782,14 @@ def _create_effect_impl(fn: Callable[..., Any], *, is_render: bool = False, is_p
     else:
         body = fn
 
-    comp = Computation(body, is_effect=True, is_render=is_render, is_pure=is_pure)
+    comp = Computation(body, is_effect=True, is_render=is_render, is_pure=is_pure, lane=lane)
     if _current_owner is not None:
         _current_owner._add_child(comp)
     comp._update_if_necessary()
     return comp
 
 
-def create_effect(fn: Callable[..., Any]) -> Computation:
+def create_effect(fn: Callable[..., Any], *, priority: Optional[str] = None) -> Computation:
     """Create an auto-tracking reactive effect.
 
     The effect runs immediately and re-runs whenever any signal read inside
@@ -1684,21 +2806,28 @@ def create_effect(fn: Callable[..., Any]) -> Computation:
     Args:
         fn: Zero- or one-arg callable. When it accepts an argument, the
             previous return value is forwarded.
+        priority: Lane every re-run of this effect is queued in,
+            whatever update triggers it (`"user-blocking"`, `"normal"`,
+            or `"idle"`). Defaults to the triggering update's priority;
+            see [`batch`][wybthon.batch].
 
     Returns:
         The underlying `Computation`. Call `.dispose()` to stop the effect
         manually.
 
+    Raises:
+        ValueError: If `priority` is not a known lane.
+
     Example:
         ```python
         count, set_count = create_signal(0)
         create_effect(lambda prev: (print("was", prev), count())[1])
         ```
     """
-    return _create_effect_impl(fn, is_render=False)
+    return _create_effect_impl(fn, is_render=False, priority=priority)
 
 
-def create_render_effect(fn: Callable[..., Any]) -> Computation:
+def create_render_effect(fn: Callable[..., Any], *, priority: Optional[str] = None) -> Computation:
     """Create an effect that runs in the **render phase**, before user effects.
 
     Matches SolidJS's `createRenderEffect`: within one flush, all pending
@@ -1711,11 +2840,15 @@ def create_render_effect(fn: Callable[..., Any]) -> Computation:
     Args:
         fn: Zero- or one-arg callable (the previous return value is
             forwarded when accepted, as with `create_effect`).
+        priority: Fixed lane for re-runs, as with `create_effect`.
 
     Returns:
         The underlying `Computation`.
+
+    Raises:
+        ValueError: If `priority` is not a known lane.
     """
-    return _create_effect_impl(fn, is_render=True)
+    return _create_effect_impl(fn, is_render=True, priority=priority)
 
 
 def create_computed(fn: Callable[..., Any]) -> Computation:
@@ -1773,8 +2906,8 @@ def create_reaction(on_invalidate: Callable[[], Any]) -> Callable[[Callable[[],
             pending[0] = None
             tracked()
         else:
-            # Invalidation run: sources were already cleared by
-            # ``_update``; report the change without re-tracking.
+            # Invalidation run: reading nothing unlinks every source
+            # when ``_update`` finishes; report the change untracked.
             untrack(on_invalidate)
 
     comp = Computation(body, is_effect=True)
@@ -2453,8 +3586,6 @@ def split_props(
 # Reactive list mapping primitives
 # ---------------------------------------------------------------------------
 
-_map_key_counter: int = 0
-
 
 def _run_owned_untracked(owner: "Owner", fn: Callable[[], T]) -> T:
     """Run `fn` owned by `owner` with signal tracking suppressed.
@@ -2475,9 +3606,349 @@ def _run_owned_untracked(owner: "Owner", fn: Callable[[], T]) -> T:
         _current_observer = prev_obs
 
 
+class _ListDelta:
+    """What one `map_array` recompute changed relative to its previous result.
+
+    `base` is the result list the change applies to. `placed` holds the
+    new positions (ascending) whose rows must be inserted or moved, of
+    which the positions in `inserted` are new rows; every other row is
+    already in place. `removed` holds the results of rows that left the
+    list. `For` hands this to the reconciler so a list update costs
+    DOM work proportional to the change instead of the list length; the
+    reconciler clears `base` and `removed` once applied, so a spent
+    delta keeps neither the old rows nor the old list alive.
+    """
+
+    __slots__ = ("base", "placed", "inserted", "removed")
+
+    def __init__(self, base: List[Any], placed: List[int], inserted: Set[int], removed: List[Any]) -> None:
+        self.base = base
+        self.placed = placed
+        self.inserted = inserted
+        self.removed = removed
+
+
+class _RowOwner(Owner):
+    """Scope of one `map_array` / `index_array` row, told apart for introspection."""
+
+    __slots__ = ()
+
+
+class _MappedRow:
+    """One `map_array` entry: the item's scope, signals, and mapped result."""
+
+    __slots__ = ("owner", "item_signal", "index_signal", "result")
+
+    def __init__(self, owner: _RowOwner, item_signal: Signal[Any], index_signal: Signal[int], result: Any) -> None:
+        self.owner = owner
+        self.item_signal = item_signal
+        self.index_signal = index_signal
+        self.result = result
+
+
+class _IndexSlot:
+    """One `index_array` entry: the slot's scope, item signal, and mapped result."""
+
+    __slots__ = ("owner", "item_signal", "result")
+
+    def __init__(self, owner: _RowOwner, item_signal: Signal[Any], result: Any) -> None:
+        self.owner = owner
+        self.item_signal = item_signal
+        self.result = result
+
+
+# Retired row records per record class, up to `_row_pool_limit` each.
+# Pooled records hold a disposed owner and unobserved signals cleared to
+# `None`; `_reuse_row` revives one for the next row a list maps.
+_row_pool_limit: int = 0
+_row_pools: Dict[type, List[Any]] = {}
+
+
+def set_row_pooling(limit: int) -> None:
+    """Opt into reusing the records of rows removed from mapped lists.
+
+    With a limit set, [`map_array`][wybthon.map_array] (and so `For`)
+    and [`index_array`][wybthon.index_array] (`Index`) keep up to `limit`
+    retired rows of each kind, with their owner and signals reset, and
+    hand them to the next rows they map instead of allocating new ones.
+    Lists that are repeatedly emptied and refilled then stop churning
+    the allocator.
+
+    A row is only pooled when nothing outside it still observes its
+    item or index signal. Getters and owners captured from a removed
+    row (in a pending callback, say) must not be used once it is gone,
+    since the pool may have handed them to another row.
+
+    Args:
+        limit: Rows kept per record kind; `0` (the default) turns pooling
+            off and empties the pools.
+
+    Raises:
+        ValueError: If `limit` is negative.
+    """
+    global _row_pool_limit
+    if limit < 0:
+        raise ValueError("row pool limit must be >= 0")
+    _row_pool_limit = limit
+    for pool in _row_pools.values():
+        del pool[limit:]
+
+
+def _retire_row(row: Any, *signals: Signal[Any]) -> None:
+    """Dispose a mapped row's scope, keeping its record when pooling is on."""
+    owner = row.owner
+    if owner._disposed:
+        return
+    owner.dispose()
+    # Signals a pending transition shadows would be overwritten by its commit.
+    if not _row_pool_limit or _transition is not None:
+        return
+    pool = _row_pools.setdefault(type(row), [])
+    if len(pool) >= _row_pool_limit:
+        return
+    for sig in signals:
+        if sig._observers:
+            return
+    for sig in signals:
+        sig._value = None
+    owner._context_map = None
+    owner._error_handler = None
+    row.result = None
+    pool.append(row)
+
+
+def _reuse_row(cls: type, parent: Optional[Owner]) -> Any:
+    """Pop a pooled record of `cls` with its owner revived under `parent`."""
+    pool = _row_pools.get(cls)
+    if not pool:
+        return None
+    row = pool.pop()
+    owner = row.owner
+    owner._disposed = False
+    if parent is not None:
+        parent._add_child(owner)
+    return row
+
+
+def _set_index(sig: Signal[int], index: int) -> None:
+    """Move a row's index signal, skipping the notify path when nobody reads it."""
+    if sig._value != index:
+        if sig._observers or _transition_running:
+            sig.set(index)
+        else:
+            sig._value = index
+
+
+def _key_getter(key: Union[str, Callable[[Any], Any], None]) -> Optional[Callable[[Any], Any]]:
+    """Resolve a `key=` option: a callable, or an attribute/dict-key name."""
+    if key is None or callable(key):
+        return key
+    name = key
+
+    def by_name(item: Any) -> Any:
+        return item[name] if isinstance(item, dict) else getattr(item, name)
+
+    return by_name
+
+
+class _ArrayMapper:
+    """Incremental engine behind [`map_array`][wybthon.map_array].
+
+    Each recompute trims the common prefix and suffix (identity scans run
+    in C), then matches only the changed window: for a list of the same
+    length, just the positions whose item changed; otherwise the whole
+    middle. Rows outside the window keep their entry and result without
+    any Python-level work beyond index shifts. With a `key`, rows match
+    by key instead of identity and a matched row whose item object
+    changed gets the new item through its item signal. The last change
+    set is left in `delta` for `For`.
+    """
+
+    __slots__ = ("source", "map_fn", "key_fn", "parent", "items", "keys", "rows", "results", "delta")
+
+    def __init__(
+        self,
+        source: Callable[[], Optional[List[Any]]],
+        map_fn: Callable[..., Any],
+        key: Union[str, Callable[[Any], Any], None] = None,
+    ) -> None:
+        self.source = source
+        self.map_fn = map_fn
+        self.key_fn = _key_getter(key)
+        self.parent = _current_owner
+        self.items: List[Any] = []
+        # Match keys, position for position; the items themselves when
+        # matching by identity.
+        self.keys: List[Any] = []
+        self.rows: List[_MappedRow] = []
+        self.results: List[Any] = []
+        self.delta: Optional[_ListDelta] = None
+
+    def _map(self, item: Any, index: int) -> _MappedRow:
+        row = _reuse_row(_MappedRow, self.parent) if _row_pool_limit else None
+        if row is None:
+            owner = _RowOwner()
+            if self.parent is not None:
+                self.parent._add_child(owner)
+            row = _MappedRow(owner, Signal(item), Signal(index), None)
+        else:
+            row.item_signal._value = item
+            row.index_signal._value = index
+        item_get, idx_get = row.item_signal.get, row.index_signal.get
+        row.result = _run_owned_untracked(row.owner, lambda: self.map_fn(item_get, idx_get))
+        return row
+
+    @staticmethod
+    def _refresh(
+        rows: List[_MappedRow], items: List[Any], old_items: List[Any], lo: int, hi: int, shift: int = 0
+    ) -> None:
+        """Hand the rows at `lo:hi` whose item object changed the new item.
+
+        Each row there kept its key; its old position is `i - shift`.
+        """
+        for i in compress(range(lo, hi), map(is_not, old_items[lo - shift : hi - shift], items[lo:hi])):
+            rows[i].item_signal.set(items[i])
+
+    def compute(self) -> List[Any]:
+        source_items = self.source()
+        old_items, old_keys, old_rows, old_results = self.items, self.keys, self.rows, self.results
+        if not source_items:
+            for row in old_rows:
+                _retire_row(row, row.item_signal, row.index_signal)
+            self.items, self.keys, self.rows, self.results, self.delta = [], [], [], [], None
+            return []
+
+        items = list(source_items)
+        key_fn = self.key_fn
+        keyed = key_fn is not None
+        keys = [key_fn(item) for item in items] if key_fn is not None else items
+        differ = ne if keyed else is_not
+        n_old = len(old_keys)
+        n = len(keys)
+        if not n_old:
+            rows = [self._map(item, i) for i, item in enumerate(items)]
+            self.items, self.keys, self.rows = items, keys, rows
+            self.results, self.delta = [row.result for row in rows], None
+            return self.results
+
+        lim = min(n_old, n)
+        start = next(compress(count(), map(differ, old_keys, keys)), lim)
+        if start == n_old == n:
+            if keyed:
+                self._refresh(old_rows, items, old_items, 0, n)
+            self.items, self.keys = items, keys
+            self.delta = _ListDelta(old_results, [], set(), [])
+            return old_results
+        tail = next(compress(count(), map(differ, reversed(old_keys), reversed(keys))), lim)
+        tail = min(tail, lim - start)
+        old_end = n_old - tail
+        new_end = n - tail
+
+        old_window: Any
+        new_window: Any
+        # Same-length updates: run number of each changed position. Rows
+        # between two runs never moved, so a row can only keep its DOM
+        # place if it stays inside its own run.
+        run_of: Optional[Dict[int, int]] = None
+        if n == n_old:
+            # Same length: only the positions whose key changed take part.
+            old_window = new_window = list(
+                compress(range(start, new_end), map(differ, old_keys[start:new_end], keys[start:new_end]))
+            )
+            run_of = {}
+            run = prev = -2
+            for i in new_window:
+                if i != prev + 1:
+                    run += 1
+                run_of[i] = prev = run
+        else:
+            old_window = range(start, old_end)
+            new_window = range(start, new_end)
+
+        # Key index over the window: key (or id(item)) -> old positions,
+        # consumed smallest-first so duplicates resolve stably.
+        by_key: Dict[Any, List[int]] = {}
+        for j in reversed(old_window):
+            k = old_keys[j]
+            by_key.setdefault(k if keyed else id(k), []).append(j)
+
+        window_rows: List[_MappedRow] = []
+        sources: List[int] = []
+        inserted: Set[int] = set()
+        for i in new_window:
+            item = items[i]
+            k = keys[i]
+            stack = by_key.get(k if keyed else id(k))
+            if stack:
+                j = stack.pop()
+                row = old_rows[j]
+                _set_index(row.index_signal, i)
+                if keyed and old_items[j] is not item:
+                    row.item_signal.set(item)
+                sources.append(j if run_of is None or run_of[j] == run_of[i] else -1)
+            else:
+                row = self._map(item, i)
+                inserted.add(i)
+                sources.append(-1)
+            window_rows.append(row)
+
+        removed: List[Any] = []
+        for stack in by_key.values():
+            for j in stack:
+                row = old_rows[j]
+                removed.append(row.result)
+                _retire_row(row, row.item_signal, row.index_signal)
+
+        if n == n_old:
+            rows = list(old_rows)
+            results = list(old_results)
+            for i, row in zip(new_window, window_rows):
+                rows[i] = row
+                results[i] = row.result
+            if keyed:
+                # Window rows already hold their item, so re-setting is a no-op.
+                self._refresh(rows, items, old_items, 0, n)
+        else:
+            rows = old_rows[:start] + window_rows + old_rows[old_end:]
+            results = old_results[:start] + [row.result for row in window_rows] + old_results[old_end:]
+            for i in range(new_end, n):
+                _set_index(rows[i].index_signal, i)
+            if keyed:
+                self._refresh(rows, items, old_items, 0, start)
+                self._refresh(rows, items, old_items, new_end, n, new_end - old_end)
+
+        # Matched rows on the longest increasing run of old positions keep
+        # their place; the rest of the window moves or mounts.
+        tails: List[int] = []
+        tails_at: List[int] = []
+        prev_at: List[int] = [-1] * len(sources)
+        for k, s in enumerate(sources):
+            if s == -1:
+                continue
+            pos = bisect_left(tails, s)
+            if pos == len(tails):
+                tails.append(s)
+                tails_at.append(k)
+            else:
+                tails[pos] = s
+                tails_at[pos] = k
+            prev_at[k] = tails_at[pos - 1] if pos > 0 else -1
+        stay: Set[int] = set()
+        k = tails_at[-1] if tails_at else -1
+        while k != -1:
+            stay.add(k)
+            k = prev_at[k]
+        placed = [i for k, i in enumerate(new_window) if k not in stay]
+
+        self.items, self.keys, self.rows, self.results = items, keys, rows, results
+        self.delta = _ListDelta(old_results, placed, inserted, removed)
+        return results
+
+
 def map_array(
     source: Callable[[], Optional[List[Any]]],
     map_fn: Callable[[Callable[[], Any], Callable[[], int]], T],
+    key: Union[str, Callable[[Any], Any], None] = None,
 ) -> Callable[[], List[T]]:
     """Map a reactive list with stable per-item scopes (keyed by identity).
 
@@ -2485,12 +3956,26 @@ def map_array(
     runs **once** per unique item; when an item leaves the source list,
     its reactive scope is disposed automatically.
 
+    Data that is refetched arrives as fresh objects, which identity
+    matching treats as all-new items. Pass `key` to match by a stable
+    key instead: a row whose key survives keeps its scope, and if its
+    item object changed, `item_getter()` switches to the new object (a
+    notify only happens when the new item is unequal to the old one).
+
+    Updates are incremental: the unchanged prefix and suffix of the list
+    are skipped, so appending, removing, or swapping a few items costs
+    time proportional to the change (plus a C-speed identity scan and
+    the index shifts the change causes), not a rematch of every item.
+
     Args:
         source: Zero-arg getter that returns the current list (typically
             a signal accessor).
         map_fn: Called as `map_fn(item_getter, index_getter)` for each
             unique item. `item_getter()` returns the item; `index_getter()`
             returns its current position.
+        key: Optional row key: a callable `key(item)`, or a name looked up
+            as `item[name]` on dicts and `getattr(item, name)` otherwise.
+            Keys must be hashable.
 
     Returns:
         A zero-arg getter producing the mapped list. Reading it inside a
@@ -2501,79 +3986,11 @@ def map_array(
         items, set_items = create_signal(["A", "B", "C"])
         labels = map_array(items, lambda item, idx: f"{idx()}: {item()}")
         # labels() == ["0: A", "1: B", "2: C"]
+
+        users = map_array(fetched, lambda user, idx: user()["name"], key="id")
         ```
     """
-    global _map_key_counter
-    _parent = _current_owner
-    _cache: List[Dict[str, Any]] = []
-
-    def _compute() -> List[T]:
-        global _map_key_counter
-        items = source()
-        if not items:
-            for entry in _cache:
-                entry["owner"].dispose()
-            _cache.clear()
-            return []
-
-        new_cache: List[Dict[str, Any]] = []
-        used = [False] * len(_cache)
-
-        # Identity index: id(item) -> cache positions, consumed in order
-        # so duplicate items resolve stably. Keeps matching O(n).
-        by_id: Dict[int, List[int]] = {}
-        for ci in range(len(_cache)):
-            by_id.setdefault(id(_cache[ci]["item"]), []).append(ci)
-        by_id_pos: Dict[int, int] = {}
-
-        for idx, item in enumerate(items):
-            found = -1
-            positions = by_id.get(id(item))
-            if positions is not None:
-                p = by_id_pos.get(id(item), 0)
-                while p < len(positions) and used[positions[p]]:
-                    p += 1
-                by_id_pos[id(item)] = p
-                if p < len(positions):
-                    found = positions[p]
-                    by_id_pos[id(item)] = p + 1
-
-            if found >= 0:
-                used[found] = True
-                entry = _cache[found]
-                entry["index_signal"].set(idx)
-                new_cache.append(entry)
-            else:
-                owner = Owner()
-                if _parent is not None:
-                    _parent._add_child(owner)
-
-                item_sig: Signal[Any] = Signal(item)
-                idx_sig: Signal[int] = Signal(idx)
-
-                result = _run_owned_untracked(owner, lambda: map_fn(item_sig.get, idx_sig.get))
-
-                _map_key_counter += 1
-                new_cache.append(
-                    {
-                        "item": item,
-                        "owner": owner,
-                        "result": result,
-                        "item_signal": item_sig,
-                        "index_signal": idx_sig,
-                        "key": _map_key_counter,
-                    }
-                )
-
-        for ci in range(len(_cache)):
-            if not used[ci]:
-                _cache[ci]["owner"].dispose()
-
-        _cache.clear()
-        _cache.extend(new_cache)
-        return [e["result"] for e in new_cache]
-
-    return create_memo(_compute)
+    return create_memo(_ArrayMapper(source, map_fn, key).compute)
 
 
 def index_array(
@@ -2602,13 +4019,26 @@ def index_array(
         ```
     """
     _parent = _current_owner
-    _slots: List[Dict[str, Any]] = []
+    _slots: List[_IndexSlot] = []
+
+    def _map(item: Any, index: int) -> _IndexSlot:
+        slot = _reuse_row(_IndexSlot, _parent) if _row_pool_limit else None
+        if slot is None:
+            owner = _RowOwner()
+            if _parent is not None:
+                _parent._add_child(owner)
+            slot = _IndexSlot(owner, Signal(item), None)
+        else:
+            slot.item_signal._value = item
+        item_get = slot.item_signal.get
+        slot.result = _run_owned_untracked(slot.owner, lambda: map_fn(item_get, index))
+        return slot
 
     def _compute() -> List[T]:
         items = source()
         if not items:
             for slot in _slots:
-                slot["owner"].dispose()
+                _retire_row(slot, slot.item_signal)
             _slots.clear()
             return []
 
@@ -2617,32 +4047,54 @@ def index_array(
         old_len = len(_slots)
 
         for i in range(min(old_len, new_len)):
-            _slots[i]["item_signal"].set(items_list[i])
+            _slots[i].item_signal.set(items_list[i])
 
         if new_len > old_len:
             for i in range(old_len, new_len):
-                owner = Owner()
-                if _parent is not None:
-                    _parent._add_child(owner)
-
-                item_sig: Signal[Any] = Signal(items_list[i])
-
-                # ``_run_owned_untracked`` calls the thunk synchronously within
-                # this iteration, so closing over ``i``/``item_sig`` is safe.
-                result = _run_owned_untracked(owner, lambda: map_fn(item_sig.get, i))
-
-                _slots.append({"owner": owner, "result": result, "item_signal": item_sig})
+                _slots.append(_map(items_list[i], i))
 
         elif new_len < old_len:
             for slot in _slots[new_len:]:
-                slot["owner"].dispose()
+                _retire_row(slot, slot.item_signal)
             del _slots[new_len:]
 
-        return [s["result"] for s in _slots]
+        return [s.result for s in _slots]
 
     return create_memo(_compute)
 
 
+def _selector_notify(subs_map: Dict[Any, Set["Computation"]], key: Any) -> None:
+    """Mark the computations that read `key` through a selector dirty."""
+    subs = subs_map.get(key)
+    if subs:
+        for comp in list(subs):
+            comp._stale(_DIRTY)
+
+
+def _selector_subscribe(subs_map: Dict[Any, Set["Computation"]], key: Any) -> None:
+    """Subscribe the running computation (if any) to `key` in a selector."""
+    obs = _current_observer
+    if obs is None:
+        return
+    subs = subs_map.get(key)
+    if subs is None:
+        subs = set()
+        subs_map[key] = subs
+    if obs not in subs:
+        subs.add(obs)
+        # Unsubscribe when the computation re-runs or is disposed, so the
+        # map holds only live subscribers (rows leaving a list would
+        # otherwise accumulate forever).
+        bucket = subs
+
+        def _unsubscribe(comp: "Computation" = obs, key: Any = key) -> None:
+            bucket.discard(comp)
+            if not bucket and subs_map.get(key) is bucket:
+                del subs_map[key]
+
+        obs._add_cleanup(_unsubscribe)
+
+
 def create_selector(
     source: Callable[[], Any],
 ) -> Callable[[Any], bool]:
@@ -2672,12 +4124,6 @@ def create_selector(
     _prev_key: List[Any] = [None]
     _first = [True]
 
-    def _notify(key: Any) -> None:
-        subs = _subs.get(key)
-        if subs:
-            for comp in list(subs):
-                comp._stale(_DIRTY)
-
     def _tracker() -> None:
         new_key = source()
         old_key = _prev_key[0]
@@ -2690,32 +4136,317 @@ def create_selector(
         if old_key == new_key:
             return
 
-        _notify(old_key)
-        _notify(new_key)
+        _selector_notify(_subs, old_key)
+        _selector_notify(_subs, new_key)
         _run_effects_if_idle()
 
     effect(_tracker)
 
     def is_selected(key: Any) -> bool:
-        obs = _current_observer
-        if obs is not None:
-            subs = _subs.get(key)
-            if subs is None:
-                subs = set()
-                _subs[key] = subs
-            if obs not in subs:
-                subs.add(obs)
-                # Unsubscribe when the computation re-runs or is disposed,
-                # so the map holds only live subscribers (rows leaving a
-                # list would otherwise accumulate forever).
-                bucket = subs
-
-                def _unsubscribe(comp: "Computation" = obs, key: Any = key) -> None:
-                    bucket.discard(comp)
-                    if not bucket and _subs.get(key) is bucket:
-                        del _subs[key]
-
-                obs._add_cleanup(_unsubscribe)
+        _selector_subscribe(_subs, key)
         return _prev_key[0] == key
 
     return is_selected
+
+
+def create_multi_selector(
+    source: Callable[[], Any],
+) -> Callable[[Any], bool]:
+    """Create a set-valued selection signal for multi-select.
+
+    Like [`create_selector`][wybthon.create_selector], but `source()`
+    returns a collection of selected keys (typically a `frozenset`).
+    On change the old and new selections are diffed and only the
+    computations that called `is_selected(key)` for a key that entered
+    or left the selection are notified, so toggling one row of a
+    10,000-row multi-select table re-runs one row.
+
+    Args:
+        source: Zero-arg getter returning the selected keys (a set,
+            `frozenset`, or any iterable of hashable keys; `None` means
+            nothing is selected). Write a new collection on each change:
+            a set mutated in place and written back compares equal and
+            notifies nobody.
+
+    Returns:
+        A function `is_selected(key) -> bool` that's reactive to
+        selection changes.
+
+    Example:
+        ```python
+        checked, set_checked = create_signal(frozenset())
+        is_checked = create_multi_selector(checked)
+
+        # Inside a For loop per item:
+        li({"class": lambda: "checked" if is_checked(item_id) else ""}, ...)
+
+        set_checked(lambda keys: keys ^ {item_id})  # toggle one row
+        ```
+    """
+    _subs: Dict[Any, Set["Computation"]] = {}
+    _selected: List[FrozenSet[Any]] = [frozenset()]
+    _first = [True]
+
+    def _tracker() -> None:
+        keys = source()
+        new_keys = keys if isinstance(keys, frozenset) else frozenset(keys or ())
+        old_keys = _selected[0]
+        _selected[0] = new_keys
+
+        if _first[0]:
+            _first[0] = False
+            return
+
+        changed = old_keys ^ new_keys
+        if not changed:
+            return
+        for key in changed:
+            _selector_notify(_subs, key)
+        _run_effects_if_idle()
+
+    effect(_tracker)
+
+    def is_selected(key: Any) -> bool:
+        _selector_subscribe(_subs, key)
+        return key in _selected[0]
+
+    return is_selected
+
+
+# ---------------------------------------------------------------------------
+# Signal arrays
+# ---------------------------------------------------------------------------
+
+_numpy_module: Any = _MISSING
+
+
+def _numpy() -> Any:
+    """Return the `numpy` module, or `None` when it isn't installed.
+
+    Imported on first use so apps that never create a signal array (and
+    Pyodide builds without the package) don't pay for it.
+    """
+    global _numpy_module
+    if _numpy_module is _MISSING:
+        try:
+            import numpy
+
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = None
+    return _numpy_module
+
+
+def _cell_changed(old: Any, new: Any) -> bool:
+    """Whether writing `new` over `old` changes a list-backed cell.
+
+    Matches the NumPy mask: NaN -> NaN is not a change.
+    """
+    return old is not new and old != new and (old == old or new == new)
+
+
+class SignalArray:
+    """A fixed-length array of reactive numeric cells.
+
+    Returned by [`create_signal_array`][wybthon.create_signal_array].
+    Values live in one NumPy array (or a plain list without NumPy);
+    a cell only gets a subscription node the first time a computation
+    reads it, so thousands of cells cost one array plus one small node
+    per *watched* cell. Bulk writes compare old and new values in one
+    vectorized pass and notify only the readers of cells that changed,
+    all in a single flush.
+    """
+
+    __slots__ = ("_data", "_np", "_cells", "_all")
+
+    def __init__(self, values: Any) -> None:
+        np = _numpy()
+        self._np = np
+        if np is not None:
+            data = np.array(values)
+            if data.ndim != 1:
+                raise ValueError("signal arrays must be one-dimensional")
+            self._data: Any = data
+        else:
+            self._data = list(values)
+        # Index -> subscription node for cells a computation has read.
+        self._cells: Dict[int, Signal[None]] = {}
+        # Readers of the whole array.
+        self._all: Signal[None] = Signal(None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _index(self, i: int) -> int:
+        n = len(self._data)
+        i = int(i)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("signal array index out of range")
+        return i
+
+    def get(self, i: int) -> Any:
+        """Return cell `i` and subscribe the active computation to it."""
+        i = self._index(i)
+        obs = _current_observer
+        if obs is not None:
+            cell = self._cells.get(i)
+            if cell is None:
+                cell = self._cells[i] = Signal(None)
+            obs._add_source(cell)
+        return self._data[i]
+
+    __getitem__ = get
+
+    def peek(self, i: int) -> Any:
+        """Return cell `i` without subscribing."""
+        return self._data[self._index(i)]
+
+    def __call__(self) -> Any:
+        """Return the whole array (tracked: any change re-runs the reader).
+
+        The array is the live storage; treat it as read-only.
+        """
+        obs = _current_observer
+        if obs is not None:
+            obs._add_source(self._all)
+        return self._data
+
+    def set(self, i: int, value: Any) -> None:
+        """Write one cell, notifying its readers if the value changed."""
+        self.set_many([i], [value])
+
+    def set_many(self, indices: Any, values: Any) -> None:
+        """Write `values[k]` to cell `indices[k]` for every `k`.
+
+        Args:
+            indices: Sequence (or integer array) of cell indices.
+            values: Sequence (or array) of the same length.
+
+        Raises:
+            IndexError: If any index is out of range; nothing is written.
+        """
+        np = self._np
+        data = self._data
+        if np is not None:
+            n = len(data)
+            idx = np.asarray(indices, dtype=np.intp)
+            if idx.size and (idx.min() < -n or idx.max() >= n):
+                raise IndexError("signal array index out of range")
+            idx = np.where(idx < 0, idx + n, idx)
+            new = np.asarray(values, dtype=data.dtype)
+            changed = idx[self._changed_mask(data[idx], new)]
+            data[idx] = new
+            self._notify(changed.tolist())
+            return
+        # Check every index before writing, as the NumPy path does.
+        idx_list = [self._index(i) for i in indices]
+        changed_list = []
+        for i, value in zip(idx_list, values):
+            if _cell_changed(data[i], value):
+                data[i] = value
+                changed_list.append(i)
+        self._notify(changed_list)
+
+    def update(self, new_values: Any) -> None:
+        """Replace every cell, notifying only readers of changed cells.
+
+        Args:
+            new_values: A sequence or array of the same length.
+
+        Raises:
+            ValueError: If the length differs.
+        """
+        np = self._np
+        data = self._data
+        if len(new_values) != len(data):
+            raise ValueError("signal array update must keep the array's length")
+        if np is not None:
+            new = np.asarray(new_values, dtype=data.dtype)
+            mask = self._changed_mask(data, new)
+            cells = self._cells
+            if len(cells) < len(data) // 8:
+                # Few watched cells: test just those against the mask.
+                changed = [i for i in cells if mask[i]]
+                if not changed and mask.any():
+                    changed = None
+            else:
+                changed = np.flatnonzero(mask).tolist()
+            data[...] = new
+            self._notify(changed)
+            return
+        changed_list = []
+        for i, value in enumerate(new_values):
+            if _cell_changed(data[i], value):
+                data[i] = value
+                changed_list.append(i)
+        self._notify(changed_list)
+
+    def _changed_mask(self, old: Any, new: Any) -> Any:
+        np = self._np
+        mask = old != new
+        if old.dtype.kind in "fc":
+            # NaN never equals itself, but NaN -> NaN is not a change.
+            mask &= ~(np.isnan(old) & np.isnan(new))
+        return mask
+
+    def _notify(self, changed: Optional[List[int]]) -> None:
+        """Stale the readers of `changed` cells in one batch.
+
+        `None` means some cells changed but none of them are watched.
+        """
+        if changed is not None and not changed:
+            return
+        with _Batch():
+            cells = self._cells
+            for i in changed or ():
+                cell = cells.get(i)
+                if cell is None:
+                    continue
+                observers = cell._observers
+                if not observers:
+                    # Its readers have gone; drop the node.
+                    del cells[i]
+                    continue
+                for o in observers[::2]:
+                    o._stale(_DIRTY)
+            observers = self._all._observers
+            if observers:
+                for o in observers[::2]:
+                    o._stale(_DIRTY)
+
+
+def create_signal_array(values: Any) -> SignalArray:
+    """Create a [`SignalArray`][wybthon.reactivity.SignalArray] of reactive cells.
+
+    Use it instead of one signal per cell for large numeric state
+    (telemetry grids, plots, heatmaps). Reading `arr[i]` inside an
+    effect or hole subscribes to cell `i` only; `arr.set_many(indices,
+    values)` and `arr.update(new_values)` find the changed cells with one
+    vectorized NumPy comparison and re-run just their readers, in one
+    flush. Without NumPy (e.g. a Pyodide build without the package) the
+    values live in a list and the comparison is a Python loop, with the
+    same behavior.
+
+    Args:
+        values: Initial one-dimensional sequence or array. With NumPy it
+            is copied into an array of its inferred dtype, so later
+            writes are cast to that dtype.
+
+    Returns:
+        A `SignalArray`.
+
+    Raises:
+        ValueError: If `values` is not one-dimensional (NumPy only).
+
+    Example:
+        ```python
+        temps = create_signal_array(np.zeros(4096))
+        cells = [span(lambda i=i: f"{temps[i]:.1f}") for i in range(4096)]
+
+        def on_frame(frame):
+            temps.update(frame)  # only the cells that changed re-render
+        ```
+    """
+    return SignalArray(values)
@@ -35,20 +35,22 @@ Public surface:
 from __future__ import annotations
 
 from bisect import bisect_left
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from . import kernel
 from ._warnings import component_name, log_error
 from .dom import Element
 from .events import remove_handlers_for, set_handler
 from .kernel import (
+    OP_CLEAR,
     OP_CLONE_TPL,
+    OP_CLONE_TPL_BULK,
     OP_CREATE_COMMENT,
     OP_CREATE_ELEMENT,
     OP_CREATE_TEXT,
     OP_INSERT,
-    OP_RELEASE,
     OP_REMOVE,
+    OP_REMOVE_RANGE,
     OP_SET_TEXT,
 )
 from .props import _apply_single_prop, _bind_reactive_prop, apply_initial_props, apply_props, attach_ref, detach_ref
@@ -66,9 +68,10 @@ from .template import (
     BIND_TEXT,
     NODE_HOLE,
     NODE_STATIC,
+    MountPlan,
     build_plan,
 )
-from .vnode import VNode, dynamic, normalize_children, to_text_vnode
+from .vnode import LIST_DELTA_PROP, VNode, dynamic, normalize_children, to_text_vnode
 
 __all__ = ["render", "mount", "unmount", "patch"]
 
@@ -77,6 +80,7 @@ _container_registry: Dict[int, VNode] = {}
 
 _emit = kernel.emit
 _alloc_id = kernel.alloc_id
+_release = kernel.release
 
 
 def _dispatch_to_error_boundary(exc: BaseException) -> bool:
@@ -169,6 +173,21 @@ def _first_dom_id(vnode: VNode) -> Optional[int]:
         return vnode.el
 
 
+def _last_dom_id(vnode: VNode) -> Optional[int]:
+    """Return the id of the last DOM node belonging to this vnode."""
+    while True:
+        if vnode.tag == "_dynamic":
+            if vnode.el is not None:
+                return vnode.el
+            return _last_dom_id(vnode.subtree) if vnode.subtree is not None else None
+        if vnode.subtree is not None:
+            vnode = vnode.subtree
+            continue
+        if vnode.tag == "_fragment" and vnode.el is not None:
+            return vnode._frag_end
+        return vnode.el
+
+
 def _dom_node_ids(vnode: VNode) -> List[int]:
     """Return the ids of all top-level DOM nodes belonging to this vnode."""
     if vnode.tag == "_dynamic":
@@ -215,20 +234,7 @@ def mount(vnode: Union[VNode, str], parent_id: int, anchor_id: Optional[int] = N
     """
     if not isinstance(vnode, VNode):
         vnode = to_text_vnode(vnode)
-
-    scope = vnode.owner_scope
-    if scope is not None:
-        import wybthon.reactivity as _rx
-
-        prev_owner = _rx._current_owner
-        _rx._current_owner = scope
-        try:
-            _mount_dispatch(vnode, parent_id, anchor_id)
-        finally:
-            _rx._current_owner = prev_owner
-        return
-
-    _mount_dispatch(vnode, parent_id, anchor_id)
+    _in_owner_scope(vnode, _mount_dispatch, vnode, parent_id, anchor_id)
 
 
 def _mount_dispatch(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> None:
@@ -260,6 +266,113 @@ def _mount_dispatch(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> N
     _mount_element(vnode, parent_id, anchor_id)
 
 
+# Minimum run of consecutive new siblings sharing one template skeleton
+# before they're mounted with a single ``CLONE_TPL_BULK`` op.
+MIN_BULK = 8
+
+
+def _mount_children(
+    children: List[VNode],
+    parent_id: int,
+    anchor_id: Optional[int],
+    guard_base: Optional[int] = None,
+) -> None:
+    """Mount `children` in order before `anchor_id`, batching template runs.
+
+    Runs of at least `MIN_BULK` consecutive element children whose
+    mount plans share one skeleton (typically `For` rows) are cloned,
+    filled, and inserted by one `CLONE_TPL_BULK` op; everything else
+    mounts one child at a time.
+
+    Args:
+        children: Normalized child VNodes.
+        parent_id: Kernel id of the parent node.
+        anchor_id: Sibling id to insert before, or `None` to append.
+        guard_base: When set, each child's mount is guarded like the
+            reconciler's per-child mounts: failures go to the nearest
+            error boundary (or the log) and the remaining children still
+            mount. The value is the index of `children[0]` for messages.
+    """
+    n = len(children)
+    if n < MIN_BULK or not kernel.supports_html():
+        for k, child in enumerate(children):
+            _mount_child(child, None, parent_id, anchor_id, guard_base, k)
+        return
+
+    plans = [_plan_for(child) for child in children]
+    i = 0
+    while i < n:
+        plan = plans[i]
+        j = i + 1
+        if plan is not None:
+            html = plan.html
+            while j < n:
+                other = plans[j]
+                if other is None or other.html != html:
+                    break
+                j += 1
+        if plan is not None and j - i >= MIN_BULK:
+            _mount_plan_run(children[i:j], plans[i:j], parent_id, anchor_id, guard_base, i)
+        else:
+            for k in range(i, j):
+                _mount_child(children[k], plans[k], parent_id, anchor_id, guard_base, k)
+        i = j
+
+
+def _plan_for(vnode: VNode) -> Optional[MountPlan]:
+    """Return the template mount plan for an element VNode, or `None`."""
+    tag = vnode.tag
+    if isinstance(tag, str) and not tag.startswith("_"):
+        return build_plan(vnode)
+    return None
+
+
+def _mount_child(
+    vnode: VNode,
+    plan: Optional[MountPlan],
+    parent_id: int,
+    anchor_id: Optional[int],
+    guard_base: Optional[int],
+    index: int,
+) -> None:
+    """Mount one child of `_mount_children`, reusing a precomputed plan."""
+    if plan is None:
+        if guard_base is None:
+            mount(vnode, parent_id, anchor_id)
+        else:
+            _guarded(mount, guard_base + index, vnode, parent_id, anchor_id)
+        return
+    if guard_base is None:
+        _in_owner_scope(vnode, _mount_plan, vnode, plan, parent_id, anchor_id)
+    else:
+        _guarded(_in_owner_scope, guard_base + index, vnode, _mount_plan, vnode, plan, parent_id, anchor_id)
+
+
+def _guarded(fn: Any, index: int, *args: Any) -> None:
+    """Run a child mount, routing failures to an error boundary or the log."""
+    try:
+        fn(*args)
+    except Exception as e:
+        if not _dispatch_to_error_boundary(e):
+            log_error(f"Failed to mount child at index {index}", e)
+
+
+def _in_owner_scope(vnode: VNode, fn: Any, *args: Any) -> None:
+    """Call `fn(*args)` under `vnode.owner_scope` when it has one."""
+    scope = vnode.owner_scope
+    if scope is None:
+        fn(*args)
+        return
+    import wybthon.reactivity as _rx
+
+    prev_owner = _rx._current_owner
+    _rx._current_owner = scope
+    try:
+        fn(*args)
+    finally:
+        _rx._current_owner = prev_owner
+
+
 def _mount_element(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> None:
     """Mount an element subtree with per-node ops (the template-ineligible path)."""
     assert isinstance(vnode.tag, str)
@@ -269,8 +382,7 @@ def _mount_element(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> No
     apply_initial_props(nid, vnode.props)
     norm_children = normalize_children(vnode.children)
     vnode.children = norm_children
-    for child in norm_children:
-        mount(child, nid)
+    _mount_children(norm_children, nid, None)
     _emit((OP_INSERT, parent_id, nid, anchor_id))
     attach_ref(vnode.props, nid)
 
@@ -295,11 +407,67 @@ def _mount_template(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> b
     plan = build_plan(vnode)
     if plan is None:
         return False
+    _mount_plan(vnode, plan, parent_id, anchor_id)
+    return True
+
 
+def _mount_plan(vnode: VNode, plan: MountPlan, parent_id: int, anchor_id: Optional[int]) -> None:
+    """Mount `vnode` from an already-built template plan."""
     count = plan.node_count
     first = kernel.alloc_ids(count)
     _emit((OP_CLONE_TPL, first, count, kernel.template_id(plan.html)))
+    holes, mounts = _assign_plan_ids(plan, first)
+    _wire_plan_bindings(plan, True)
+    _emit((OP_INSERT, parent_id, first, anchor_id))
+    _mount_plan_placeholders(holes, mounts)
+
+
+def _mount_plan_run(
+    children: List[VNode],
+    plans: List[MountPlan],
+    parent_id: int,
+    anchor_id: Optional[int],
+    guard_base: Optional[int],
+    index: int,
+) -> None:
+    """Mount siblings sharing one skeleton with a single `CLONE_TPL_BULK` op.
+
+    The kernel clones every row, fills the hoisted text slots, and
+    inserts all rows at once; each row's remaining bindings and dynamic
+    children are then wired by id under the row's owner scope, exactly
+    as `_mount_plan` would.
+    """
+    first_plan = plans[0]
+    per = first_plan.node_count
+    n = len(children)
+    first = kernel.alloc_ids(per * n)
+    offsets = [
+        k for k, (kind, node, _parent) in enumerate(first_plan.order) if kind == NODE_STATIC and node.tag == "_text"
+    ]
+    texts: List[str] = []
+    for plan in plans:
+        for _target, bkind, _name, value in plan.bindings:
+            if bkind == BIND_TEXT:
+                texts.append(value)
+    _emit((OP_CLONE_TPL_BULK, first, per, kernel.template_id(first_plan.html), n, parent_id, anchor_id, offsets, texts))
+    row_first = first
+    for k, (child, plan) in enumerate(zip(children, plans)):
+        if guard_base is None:
+            _in_owner_scope(child, _wire_plan_row, plan, row_first)
+        else:
+            _guarded(_in_owner_scope, guard_base + index + k, child, _wire_plan_row, plan, row_first)
+        row_first += per
+
+
+def _wire_plan_row(plan: MountPlan, first: int) -> None:
+    """Wire one bulk-cloned row: ids, non-text bindings, dynamic children."""
+    holes, mounts = _assign_plan_ids(plan, first)
+    _wire_plan_bindings(plan, False)
+    _mount_plan_placeholders(holes, mounts)
 
+
+def _assign_plan_ids(plan: MountPlan, first: int) -> Tuple[List[Any], List[Any]]:
+    """Give every planned node its id; return the hole and mount placeholders."""
     holes: List[Any] = []
     mounts: List[Any] = []
     nid = first
@@ -311,12 +479,16 @@ def _mount_template(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> b
         else:
             mounts.append((node, parent, nid))
         nid += 1
+    return holes, mounts
+
 
+def _wire_plan_bindings(plan: MountPlan, with_text: bool) -> None:
+    """Apply a plan's bindings by id (text bindings only when `with_text`)."""
     for target, bkind, name, value in plan.bindings:
         el = target.el
         assert el is not None
         if bkind == BIND_TEXT:
-            if value != " ":  # the clone already holds the placeholder space
+            if with_text and value != " ":  # the clone already holds the placeholder space
                 _emit((OP_SET_TEXT, el, value))
         elif bkind == BIND_EVENT:
             set_handler(el, name, value if callable(value) else None)
@@ -327,8 +499,9 @@ def _mount_template(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> b
         else:  # BIND_REF
             attach_ref({name: value}, el)
 
-    _emit((OP_INSERT, parent_id, first, anchor_id))
 
+def _mount_plan_placeholders(holes: List[Any], mounts: List[Any]) -> None:
+    """Mount holes and component/fragment children at their placeholder comments."""
     for node, parent, comment_id in holes:
         _mount_dynamic(node, parent.el, end_id=comment_id)
 
@@ -338,9 +511,7 @@ def _mount_template(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> b
             mount(node, parent.el, comment_id)
             _emit((OP_REMOVE, comment_id))
             removed.append(comment_id)
-        _emit((OP_RELEASE, removed))
-
-    return True
+        _release(removed)
 
 
 def _mount_fragment(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> None:
@@ -357,8 +528,7 @@ def _mount_fragment(vnode: VNode, parent_id: int, anchor_id: Optional[int]) -> N
 
     norm_children = normalize_children(vnode.children)
     vnode.children = norm_children
-    for child in norm_children:
-        mount(child, parent_id, end_id)
+    _mount_children(norm_children, parent_id, end_id)
 
 
 # ---------------------------------------------------------------------------
@@ -661,76 +831,126 @@ def unmount(vnode: VNode) -> None:
 def _unmount(vnode: VNode) -> None:
     """Internal unmount: emits ops but leaves committing to the caller."""
     top_ids = _dom_node_ids(vnode)
-    for nid in top_ids:
-        _emit((OP_REMOVE, nid))
+    if len(top_ids) > 1:
+        # Top-level nodes of one vnode are always contiguous siblings.
+        _emit((OP_REMOVE_RANGE, top_ids[0], top_ids[-1]))
+    elif top_ids:
+        _emit((OP_REMOVE, top_ids[0]))
     released: List[int] = []
     _dispose_tree(vnode, released)
     if released:
-        _emit((OP_RELEASE, released))
+        _release(released)
 
 
 def _dispose_tree(vnode: VNode, released: List[int]) -> None:
-    """Dispose scopes/effects/handlers recursively, collecting node ids to release."""
-    tag = vnode.tag
+    """Dispose scopes/effects/handlers of one tree, collecting node ids to release."""
+    _dispose_forest([vnode], released)
 
-    if tag == "_dynamic":
-        if vnode.render_effect is not None:
-            try:
-                vnode.render_effect.dispose()
-            except Exception as exc:  # pragma: no cover - defensive
-                log_error(f"Failed disposing reactive hole effect: {exc}", exc)
-            vnode.render_effect = None
-        if vnode.subtree is not None:
-            _dispose_tree(vnode.subtree, released)
-            vnode.subtree = None
-        if vnode.el is not None:
-            released.append(vnode.el)
+
+def _dispose_forest(roots: List[VNode], released: List[int]) -> None:
+    """Dispose scopes/effects/handlers of many trees in one iterative pass.
+
+    Nodes are visited in document pre-order (an explicit stack, so deep or
+    wide trees never hit the recursion limit), and cleanups run in the
+    same order as a recursive walk would run them.
+    """
+    stack: List[VNode] = list(reversed(roots))
+    while stack:
+        vnode = stack.pop()
+        tag = vnode.tag
+
+        if tag == "_dynamic":
+            if vnode.render_effect is not None:
+                try:
+                    vnode.render_effect.dispose()
+                except Exception as exc:  # pragma: no cover - defensive
+                    log_error(f"Failed disposing reactive hole effect: {exc}", exc)
+                vnode.render_effect = None
+            # The end anchor is released before the subtree's nodes; the
+            # release order within one batch is not significant.
+            if vnode.el is not None:
+                released.append(vnode.el)
+                vnode.el = None
+            if vnode.subtree is not None:
+                stack.append(vnode.subtree)
+                vnode.subtree = None
+            continue
+
+        if callable(tag):
+            if vnode.component_ctx is not None:
+                try:
+                    vnode.component_ctx.dispose()
+                except Exception as e:
+                    log_error(f"Component context disposal failed in {component_name(tag)}", e)
+            elif vnode.render_effect is not None:
+                try:
+                    vnode.render_effect.dispose()
+                except Exception as e:
+                    log_error(f"Effect disposal failed in {component_name(tag)}", e)
+            if vnode.subtree is not None:
+                stack.append(vnode.subtree)
             vnode.el = None
-        return
+            continue
 
-    if callable(tag):
-        if vnode.component_ctx is not None:
-            try:
-                vnode.component_ctx.dispose()
-            except Exception as e:
-                log_error(f"Component context disposal failed in {component_name(tag)}", e)
-        elif vnode.render_effect is not None:
+        if tag == "_fragment":
+            if vnode.el is not None:
+                released.append(vnode.el)
+                vnode.el = None
+            if vnode._frag_end is not None:
+                released.append(vnode._frag_end)
+                vnode._frag_end = None
+            _push_children(stack, vnode.children)
+            continue
+
+        # Element or text node.
+        if vnode.el is None:
+            continue
+        detach_ref(vnode.props)
+        remove_handlers_for(vnode.el)
+        if vnode.render_effect is not None:
             try:
                 vnode.render_effect.dispose()
             except Exception as e:
                 log_error(f"Effect disposal failed in {component_name(tag)}", e)
-        if vnode.subtree is not None:
-            _dispose_tree(vnode.subtree, released)
+        released.append(vnode.el)
         vnode.el = None
-        return
+        _push_children(stack, vnode.children)
 
-    if tag == "_fragment":
-        for child in vnode.children:
-            if isinstance(child, VNode):
-                _dispose_tree(child, released)
-        if vnode.el is not None:
-            released.append(vnode.el)
-            vnode.el = None
-        if vnode._frag_end is not None:
-            released.append(vnode._frag_end)
-            vnode._frag_end = None
-        return
 
-    # Element or text node.
-    if vnode.el is None:
-        return
-    detach_ref(vnode.props)
-    remove_handlers_for(vnode.el)
-    if vnode.render_effect is not None:
-        try:
-            vnode.render_effect.dispose()
-        except Exception as e:
-            log_error(f"Effect disposal failed in {component_name(tag)}", e)
-    for child in vnode.children:
+def _push_children(stack: List[VNode], children: List[Any]) -> None:
+    """Push VNode children so they pop in document order."""
+    for k in range(len(children) - 1, -1, -1):
+        child = children[k]
         if isinstance(child, VNode):
-            _dispose_tree(child, released)
-    released.append(vnode.el)
-    vnode.el = None
+            stack.append(child)
+
+
+def _clear_children(old_children: List[VNode], parent_id: int, end_marker: Optional[int]) -> None:
+    """Unmount a whole child list with one DOM op and one disposal pass.
+
+    Children that own their parent outright (`end_marker is None`) are
+    dropped with `OP_CLEAR`; a fragment's region is cut out with a single
+    `OP_REMOVE_RANGE` between its first and last DOM node.
+    """
+    if end_marker is None:
+        _emit((OP_CLEAR, parent_id))
+    else:
+        first: Optional[int] = None
+        for oc in old_children:
+            first = _first_dom_id(oc)
+            if first is not None:
+                break
+        if first is not None:
+            last: Optional[int] = None
+            for k in range(len(old_children) - 1, -1, -1):
+                last = _last_dom_id(old_children[k])
+                if last is not None:
+                    break
+            _emit((OP_REMOVE_RANGE, first, last))
+    released: List[int] = []
+    _dispose_forest(old_children, released)
+    if released:
+        _release(released)
 
 
 # ---------------------------------------------------------------------------
@@ -760,7 +980,7 @@ def _replace(old: VNode, new: VNode, parent_id: int) -> None:
     _unmount(old)
     mount(new, parent_id, marker)
     _emit((OP_REMOVE, marker))
-    _emit((OP_RELEASE, [marker]))
+    _release([marker])
 
 
 def patch(old: Optional[VNode], new: VNode, parent_id: int) -> None:
@@ -828,12 +1048,61 @@ def _patch_fragment(old: VNode, new: VNode, parent_id: int) -> None:
     new.el = old.el
     new._frag_end = old._frag_end
 
+    # Popped so the new fragment doesn't keep the old one (and its removed
+    # rows) alive, chaining every fragment the list ever rendered.
+    change = new.props.pop(LIST_DELTA_PROP, None)
+    if change is not None and change[0] is old and len(change[1].removed) < len(old.children):
+        # A `For` update whose rows are already flat VNodes; anything that
+        # replaces every row still goes through the clear fast path below.
+        _apply_list_delta(new.children, change[1], parent_id, new._frag_end)
+        return
+
     new_children = normalize_children(new.children)
     new.children = new_children
 
     _reconcile_children(old.children, new_children, parent_id, new._frag_end)
 
 
+def _apply_list_delta(children: List[VNode], delta: Any, parent_id: int, end_marker: Optional[int]) -> None:
+    """Apply a `map_array` change set to a mounted `For` region.
+
+    Rows outside `delta.placed` are already in place, so the work is
+    proportional to the change rather than the list length. Placed rows
+    are handled right to left, each going in front of its (already
+    final) successor; consecutive new rows mount as one run so they can
+    share a bulk clone. Removed rows unmount last, matching
+    `_reconcile_children`.
+    """
+    placed = delta.placed
+    inserted = delta.inserted
+    n = len(children)
+    k = len(placed) - 1
+    while k >= 0:
+        i = placed[k]
+        anchor = end_marker
+        for j in range(i + 1, n):
+            first = _first_dom_id(children[j])
+            if first is not None:
+                anchor = first
+                break
+        if i in inserted:
+            lo_k = k
+            while lo_k > 0 and placed[lo_k - 1] == placed[lo_k] - 1 and placed[lo_k - 1] in inserted:
+                lo_k -= 1
+            lo = placed[lo_k]
+            _mount_children(children[lo : i + 1], parent_id, anchor, lo)
+            k = lo_k - 1
+            continue
+        for nid in _dom_node_ids(children[i]):
+            _emit((OP_INSERT, parent_id, nid, anchor))
+        k -= 1
+
+    removed = delta.removed
+    delta.base = delta.removed = None
+    for row in removed:
+        _unmount(row)
+
+
 def _reconcile_children(
     old_children: List[VNode],
     new_children: List[VNode],
@@ -894,16 +1163,19 @@ def _reconcile_children(
         unmatched.append(i)
 
     # Pass 3: unkeyed children match unused old children of the same tag
-    # in order. Per-tag index queues keep this linear.
+    # in order. Per-tag index queues keep this linear. Rows owned by a
+    # `For`/`Index` scope never type-match: their bindings belong to that
+    # scope, so patching one row into another would leak the old scope's
+    # effects and read the new row's reactive props as static values.
     if unmatched:
         type_queues: Dict[Any, List[int]] = {}
         type_pos: Dict[Any, int] = {}
         for j, oc in enumerate(old_children):
-            if not used_old[j] and oc.key is None:
+            if not used_old[j] and oc.key is None and oc.owner_scope is None:
                 type_queues.setdefault(oc.tag, []).append(j)
         for i in unmatched:
             nc = new_children[i]
-            if nc.key is not None:
+            if nc.key is not None or nc.owner_scope is not None:
                 continue
             queue = type_queues.get(nc.tag)
             if queue is None:
@@ -919,6 +1191,11 @@ def _reconcile_children(
                 sources[i] = j
                 needs_patch[i] = True
 
+    if n_old and not any(used_old):
+        _clear_children(old_children, parent_id, end_marker)
+        _mount_children(new_children, parent_id, end_marker, 0)
+        return
+
     for i in range(n):
         if needs_patch[i]:
             patch(old_children[sources[i]], new_children[i], parent_id)
@@ -948,25 +1225,31 @@ def _reconcile_children(
         k = prev_idx[k]
 
     next_anchor = end_marker
-    for i in range(n - 1, -1, -1):
+    i = n - 1
+    while i >= 0:
         new_child = new_children[i]
         s = sources[i]
         if s == -1:
-            try:
-                mount(new_child, parent_id, next_anchor)
-                first = _first_dom_id(new_child)
+            # Mount the whole run of consecutive new children at once so
+            # template-sharing rows can go through one bulk clone.
+            lo = i
+            while lo > 0 and sources[lo - 1] == -1:
+                lo -= 1
+            _mount_children(new_children[lo : i + 1], parent_id, next_anchor, lo)
+            for k in range(lo, i + 1):
+                first = _first_dom_id(new_children[k])
                 if first is not None:
                     next_anchor = first
-            except Exception as e:
-                if not _dispatch_to_error_boundary(e):
-                    log_error(f"Failed to mount child at index {i}", e)
-        else:
-            first_dom = _first_dom_id(new_child)
-            if first_dom is not None:
-                if i not in lis_set:
-                    for nid in _dom_node_ids(new_child):
-                        _emit((OP_INSERT, parent_id, nid, next_anchor))
-                next_anchor = first_dom
+                    break
+            i = lo - 1
+            continue
+        first_dom = _first_dom_id(new_child)
+        if first_dom is not None:
+            if i not in lis_set:
+                for nid in _dom_node_ids(new_child):
+                    _emit((OP_INSERT, parent_id, nid, next_anchor))
+            next_anchor = first_dom
+        i -= 1
 
     for j, oc in enumerate(old_children):
         if not used_old[j]:
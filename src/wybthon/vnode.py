@@ -53,6 +53,10 @@ __all__ = [
 PropsDict = Dict[str, Any]
 ChildType = Union["VNode", str]
 
+# Fragment prop carrying a `(previous fragment, map_array change set)`
+# pair from `For` to the reconciler; see `_patch_fragment`.
+LIST_DELTA_PROP = "_wyb_list_delta"
+
 
 class VNode:
     """Virtual node representing an element, text, component, or reactive hole.
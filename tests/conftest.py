@@ -329,6 +329,37 @@ def texts_of_children(node):
     return out
 
 
+def list_rows(ul):
+    """Return the ``<li>`` children of a list :class:`StubNode`."""
+    return [n for n in ul.childNodes if getattr(n, "tag", None) == "li"]
+
+
+# ---------------------------------------------------------------------------
+# Render helpers
+# ---------------------------------------------------------------------------
+
+
+def record_ops(kernel):
+    """Spy on the installed backend; return the list every applied op is appended to."""
+    seen = []
+    backend = kernel._backend
+    original = backend.apply
+
+    def spy(ops):
+        seen.extend(ops)
+        original(ops)
+
+    backend.apply = spy
+    return seen
+
+
+def mount_list(wyb, root_element, items, row):
+    """Render ``<ul>{For(each=items, children=row)}</ul>`` and return the ``ul`` node."""
+    rec, flow, h = wyb["reconciler"], wyb["flow"], wyb["vnode"].h
+    rec.render(h("ul", {}, flow.For(each=items, children=row)), root_element)
+    return root_element.element.childNodes[0]
+
+
 # ---------------------------------------------------------------------------
 # Pytest fixtures
 # ---------------------------------------------------------------------------
@@ -0,0 +1,103 @@
+"""Tests for automatic batching of signal writes.
+
+With automatic batching on, writes outside a batch schedule one flush
+on the driver instead of flushing synchronously.
+"""
+
+import pytest
+
+from wybthon import h, kernel
+from wybthon.reactivity import (
+    batch,
+    create_effect,
+    create_memo,
+    create_signal,
+    flush_sync,
+    set_auto_batching,
+)
+
+
+@pytest.fixture()
+def driver():
+    driver = kernel.ManualDriver()
+    set_auto_batching(True, driver)
+    yield driver
+    set_auto_batching(False)
+
+
+def test_writes_share_one_scheduled_flush(driver):
+    a, set_a = create_signal(0)
+    b, set_b = create_signal(0)
+    seen = []
+    create_effect(lambda: seen.append((a(), b())))
+    seen.clear()
+
+    for i in range(1, 11):
+        set_a(i)
+        set_b(-i)
+    assert seen == []
+    assert driver.pending == 1
+
+    driver.tick()
+    assert seen == [(10, -10)]
+    assert driver.pending == 0
+
+
+def test_memos_read_consistently_before_the_flush(driver):
+    count, set_count = create_signal(1)
+    doubled = create_memo(lambda: count() * 2)
+    seen = []
+    create_effect(lambda: seen.append(doubled()))
+
+    set_count(5)
+    assert doubled() == 10
+    assert seen == [2]
+    driver.tick()
+    assert seen == [2, 10]
+
+
+def test_flush_sync_runs_effects_before_returning(driver):
+    value, set_value = create_signal("a")
+    seen = []
+    create_effect(lambda: seen.append(value()))
+
+    assert flush_sync(lambda: set_value("b")) == "b"
+    assert seen == ["a", "b"]
+
+    set_value("c")
+    flush_sync()
+    assert seen == ["a", "b", "c"]
+    driver.tick()
+    assert seen == ["a", "b", "c"]
+
+
+def test_explicit_batch_still_flushes_on_exit(driver):
+    value, set_value = create_signal(0)
+    seen = []
+    create_effect(lambda: seen.append(value()))
+    with batch():
+        set_value(1)
+    assert seen == [0, 1]
+
+
+def test_scheduled_flush_commits_once(wyb, root_element, driver):
+    a, set_a = create_signal("a")
+    b, set_b = create_signal("b")
+    wyb["reconciler"].render(h("p", {}, lambda: a() + b()), root_element)
+    kernel.reset_stats()
+
+    set_a("x")
+    set_b("y")
+    assert kernel.stats()["commits"] == 0
+    driver.tick()
+    assert root_element.element.childNodes[0].childNodes[0].nodeValue == "xy"
+    assert kernel.stats()["commits"] == 1
+
+
+def test_disabling_flushes_pending_writes(driver):
+    value, set_value = create_signal(0)
+    seen = []
+    create_effect(lambda: seen.append(value()))
+    set_value(1)
+    set_auto_batching(False)
+    assert seen == [0, 1]
@@ -0,0 +1,129 @@
+"""Tests for `BatchFetcher`: one `batch_fetch` call per tick of resource fetches."""
+
+import asyncio
+
+import pytest
+
+from wybthon.reactivity import BatchFetcher, ResourceCache, create_resource, create_root, create_signal, map_array
+
+
+def _resources(fetcher, keys, **kwargs):
+    return [create_root(lambda dispose, k=k: create_resource(lambda: k, fetcher, **kwargs)) for k in keys]
+
+
+def test_rows_mounted_together_make_one_call():
+    async def run():
+        calls = []
+
+        async def load(keys):
+            calls.append(keys)
+            return {k: f"detail {k}" for k in keys}
+
+        fetcher = BatchFetcher(load)
+        items, _ = create_signal(list(range(200)))
+        rows = create_root(lambda dispose: map_array(items, lambda item, idx: create_resource(lambda: item(), fetcher)))
+        resources = rows()
+        await asyncio.sleep(0.01)
+
+        assert calls == [list(range(200))]
+        assert [r() for r in resources] == [f"detail {k}" for k in range(200)]
+
+    asyncio.run(run())
+
+
+def test_duplicate_keys_and_sequence_results():
+    async def run():
+        calls = []
+
+        def load(keys):
+            calls.append(keys)
+            return [k * 10 for k in keys]
+
+        resources = _resources(BatchFetcher(load), [1, 2, 1])
+        await asyncio.sleep(0.01)
+        assert calls == [[1, 2]]
+        assert [r() for r in resources] == [10, 20, 10]
+
+    asyncio.run(run())
+
+
+def test_per_key_errors_reach_only_their_resources():
+    async def run():
+        async def load(keys):
+            return {1: "one", 2: LookupError("no such row")}
+
+        ok, bad, missing = _resources(BatchFetcher(load), [1, 2, 3])
+        await asyncio.sleep(0.01)
+        assert ok() == "one"
+        assert isinstance(bad.error, LookupError)
+        assert isinstance(missing.error, KeyError)
+
+    asyncio.run(run())
+
+
+def test_batch_failure_fails_every_key():
+    async def run():
+        async def load(keys):
+            raise RuntimeError("backend down")
+
+        resources = _resources(BatchFetcher(load), [1, 2])
+        await asyncio.sleep(0.01)
+        assert [r.state for r in resources] == ["errored", "errored"]
+
+    asyncio.run(run())
+
+
+def test_cancel_removes_key_from_pending_batch():
+    async def run():
+        calls = []
+
+        async def load(keys):
+            calls.append(keys)
+            return {k: k for k in keys}
+
+        kept, cancelled = _resources(BatchFetcher(load), ["a", "b"])
+        await asyncio.sleep(0)  # both fetches queued, batch not yet sent
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+        assert calls == [["a"]]
+        assert kept() == "a"
+        assert cancelled() is None
+
+    asyncio.run(run())
+
+
+def test_max_batch_size_splits_calls():
+    async def run():
+        calls = []
+
+        async def load(keys):
+            calls.append(keys)
+            return keys
+
+        _resources(BatchFetcher(load, max_batch_size=2), [1, 2, 3, 4, 5])
+        await asyncio.sleep(0.01)
+        assert calls == [[1, 2], [3, 4], [5]]
+
+    asyncio.run(run())
+
+    with pytest.raises(ValueError):
+        BatchFetcher(lambda keys: keys, max_batch_size=0)
+
+
+def test_cached_keys_are_not_refetched():
+    async def run():
+        calls = []
+
+        async def load(keys):
+            calls.append(keys)
+            return keys
+
+        fetcher = BatchFetcher(load)
+        cache = ResourceCache(stale_time=60)
+        _resources(fetcher, [1, 2], cache=cache, key="row")
+        await asyncio.sleep(0.01)
+        _resources(fetcher, [2, 3], cache=cache, key="row")
+        await asyncio.sleep(0.01)
+        assert calls == [[1, 2], [3]]
+
+    asyncio.run(run())
@@ -0,0 +1,85 @@
+"""Tests for bulk template instantiation of sibling runs.
+
+Runs of at least ``MIN_BULK`` new siblings sharing one skeleton (``For``
+rows) mount through a single ``CLONE_TPL_BULK`` op; each row's bindings,
+holes, and owner scopes are then wired exactly as a single mount would.
+"""
+
+from conftest import collect_texts, list_rows, mount_list, record_ops
+
+from wybthon.vnode import dynamic, h
+
+
+def test_for_mount_uses_one_bulk_clone(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    ops = record_ops(kernel)
+    items, _set_items = rx.create_signal([f"r{i}" for i in range(20)])
+
+    ul = mount_list(wyb, root_element, items, lambda item, idx: h("li", {}, h("span", {}, item()), "!"))
+
+    bulk = [op for op in ops if op[0] == kernel.OP_CLONE_TPL_BULK]
+    assert len(bulk) == 1 and bulk[0][4] == 20
+    assert not [op for op in ops if op[0] == kernel.OP_CLONE_TPL]
+    assert [r.childNodes[0].childNodes[0].nodeValue for r in list_rows(ul)] == [f"r{i}" for i in range(20)]
+
+
+def test_bulk_rows_keep_bindings_holes_and_scopes(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    selected, set_selected = rx.create_signal(-1)
+    clicks = []
+    cleanups = []
+    items, set_items = rx.create_signal(list(range(10)))
+
+    def row(item, idx):
+        i = item()
+        rx.on_cleanup(lambda: cleanups.append(i))
+        return h(
+            "li",
+            {"class": lambda: "on" if selected() == i else "", "on_click": lambda e: clicks.append(i)},
+            h("span", {}, f"row {i}"),
+            dynamic(lambda: "*" if selected() == i else "-"),
+        )
+
+    ul = mount_list(wyb, root_element, items, row)
+    rows = list_rows(ul)
+    assert len(rows) == 10
+
+    set_selected(3)
+    assert rows[3].attributes.get("class") == "on"
+    assert "*" in collect_texts(rows[3]) and "-" in collect_texts(rows[4])
+
+    kernel._backend.dispatch("click", rows[7].childNodes[0])
+    assert clicks == [7]
+
+    set_items(list(range(5)))
+    assert sorted(cleanups) == [5, 6, 7, 8, 9]
+    assert len(list_rows(ul)) == 5
+
+
+def test_appended_run_is_bulk_mounted_in_order(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    items, set_items = rx.create_signal(["a", "b"])
+    ul = mount_list(wyb, root_element, items, lambda item, idx: h("li", {}, h("i", {}, item()), "."))
+
+    ops = record_ops(kernel)
+    set_items(["a", "b"] + [f"n{i}" for i in range(12)] + ["z"])
+    assert [op[4] for op in ops if op[0] == kernel.OP_CLONE_TPL_BULK] == [13]
+    assert [r.childNodes[0].childNodes[0].nodeValue for r in list_rows(ul)] == (
+        ["a", "b"] + [f"n{i}" for i in range(12)] + ["z"]
+    )
+
+
+def test_short_or_mixed_runs_mount_individually(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    ops = record_ops(kernel)
+
+    def row(item, idx):
+        i = item()
+        if i % 2:
+            return h("li", {}, h("b", {}, str(i)), "odd")
+        return h("li", {}, h("i", {}, str(i)), "even")
+
+    items, _ = rx.create_signal(list(range(10)))
+    ul = mount_list(wyb, root_element, items, row)
+    assert not [op for op in ops if op[0] == kernel.OP_CLONE_TPL_BULK]
+    assert [r.childNodes[1].nodeValue for r in list_rows(ul)] == ["even", "odd"] * 5
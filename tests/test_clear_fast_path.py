@@ -0,0 +1,84 @@
+"""Tests for the reconciler's clear-all fast path.
+
+When none of a child list's old children survive (a list emptied or
+fully replaced), the region is cleared with one ``CLEAR`` or
+``REMOVE_RANGE`` op and disposed in a single iterative pass.
+"""
+
+from conftest import list_rows, mount_list, record_ops
+
+from wybthon.vnode import h
+
+
+def test_emptied_list_removes_one_range(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    cleanups = []
+    items, set_items = rx.create_signal(list(range(50)))
+
+    def row(item, idx):
+        i = item()
+        rx.on_cleanup(lambda: cleanups.append(i))
+        return h("li", {}, str(i))
+
+    ul = mount_list(wyb, root_element, items, row)
+    ops = record_ops(kernel)
+    set_items([])
+
+    assert [op[0] for op in ops].count(kernel.OP_REMOVE_RANGE) == 1
+    # One range removal and one release for all 50 rows; the rest is the
+    # constant cost of swapping in the empty-state text node.
+    assert len(ops) < 10
+    assert list_rows(ul) == []
+    assert sorted(cleanups) == list(range(50))
+
+    set_items([7, 8])
+    assert [r.childNodes[0].nodeValue for r in list_rows(ul)] == ["7", "8"]
+
+
+def test_exclusive_parent_is_cleared_in_one_op(wyb, root_element):
+    kernel = wyb["kernel"]
+    rec = wyb["reconciler"]
+    rec.render(h("ul", {}, *[h("li", {}, str(i)) for i in range(30)]), root_element)
+    ul = root_element.element.childNodes[0]
+
+    ops = record_ops(kernel)
+    rec.render(h("ul", {}), root_element)
+    assert [op[0] for op in ops if op[0] != kernel.OP_RELEASE] == [kernel.OP_CLEAR]
+    assert ul.childNodes == []
+
+
+def test_replace_all_rows_keeps_reactive_bindings(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    selected, set_selected = rx.create_signal(-1)
+    items, set_items = rx.create_signal(list(range(10)))
+
+    def row(item, idx):
+        i = item()
+        return h("li", {"class": lambda: "on" if selected() == i else ""}, str(i))
+
+    ul = mount_list(wyb, root_element, items, row)
+    ops = record_ops(kernel)
+    set_items(list(range(100, 110)))
+
+    assert [op[0] for op in ops].count(kernel.OP_REMOVE_RANGE) == 1
+    rows = list_rows(ul)
+    assert [r.childNodes[0].nodeValue for r in rows] == [str(i) for i in range(100, 110)]
+    set_selected(104)
+    assert [r.attributes.get("class") for r in rows].count("on") == 1
+    assert rows[4].attributes.get("class") == "on"
+
+
+def test_range_removal_keeps_neighbours(wyb, root_element):
+    rx, rec, flow = wyb["reactivity"], wyb["reconciler"], wyb["flow"]
+    items, set_items = rx.create_signal(["a", "b", "c"])
+    rec.render(
+        h("div", {}, h("p", {}, "head"), flow.For(each=items, children=lambda item, idx: h("i", {}, item())), "tail"),
+        root_element,
+    )
+    div = root_element.element.childNodes[0]
+    set_items([])
+    tags = [getattr(n, "tag", None) for n in div.childNodes]
+    assert "p" in tags and "i" not in tags
+    assert div.childNodes[-1].nodeValue == "tail"
+    set_items(["z"])
+    assert [n.childNodes[0].nodeValue for n in div.childNodes if getattr(n, "tag", None) == "i"] == ["z"]
@@ -0,0 +1,72 @@
+"""Tests for the kernel's deferred commit policies.
+
+Under ``"microtask"`` or ``"frame"`` the ops of every effect flush and
+event handler accumulate until the driver fires one commit; synchronous
+reads still commit immediately.
+"""
+
+import pytest
+
+from wybthon import h
+
+
+def _setup(wyb, root_element, policy="frame"):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    count, set_count = rx.create_signal(0)
+    wyb["reconciler"].render(h("p", {}, count), root_element)
+    driver = kernel.ManualDriver()
+    kernel.set_commit_policy(policy, driver)
+    kernel.reset_stats()
+    return kernel, driver, set_count, root_element.element.childNodes[0]
+
+
+def test_writes_flush_once_per_frame(wyb, root_element):
+    kernel, driver, set_count, p = _setup(wyb, root_element)
+    for i in range(1, 30):
+        set_count(i)
+
+    assert p.childNodes[0].nodeValue == "0"
+    assert driver.pending == 1 and kernel.stats()["commits"] == 0
+
+    driver.tick()
+    assert p.childNodes[0].nodeValue == "29"
+    assert kernel.stats()["commits"] == 1 and driver.pending == 0
+
+
+def test_reads_force_an_immediate_commit(wyb, root_element):
+    kernel, driver, set_count, p = _setup(wyb, root_element, "microtask")
+    set_count(5)
+    assert kernel.get_node(p._wyb_id).childNodes[0].nodeValue == "5"
+
+    # The already scheduled commit finds an empty buffer.
+    driver.tick()
+    assert kernel.stats()["commits"] == 1
+
+
+def test_sync_policy_and_switching_flush_pending_ops(wyb, root_element):
+    kernel, driver, set_count, p = _setup(wyb, root_element)
+    set_count(3)
+    kernel.set_commit_policy("sync")
+    assert p.childNodes[0].nodeValue == "3"
+    set_count(4)
+    assert p.childNodes[0].nodeValue == "4"
+
+
+def test_event_handler_commits_are_deferred(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    label, set_label = rx.create_signal("idle")
+    wyb["reconciler"].render(h("button", {"on_click": lambda e: set_label("clicked")}, label), root_element)
+    button = root_element.element.childNodes[0]
+    driver = kernel.ManualDriver()
+    kernel.set_commit_policy("frame", driver)
+
+    kernel._backend.dispatch("click", button)
+    assert button.childNodes[0].nodeValue == "idle"
+    driver.tick()
+    assert button.childNodes[0].nodeValue == "clicked"
+    assert driver.now() == 16.0 and driver.frames == 1
+
+
+def test_unknown_policy_raises(wyb):
+    with pytest.raises(ValueError):
+        wyb["kernel"].set_commit_policy("idle")
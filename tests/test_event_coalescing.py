@@ -0,0 +1,121 @@
+"""Tests for coalesced and passive event listeners.
+
+A ``listener(fn, coalesce="frame")`` handler only records the latest
+payload per node and type; the backend delivers it once per animation
+frame (``PythonBackend.flush_coalesced`` stands in for the frame).
+"""
+
+import pytest
+
+from wybthon import h
+
+
+def _mount(wyb, root_element, props, inner_props=None):
+    wyb["reconciler"].render(h("div", props, h("span", inner_props or {}, "x")), root_element)
+    div = root_element.element.childNodes[0]
+    return div, div.childNodes[0]
+
+
+def test_coalesced_handler_gets_latest_payload_once_per_frame(wyb, root_element):
+    backend, events = wyb["kernel"]._backend, wyb["events"]
+    seen = []
+    clicks = []
+    div, span = _mount(
+        wyb,
+        root_element,
+        {"on_pointermove": events.listener(lambda e: seen.append(e.client_x), coalesce="frame")},
+        {"on_pointermove": lambda e: clicks.append(e.client_x)},
+    )
+
+    for x in range(1, 6):
+        backend.dispatch("pointermove", span, payload={"clientX": x})
+
+    assert clicks == [1, 2, 3, 4, 5]
+    assert seen == []
+    assert backend.flush_coalesced() == 1
+    assert seen == [5]
+    assert backend.flush_coalesced() == 0
+
+
+def test_coalesced_writes_render_after_flush(wyb, root_element):
+    backend, events, rx = wyb["kernel"]._backend, wyb["events"], wyb["reactivity"]
+    pos, set_pos = rx.create_signal(0)
+    wyb["reconciler"].render(
+        h(
+            "div",
+            {"on_scroll": events.listener(lambda e: set_pos(e.client_y), coalesce="frame", fields=["clientY"])},
+            h("span", {}, pos),
+        ),
+        root_element,
+    )
+    span = root_element.element.childNodes[0].childNodes[0]
+    backend.dispatch("scroll", span, payload={"clientY": 40})
+    backend.dispatch("scroll", span, payload={"clientY": 90})
+    backend.flush_coalesced()
+    assert span.childNodes[0].nodeValue == "90"
+
+
+def test_unmounted_node_drops_pending_payload(wyb, root_element):
+    backend, events, rx = wyb["kernel"]._backend, wyb["events"], wyb["reactivity"]
+    seen = []
+    show, set_show = rx.create_signal(True)
+    handler = events.listener(lambda e: seen.append(1), coalesce="frame")
+    wyb["reconciler"].render(
+        h("div", {}, lambda: h("p", {"on_pointermove": handler}) if show() else None), root_element
+    )
+    p = root_element.element.childNodes[0].childNodes[0]
+
+    backend.dispatch("pointermove", p)
+    set_show(False)
+    assert backend.flush_coalesced() == 0
+    assert seen == []
+
+
+def test_passive_root_until_an_active_listener_joins(wyb, root_element):
+    backend, events = wyb["kernel"]._backend, wyb["events"]
+    _mount(wyb, root_element, {"on_wheel": events.listener(lambda e: None, passive=True)})
+    assert backend.root_is_passive("wheel") is True
+
+    _mount(
+        wyb,
+        root_element,
+        {"on_wheel": events.listener(lambda e: None, passive=True)},
+        {"on_wheel": lambda e: e.prevent_default()},
+    )
+    assert backend.root_is_passive("wheel") is False
+
+
+def test_root_turns_passive_again_when_the_active_listener_leaves(wyb, root_element):
+    backend, events, rx, flow = wyb["kernel"]._backend, wyb["events"], wyb["reactivity"], wyb["flow"]
+    active, set_active = rx.create_signal(True)
+    wyb["reconciler"].render(
+        h(
+            "div",
+            {"on_wheel": events.listener(lambda e: None, passive=True)},
+            flow.Show(when=active, children=lambda: h("span", {"on_wheel": lambda e: e.prevent_default()}, "x")),
+        ),
+        root_element,
+    )
+    assert backend.root_is_passive("wheel") is False
+
+    set_active(False)
+    assert backend.root_is_passive("wheel") is True
+    set_active(True)
+    assert backend.root_is_passive("wheel") is False
+
+
+def test_changing_flags_relistens(wyb, root_element):
+    kernel, events = wyb["kernel"], wyb["events"]
+    fn = lambda e: None  # noqa: E731
+    _mount(wyb, root_element, {"on_scroll": fn})
+    ops = []
+    original = kernel._backend.apply
+    kernel._backend.apply = lambda batch: (ops.extend(batch), original(batch))
+    kernel.set_wire_format("json")
+    _mount(wyb, root_element, {"on_scroll": events.listener(fn, coalesce="frame")})
+    assert [op for op in ops if op[0] == kernel.OP_LISTEN][0][3] == kernel.LISTEN_COALESCE
+
+
+def test_unknown_coalesce_mode_raises(wyb):
+    with pytest.raises(ValueError):
+        wyb["events"].listener(lambda e: None, coalesce="idle")
@@ -0,0 +1,97 @@
+"""Tests for the single-crossing ``"path"`` event dispatch mode.
+
+The kernel collects every matched node id of one native event and calls
+Python once; the handlers run inside one ``batch`` with one commit.
+"""
+
+import pytest
+
+from wybthon import h
+
+
+def _nested(wyb, root_element, depth, make_handler):
+    tree = h("b", {"on_click": make_handler(depth)}, "x")
+    for level in range(depth - 1, 0, -1):
+        tree = h("div", {"on_click": make_handler(level)}, tree)
+    wyb["reconciler"].render(tree, root_element)
+    node = root_element.element
+    for _ in range(depth):
+        node = node.childNodes[0]
+    return node
+
+
+def _count_calls(backend):
+    calls = {"node": 0, "path": 0}
+    node_fn, path_fn = backend._dispatcher, backend._path_dispatcher
+
+    def on_node(*args):
+        calls["node"] += 1
+        return node_fn(*args)
+
+    def on_path(*args):
+        calls["path"] += 1
+        return path_fn(*args)
+
+    backend.set_dispatcher(on_node, on_path)
+    return calls
+
+
+def test_one_crossing_and_one_commit_per_event(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    total, set_total = rx.create_signal(0)
+    order = []
+    runs = []
+    rx.create_effect(lambda: runs.append(total()))
+
+    def make(level):
+        def handler(e):
+            order.append(level)
+            set_total(total() + level)
+
+        return handler
+
+    target = _nested(wyb, root_element, 5, make)
+    kernel.set_event_dispatch_mode("path")
+    calls = _count_calls(kernel._backend)
+    runs.clear()
+    kernel.reset_stats()
+
+    assert kernel._backend.dispatch("click", target) == 0
+    assert order == [5, 4, 3, 2, 1]
+    assert calls == {"node": 0, "path": 1}
+    assert runs == [15]
+
+
+def test_stop_propagation_and_prevent_default_become_flags(wyb, root_element):
+    kernel = wyb["kernel"]
+    order = []
+
+    def make(level):
+        def handler(e):
+            order.append(level)
+            if level == 4:
+                e.prevent_default()
+            if level == 3:
+                e.stop_propagation()
+
+        return handler
+
+    target = _nested(wyb, root_element, 5, make)
+    kernel.set_event_dispatch_mode("path")
+
+    flags = kernel._backend.dispatch("click", target)
+    assert order == [5, 4, 3]
+    assert flags == kernel.FLAG_STOP_PROPAGATION | kernel.FLAG_PREVENT_DEFAULT
+
+
+def test_node_mode_is_the_default(wyb, root_element):
+    kernel = wyb["kernel"]
+    target = _nested(wyb, root_element, 3, lambda level: lambda e: None)
+    calls = _count_calls(kernel._backend)
+    kernel._backend.dispatch("click", target)
+    assert calls == {"node": 3, "path": 0}
+
+
+def test_unknown_mode_raises(wyb):
+    with pytest.raises(ValueError):
+        wyb["kernel"].set_event_dispatch_mode("tree")
@@ -0,0 +1,146 @@
+"""Tests for per-listener event payload schemas.
+
+The kernel builds only the payload fields an event needs: the event
+type's defaults (``DEFAULT_EVENT_FIELDS``), or the list a listener
+declares with ``listener(fn, fields=...)``, registered once per batch
+through ``OP_EVENT_FIELDS``.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from conftest import StubNode
+
+from wybthon import h
+
+
+def _capture_payloads(backend):
+    payloads = []
+    node_fn, path_fn = backend._dispatcher, backend._path_dispatcher
+
+    def on_node(node_id, event_type, payload_json):
+        payloads.append(json.loads(payload_json))
+        return node_fn(node_id, event_type, payload_json)
+
+    def on_path(node_ids, event_type, payload_json):
+        payloads.append(json.loads(payload_json))
+        return path_fn(node_ids, event_type, payload_json)
+
+    backend.set_dispatcher(on_node, on_path)
+    return payloads
+
+
+def test_default_fields_follow_event_type(wyb, root_element):
+    kernel = wyb["kernel"]
+    backend = kernel._backend
+    seen = []
+    wyb["reconciler"].render(
+        h("input", {"on_click": lambda e: seen.append(e.button), "on_keydown": lambda e: seen.append(e.key)}),
+        root_element,
+    )
+    node = root_element.element.childNodes[0]
+    payloads = _capture_payloads(backend)
+
+    backend.dispatch("click", node, payload={"button": 2, "key": "x"})
+    backend.dispatch("keydown", node, payload={"key": "Enter"})
+
+    assert set(payloads[0]) == {"type", "targetId", *kernel.DEFAULT_EVENT_FIELDS["click"]}
+    assert "key" not in payloads[0] and "clientX" not in payloads[1]
+    assert seen == [2, "Enter"]
+
+
+def test_declared_fields_register_one_schema(wyb, root_element):
+    kernel, events = wyb["kernel"], wyb["events"]
+    backend = kernel._backend
+    seen = []
+    ops = []
+    original = backend.apply
+    backend.apply = lambda batch: (ops.extend(batch), original(batch))
+    kernel.set_wire_format("json")
+
+    def on_wheel(e):
+        seen.append((e.delta_y, e.target.selection_start))
+
+    fields = ("deltaY", "target.selectionStart")
+    wyb["reconciler"].render(
+        h(
+            "div",
+            {"on_wheel": events.listener(on_wheel, fields=fields)},
+            h("textarea", {"on_wheel": events.listener(on_wheel, fields=fields)}),
+        ),
+        root_element,
+    )
+    area = root_element.element.childNodes[0].childNodes[0]
+    area.selectionStart = 4
+    payloads = _capture_payloads(backend)
+    backend.dispatch("wheel", area, payload={"deltaY": -120, "clientX": 9})
+
+    assert [op for op in ops if op[0] == kernel.OP_EVENT_FIELDS] == [(kernel.OP_EVENT_FIELDS, 1, ",".join(fields))]
+    assert payloads[0] == {"type": "wheel", "targetId": area._wyb_id, "deltaY": -120, "target.selectionStart": 4}
+    assert seen == [(-120, 4), (-120, 4)]
+
+
+def test_missing_fields_fall_back_to_raw_event_then_defaults(wyb, root_element):
+    backend, events = wyb["kernel"]._backend, wyb["events"]
+    seen = []
+    later = []
+
+    def on_click(e):
+        seen.append((e.key, e.pointer_id, e.client_x, e.target.value))
+        later.append(e)
+
+    wyb["reconciler"].render(h("button", {"on_click": events.listener(on_click, fields=[])}), root_element)
+    button = root_element.element.childNodes[0]
+    button.value = "go"
+    raw = SimpleNamespace(key="k", pointerId=7, clientX=None)
+
+    backend.dispatch("click", button, raw)
+
+    assert seen == [("k", 7, 0, "go")]
+    evt = later[0]
+    assert evt.key is None and evt.client_x == 0
+    with pytest.raises(AttributeError):
+        evt.pointer_id
+
+
+def test_path_mode_sends_union_of_schemas(wyb, root_element):
+    kernel, events = wyb["kernel"], wyb["events"]
+    backend = kernel._backend
+    kernel.set_event_dispatch_mode("path")
+    seen = []
+    wyb["reconciler"].render(
+        h(
+            "div",
+            {"on_pointermove": events.listener(lambda e: seen.append(e.pointer_id), fields=["pointerId"])},
+            h("span", {"on_pointermove": events.listener(lambda e: seen.append(e.pressure), fields=["pressure"])}),
+        ),
+        root_element,
+    )
+    span = root_element.element.childNodes[0].childNodes[0]
+    payloads = _capture_payloads(backend)
+
+    backend.dispatch("pointermove", span, payload={"pointerId": 3, "pressure": 0.5})
+
+    assert len(payloads) == 1
+    assert set(payloads[0]) == {"type", "targetId", "pointerId", "pressure"}
+    assert seen == [0.5, 3]
+
+
+def test_changing_fields_relistens(wyb):
+    kernel, events = wyb["kernel"], wyb["events"]
+    nid = kernel.adopt(StubNode(tag="div"))
+    events.set_handler(nid, "on_input", events.listener(print, fields=["value"]))
+    kernel.commit()
+    events.set_handler(nid, "on_input", events.listener(len, fields=["value"]))
+    assert not kernel._ops
+
+    events.set_handler(nid, "on_input", events.listener(print, fields=["value", "target.selectionEnd"]))
+    assert [op[0] for op in kernel._ops] == [kernel.OP_EVENT_FIELDS, kernel.OP_LISTEN]
+    assert kernel._ops[1][3] >> kernel.LISTEN_SCHEMA_SHIFT == 2
+
+
+@pytest.mark.parametrize("fields", [[""], ["a,b"], [3]])
+def test_invalid_field_names_raise(wyb, fields):
+    with pytest.raises(ValueError):
+        wyb["events"].listener(print, fields=fields)
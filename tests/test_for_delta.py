@@ -0,0 +1,187 @@
+"""Tests for incremental `For` updates.
+
+`map_array` records what each recompute changed (rows inserted, moved,
+and removed) and `For` applies that change set to the DOM directly, so
+appending, removing, or swapping rows costs ops proportional to the
+change rather than the list length.
+"""
+
+import gc
+import random
+
+from conftest import list_rows, mount_list, record_ops
+
+from wybthon.vnode import Fragment, h
+
+
+def _texts(ul):
+    return [r.childNodes[0].nodeValue for r in list_rows(ul)]
+
+
+def _indexed_row(item, idx):
+    return h("li", {}, lambda: f"{idx()}:{item()}")
+
+
+def _expected(values):
+    return [f"{i}:{v}" for i, v in enumerate(values)]
+
+
+def _dom_ops(kernel, ops):
+    return [op[0] for op in ops if op[0] != kernel.OP_RELEASE]
+
+
+def test_swap_moves_two_rows(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    values = [f"r{i}" for i in range(1000)]
+    items, set_items = rx.create_signal(values)
+    calls = []
+
+    def row(item, idx):
+        calls.append(item())
+        return h("li", {}, item())
+
+    ul = mount_list(wyb, root_element, items, row)
+    calls.clear()
+    before = list_rows(ul)
+    ops = record_ops(kernel)
+
+    swapped = list(values)
+    swapped[1], swapped[998] = swapped[998], swapped[1]
+    set_items(swapped)
+
+    assert calls == []
+    assert _dom_ops(kernel, ops) == [kernel.OP_INSERT, kernel.OP_INSERT]
+    assert _texts(ul) == swapped
+    assert sorted(map(id, list_rows(ul))) == sorted(map(id, before))
+
+
+def test_remove_one_row_shifts_indices(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    cleanups = []
+    values = [f"r{i}" for i in range(200)]
+    items, set_items = rx.create_signal(values)
+
+    def row(item, idx):
+        name = item()
+        rx.on_cleanup(lambda: cleanups.append(name))
+        return _indexed_row(item, idx)
+
+    ul = mount_list(wyb, root_element, items, row)
+    ops = record_ops(kernel)
+
+    remaining = values[:50] + values[51:]
+    set_items(remaining)
+
+    ops_by_kind = _dom_ops(kernel, ops)
+    assert ops_by_kind.count(kernel.OP_REMOVE) == 1
+    assert kernel.OP_INSERT not in ops_by_kind
+    assert cleanups == ["r50"]
+    assert _texts(ul) == _expected(remaining)
+
+
+def test_append_mounts_only_new_rows(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    values = [f"r{i}" for i in range(500)]
+    items, set_items = rx.create_signal(values)
+    ul = mount_list(wyb, root_element, items, _indexed_row)
+    ops = record_ops(kernel)
+
+    grown = values + ["x", "y"]
+    set_items(grown)
+
+    # Two small row mounts; the 500 existing rows see no ops at all.
+    assert len(_dom_ops(kernel, ops)) < 20
+    assert kernel.OP_REMOVE not in _dom_ops(kernel, ops)
+    assert _texts(ul) == _expected(grown)
+
+
+def test_random_edits_match_a_fresh_render(wyb, root_element):
+    rx = wyb["reactivity"]
+    rng = random.Random(20)
+    # Small ints repeat, so the list also exercises duplicate items.
+    values = [rng.randrange(12) for _ in range(15)]
+    items, set_items = rx.create_signal(values)
+    live = {}
+
+    def row(item, idx):
+        key = object()
+        live[key] = item()
+        rx.on_cleanup(lambda: live.pop(key))
+        return _indexed_row(item, idx)
+
+    ul = mount_list(wyb, root_element, items, row)
+    for _ in range(300):
+        values = list(values)
+        op = rng.randrange(5)
+        if op == 0:
+            values.insert(rng.randrange(len(values) + 1), rng.randrange(12))
+        elif op == 1 and values:
+            del values[rng.randrange(len(values))]
+        elif op == 2 and len(values) > 1:
+            i, j = rng.randrange(len(values)), rng.randrange(len(values))
+            values[i], values[j] = values[j], values[i]
+        elif op == 3:
+            rng.shuffle(values)
+        else:
+            lo = rng.randrange(len(values) + 1)
+            values[lo : lo + rng.randrange(4)] = [rng.randrange(12) for _ in range(rng.randrange(4))]
+        set_items(values)
+        assert _texts(ul) == _expected(values)
+        assert sorted(live.values()) == sorted(values)
+
+
+def test_keyed_refetch_updates_text_in_place(wyb, root_element):
+    kernel, rx, flow = wyb["kernel"], wyb["reactivity"], wyb["flow"]
+    rows = [{"id": i, "label": f"row {i}"} for i in range(100)]
+    items, set_items = rx.create_signal(rows)
+    calls = []
+
+    def row(item, idx):
+        calls.append(item()["id"])
+        return h("li", {}, lambda: item()["label"])
+
+    wyb["reconciler"].render(h("ul", {}, flow.For(each=items, key="id", children=row)), root_element)
+    ul = root_element.element.childNodes[0]
+    before = list_rows(ul)
+    calls.clear()
+    ops = record_ops(kernel)
+
+    refetched = [dict(r) for r in rows]
+    refetched[7]["label"] = "changed"
+    set_items(refetched)
+
+    assert calls == []
+    assert list_rows(ul) == before
+    assert [op[0] for op in ops] == [kernel.OP_SET_TEXT]
+    assert _texts(ul)[7] == "changed"
+
+
+def test_fragment_rows_fall_back_to_a_full_diff(wyb, root_element):
+    rx = wyb["reactivity"]
+    items, set_items = rx.create_signal(["a", "b", "c"])
+
+    def row(item, idx):
+        return Fragment(h("li", {}, item()), h("li", {}, item().upper()))
+
+    ul = mount_list(wyb, root_element, items, row)
+    set_items(["c", "a", "d"])
+    assert _texts(ul) == ["c", "C", "a", "A", "d", "D"]
+
+
+def test_updates_do_not_chain_old_fragments(wyb, root_element):
+    rx, vnode = wyb["reactivity"], wyb["vnode"]
+    values = [f"r{i}" for i in range(50)]
+    items, set_items = rx.create_signal(values)
+    mount_list(wyb, root_element, items, _indexed_row)
+
+    def live_fragments():
+        gc.collect()
+        return sum(1 for o in gc.get_objects() if isinstance(o, vnode.VNode) and o.tag == "_fragment")
+
+    set_items(values[1:] + values[:1])
+    before = live_fragments()
+    for step in range(200):
+        values = values[1:] + [f"n{step}"]
+        set_items(values)
+    assert live_fragments() == before
+    assert _texts(root_element.element.childNodes[0]) == _expected(values)
@@ -0,0 +1,60 @@
+"""Tests for node id recycling.
+
+Ids released through ``kernel.release`` are handed out again before the
+id space grows, so both backends' array registries stay dense across
+create/clear cycles.
+"""
+
+from conftest import list_rows, mount_list
+
+from wybthon.vnode import h
+
+
+def test_released_ids_are_reused_before_growing(wyb):
+    kernel = wyb["kernel"]
+    first = kernel.alloc_ids(6)
+    single = kernel.alloc_id()
+    kernel.release([first + 1, first + 2, first + 3, single])
+    assert kernel.stats()["free_slots"] == 4
+
+    assert kernel.alloc_id() == single
+    assert kernel.alloc_ids(2) == first + 1
+    assert kernel.alloc_id() == first + 3
+    assert kernel.alloc_ids(2) == single + 1
+    assert kernel.stats()["free_slots"] == 0
+
+
+def test_create_clear_cycles_do_not_grow_the_registry(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    items, set_items = rx.create_signal([])
+    ul = mount_list(wyb, root_element, items, lambda item, idx: h("li", {}, h("b", {}, item()), "!"))
+
+    set_items([f"a{i}" for i in range(40)])
+    set_items([])
+    high_water = kernel.stats()["high_water"]
+    for cycle in range(5):
+        set_items([f"c{cycle}-{i}" for i in range(40)])
+        assert len(list_rows(ul)) == 40
+        set_items([])
+
+    stats = kernel.stats()
+    assert stats["high_water"] == high_water
+    assert stats["live_nodes"] == kernel._backend.live_count()
+    assert list_rows(ul) == []
+
+
+def test_recycled_id_does_not_inherit_handlers(wyb, root_element):
+    kernel, rx = wyb["kernel"], wyb["reactivity"]
+    clicks = []
+    show, set_show = rx.create_signal(True)
+    rec = wyb["reconciler"]
+    rec.render(
+        h("div", {}, lambda: h("button", {"on_click": lambda e: clicks.append("old")}) if show() else h("i", {})),
+        root_element,
+    )
+    old_button = root_element.element.childNodes[0].childNodes[0]
+    set_show(False)
+
+    kernel._backend.dispatch("click", old_button)
+    assert clicks == []
+    assert getattr(old_button, "_wyb_id", None) is None
@@ -0,0 +1,86 @@
+"""Tests for ownership-tree introspection and leak detection."""
+
+from wybthon import introspect
+from wybthon.flow import For, Show
+from wybthon.reactivity import create_effect, create_memo, create_root, create_signal, index_array, map_array
+from wybthon.vnode import h
+
+
+def test_snapshot_counts_nodes_by_kind():
+    count, _ = create_signal(0)
+
+    def setup(dispose):
+        create_memo(lambda: count() * 2)
+        create_effect(lambda: count())
+        return dispose
+
+    dispose = create_root(setup)
+    snap = introspect.snapshot()
+    dispose()
+    assert introspect.diff(snap, introspect.snapshot()) == {"roots": -1, "owner": -1, "memo": -1, "effect": -1}
+
+
+def test_forgotten_root_shows_up_as_growth():
+    before = introspect.snapshot()
+    leaked = [create_root(lambda dispose: create_effect(lambda: None) and dispose) for _ in range(3)]
+    changes = introspect.diff(before, introspect.snapshot())
+    assert changes == {"roots": 3, "owner": 3, "effect": 3}
+    for dispose in leaked:
+        dispose()
+
+
+def test_list_rows_are_counted_as_rows():
+    items, set_items = create_signal(["a", "b", "c"])
+
+    def setup(dispose):
+        mapped = map_array(items, lambda item, index: item())
+        indexed = index_array(items, lambda item, index: index)
+        return dispose, mapped, indexed
+
+    before = introspect.snapshot()
+    dispose, mapped, indexed = create_root(setup)
+    mapped(), indexed()
+    assert introspect.diff(before, introspect.snapshot()) == {"roots": 1, "owner": 1, "memo": 2, "row": 6, "signals": 9}
+
+    set_items(["a"])
+    mapped(), indexed()
+    assert introspect.snapshot()["nodes"]["row"] - before["nodes"].get("row", 0) == 2
+    dispose()
+
+
+def test_mount_unmount_cycles_do_not_grow(wyb, root_element):
+    items, set_items = create_signal([1, 2, 3])
+    shown, set_shown = create_signal(False)
+
+    def Row(props):
+        return h("li", {}, lambda: f"row {props.item()}")
+
+    def List(props):
+        return h("ul", {}, For(each=items, children=lambda item, index: h(Row, {"item": item})))
+
+    wyb["reconciler"].render(h("div", {}, Show(when=shown, children=lambda: h(List, {}))), root_element)
+
+    def cycle():
+        set_shown(True)
+        set_items([3, 4])
+        set_shown(False)
+
+    cycle()
+    before = introspect.snapshot()
+    for _ in range(5):
+        cycle()
+    assert introspect.diff(before, introspect.snapshot()) == {}
+
+
+def test_large_observer_sets_are_reported():
+    hot, _ = create_signal("hot")
+
+    def setup(dispose):
+        for _ in range(5):
+            create_effect(lambda: hot())
+        return dispose
+
+    dispose = create_root(setup)
+    snap = introspect.snapshot(observer_threshold=5)
+    assert ("Signal('hot')", 5) in snap["observed"]
+    dispose()
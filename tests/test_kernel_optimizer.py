@@ -0,0 +1,145 @@
+"""Tests for the kernel's peephole optimizer.
+
+``optimize_ops`` collapses last-write-wins ops, merges style decls, and
+drops the lifecycle of nodes created and released inside one batch.
+"""
+
+from conftest import StubNode, collect_texts
+
+from wybthon import create_signal, h
+
+
+def test_set_text_last_write_wins(wyb):
+    k = wyb["kernel"]
+    ops = [(k.OP_SET_TEXT, 5, "a"), (k.OP_SET_TEXT, 6, "x"), (k.OP_SET_TEXT, 5, "b"), (k.OP_SET_TEXT, 5, "c")]
+    assert k.optimize_ops(ops) == [(k.OP_SET_TEXT, 6, "x"), (k.OP_SET_TEXT, 5, "c")]
+
+
+def test_create_text_absorbs_later_set_text(wyb):
+    k = wyb["kernel"]
+    ops = [(k.OP_CREATE_TEXT, 1, "a"), (k.OP_INSERT, 9, 1, None), (k.OP_SET_TEXT, 1, "b")]
+    assert k.optimize_ops(ops) == [(k.OP_CREATE_TEXT, 1, "b"), (k.OP_INSERT, 9, 1, None)]
+
+
+def test_attr_and_prop_of_same_name_order_against_each_other(wyb):
+    k = wyb["kernel"]
+    ops = [
+        (k.OP_SET_ATTR, 1, "class", "a"),
+        (k.OP_SET_ATTR, 1, "class", "b"),
+        (k.OP_SET_ATTR, 1, "value", "x"),
+        (k.OP_SET_PROP, 1, "value", "y"),
+        (k.OP_SET_ATTR, 1, "value", "z"),
+    ]
+    assert k.optimize_ops(ops) == [
+        (k.OP_SET_ATTR, 1, "class", "b"),
+        (k.OP_SET_ATTR, 1, "value", "x"),
+        (k.OP_SET_PROP, 1, "value", "y"),
+        (k.OP_SET_ATTR, 1, "value", "z"),
+    ]
+
+
+def test_style_decls_merge_until_style_attribute(wyb):
+    k = wyb["kernel"]
+    ops = [
+        (k.OP_SET_STYLE, 1, {"color": "red", "width": "1px"}),
+        (k.OP_SET_STYLE, 1, {"color": "blue"}),
+        (k.OP_SET_ATTR, 1, "style", ""),
+        (k.OP_SET_STYLE, 1, {"height": None}),
+    ]
+    assert k.optimize_ops(ops) == [
+        (k.OP_SET_STYLE, 1, {"color": "blue", "width": "1px"}),
+        (k.OP_SET_ATTR, 1, "style", ""),
+        (k.OP_SET_STYLE, 1, {"height": None}),
+    ]
+
+
+def test_created_and_released_nodes_vanish(wyb):
+    k = wyb["kernel"]
+    ops = [
+        (k.OP_REGISTER_TPL, 1, "<li><b>x</b></li>"),
+        (k.OP_CLONE_TPL, 10, 3, 1),
+        (k.OP_CREATE_TEXT, 13, "t"),
+        (k.OP_INSERT, 10, 13, None),
+        (k.OP_INSERT, 2, 10, None),
+        (k.OP_SET_TEXT, 12, "y"),
+        (k.OP_LISTEN, 10, "click"),
+        (k.OP_SET_TEXT, 3, "live"),
+        (k.OP_REMOVE, 10),
+        (k.OP_RELEASE, [10, 11, 12, 13, 3]),
+    ]
+    assert k.optimize_ops(ops) == [
+        (k.OP_REGISTER_TPL, 1, "<li><b>x</b></li>"),
+        (k.OP_SET_TEXT, 3, "live"),
+        (k.OP_RELEASE, [3]),
+    ]
+
+
+def test_nodes_still_needed_are_kept(wyb):
+    k = wyb["kernel"]
+    # 20 parents a pre-existing node; 30 anchors a surviving node; 40 is
+    # released while still attached to the live document.
+    ops = [
+        (k.OP_CREATE_ELEMENT, 20, "div"),
+        (k.OP_INSERT, 20, 5, None),
+        (k.OP_CREATE_COMMENT, 30),
+        (k.OP_INSERT, 1, 30, None),
+        (k.OP_CREATE_ELEMENT, 31, "p"),
+        (k.OP_INSERT, 1, 31, 30),
+        (k.OP_REMOVE, 30),
+        (k.OP_CREATE_ELEMENT, 40, "span"),
+        (k.OP_INSERT, 1, 40, None),
+        (k.OP_RELEASE, [20, 30, 40]),
+    ]
+    assert k.optimize_ops(ops) == ops
+
+
+def test_reincarnated_id_is_a_separate_node(wyb):
+    k = wyb["kernel"]
+    ops = [
+        (k.OP_CREATE_ELEMENT, 7, "div"),
+        (k.OP_SET_ATTR, 7, "id", "old"),
+        (k.OP_RELEASE, [7]),
+        (k.OP_CREATE_ELEMENT, 7, "span"),
+        (k.OP_SET_ATTR, 7, "id", "new"),
+        (k.OP_INSERT, 1, 7, None),
+    ]
+    assert k.optimize_ops(ops) == ops[3:]
+
+
+def test_commit_counts_eliminated_ops(wyb, root_element):
+    kernel = wyb["kernel"]
+    kernel.set_optimize(True)
+    rec = wyb["reconciler"]
+    rec.render(h("p", {}, "0"), root_element)
+    text_node = root_element.element.childNodes[0].childNodes[0]
+    kernel.reset_stats()
+
+    for i in range(1, 6):
+        kernel.emit((kernel.OP_SET_TEXT, text_node._wyb_id, str(i)))
+    kernel.commit()
+
+    counters = {k: v for k, v in kernel.stats().items() if k in ("commits", "ops_emitted", "ops_eliminated")}
+    assert counters == {"commits": 1, "ops_emitted": 5, "ops_eliminated": 4}
+    assert text_node.nodeValue == "5"
+
+
+def test_optimized_render_matches_unoptimized(wyb):
+    kernel = wyb["kernel"]
+    rec = wyb["reconciler"]
+    dom = wyb["dom"]
+
+    def run():
+        items, set_items = create_signal([1, 2, 3])
+        root = dom.Element(node=StubNode(tag="div"))
+        rec.render(h("ul", {}, lambda: [h("li", {"class": f"i{i}"}, str(i)) for i in items()]), root)
+        set_items([3, 1])
+        set_items([4, 3, 1, 2])
+        return root.element
+
+    plain = run()
+    kernel.set_optimize(True)
+    optimized = run()
+    assert collect_texts(plain) == collect_texts(optimized)
+    assert [c.attributes for c in plain.childNodes[0].childNodes] == [
+        c.attributes for c in optimized.childNodes[0].childNodes
+    ]
@@ -0,0 +1,155 @@
+"""Tests for the kernel's binary wire format.
+
+``commit`` encodes each op batch into one buffer (an int32 stream plus a
+deduplicated string table) that ``PythonBackend`` decodes exactly like the
+JS kernel, with the JSON encoding kept as a fallback.
+"""
+
+import pytest
+from conftest import StubDocument, StubNode, collect_texts
+
+from wybthon import h
+
+
+def _all_ops(kernel):
+    return [
+        (kernel.OP_REGISTER_TPL, 1, "<div><p>x</p></div>"),
+        (kernel.OP_CREATE_ELEMENT, 1, "div"),
+        (kernel.OP_CREATE_TEXT, 2, "héllo 🌍 world"),
+        (kernel.OP_CREATE_COMMENT, 3),
+        (kernel.OP_CLONE_TPL, 4, 3, 1),
+        (kernel.OP_INSERT, 1, 2, None),
+        (kernel.OP_INSERT, 1, 3, 2),
+        (kernel.OP_REMOVE, 3),
+        (kernel.OP_REMOVE_RANGE, 2, 3),
+        (kernel.OP_CLEAR, 1),
+        (kernel.OP_SET_TEXT, 2, ""),
+        (kernel.OP_SET_ATTR, 1, "class", "row"),
+        (kernel.OP_SET_ATTR, 1, "title", None),
+        (kernel.OP_SET_PROP, 1, "value", "abc"),
+        (kernel.OP_SET_PROP, 1, "checked", True),
+        (kernel.OP_SET_PROP, 1, "checked", False),
+        (kernel.OP_SET_PROP, 1, "tabIndex", -3),
+        (kernel.OP_SET_PROP, 1, "scrollTop", 12.5),
+        (kernel.OP_SET_PROP, 1, "big", 2**40),
+        (kernel.OP_SET_PROP, 1, "value", None),
+        (kernel.OP_SET_STYLE, 1, {"color": "red", "margin-top": None}),
+        (kernel.OP_SET_STYLE, 1, {}),
+        (kernel.OP_LISTEN, 1, "click"),
+        (kernel.OP_LISTEN, 1, "scroll", kernel.LISTEN_COALESCE | kernel.LISTEN_PASSIVE),
+        (kernel.OP_EVENT_FIELDS, 1, "deltaY,target.selectionStart"),
+        (kernel.OP_LISTEN, 1, "wheel", 1 << kernel.LISTEN_SCHEMA_SHIFT | kernel.LISTEN_PASSIVE),
+        (kernel.OP_UNLISTEN, 1, "click"),
+        (kernel.OP_RELEASE, [1, 2, 3]),
+        (kernel.OP_RELEASE, []),
+    ]
+
+
+def test_encode_decode_round_trip(wyb):
+    kernel = wyb["kernel"]
+    ops = _all_ops(kernel)
+    assert kernel.decode_ops(kernel.encode_ops(ops)) == ops
+
+
+def test_strings_are_deduplicated_per_batch(wyb):
+    kernel = wyb["kernel"]
+    ops = [(kernel.OP_CREATE_ELEMENT, i, "div") for i in range(1, 101)]
+    buf = kernel.encode_ops(ops)
+    # header + 3 words per op + one string length, then the single "div".
+    assert len(buf) == 4 * (3 + 300 + 1) + 3
+
+
+def test_unknown_opcode_and_version_raise(wyb):
+    kernel = wyb["kernel"]
+    with pytest.raises(ValueError):
+        kernel.encode_ops([(99, 1)])
+    buf = bytearray(kernel.encode_ops([(kernel.OP_REMOVE, 1)]))
+    buf[0] = 7
+    with pytest.raises(ValueError):
+        kernel.decode_ops(bytes(buf))
+
+
+def test_commit_uses_binary_by_default(wyb, root_element):
+    kernel = wyb["kernel"]
+    backend = kernel._backend
+    seen = []
+    original = backend.apply_binary
+
+    def spy(buf):
+        seen.append(buf)
+        original(buf)
+
+    backend.apply_binary = spy
+    wyb["reconciler"].render(h("div", {}, h("p", {}, "hi")), root_element)
+    assert seen and all(isinstance(b, bytes) for b in seen)
+    assert "hi" in collect_texts(root_element.element)
+
+
+def test_json_fallback_renders_identically(wyb, browser_stubs):
+    kernel = wyb["kernel"]
+    rec = wyb["reconciler"]
+    dom = wyb["dom"]
+
+    def render_into():
+        root = dom.Element(node=StubNode(tag="div"))
+        tree = h("ul", {"class": "list", "style": {"color": "red"}}, *[h("li", {}, f"item {i}") for i in range(5)])
+        rec.render(tree, root)
+        return root.element
+
+    binary_root = render_into()
+    kernel.set_wire_format("json")
+    calls = []
+    original = kernel._backend.apply
+    kernel._backend.apply = lambda ops: (calls.append(ops), original(ops))
+    json_root = render_into()
+
+    assert calls
+    assert collect_texts(binary_root) == collect_texts(json_root)
+    assert binary_root.childNodes[0].attributes == json_root.childNodes[0].attributes
+
+
+def test_set_wire_format_rejects_unknown(wyb):
+    with pytest.raises(ValueError):
+        wyb["kernel"].set_wire_format("msgpack")
+
+
+def test_names_are_interned_across_batches(wyb):
+    kernel = wyb["kernel"]
+    encoder_names = {}
+    decoder_names = []
+    ops = [
+        (kernel.OP_CREATE_ELEMENT, 1, "div"),
+        (kernel.OP_SET_ATTR, 1, "class", "row"),
+        (kernel.OP_SET_STYLE, 1, {"color": "red"}),
+        (kernel.OP_LISTEN, 1, "click"),
+    ]
+    first = kernel.encode_ops(ops, encoder_names)
+    second = kernel.encode_ops(ops, encoder_names)
+
+    assert encoder_names == {"div": 0, "class": 1, "color": 2, "click": 3}
+    assert len(second) < len(first)
+    assert kernel.decode_ops(first, decoder_names) == ops
+    assert kernel.decode_ops(second, decoder_names) == ops
+    assert decoder_names == ["div", "class", "color", "click"]
+
+
+def test_name_table_is_bounded(wyb, monkeypatch):
+    kernel = wyb["kernel"]
+    monkeypatch.setattr(kernel, "MAX_INTERNED_NAMES", 2)
+    names = {}
+    ops = [(kernel.OP_SET_ATTR, 1, f"data-k{i}", "v") for i in range(5)]
+    buf = kernel.encode_ops(ops, names)
+    assert len(names) == 2
+    assert kernel.decode_ops(buf, []) == ops
+
+
+def test_backend_change_resets_name_table(wyb, root_element):
+    kernel = wyb["kernel"]
+    wyb["reconciler"].render(h("div", {"title": "x"}, "a"), root_element)
+    assert kernel._name_ids
+
+    kernel.set_backend(kernel.PythonBackend(StubDocument()))
+    assert kernel._name_ids == {}
+    kernel.emit((kernel.OP_CREATE_ELEMENT, 500, "div"))
+    kernel.commit()
+    assert kernel._backend.get_node(500).tag == "div"
@@ -4,6 +4,7 @@ from conftest import collect_texts
 
 from wybthon.reactivity import (
     create_effect,
+    create_multi_selector,
     create_root,
     create_selector,
     create_signal,
@@ -144,6 +145,59 @@ def test_map_array_disposes_all_on_empty():
     assert disposed[0] == 2
 
 
+# ---------------------------------------------------------------------------
+# map_array — key=
+# ---------------------------------------------------------------------------
+
+
+def test_map_array_key_keeps_scopes_across_refetch():
+    rows = [{"id": i, "name": f"n{i}"} for i in range(3)]
+    items, set_items = create_signal(rows)
+    calls = []
+    names = []
+
+    def map_fn(item, idx):
+        calls.append(item()["id"])
+        create_effect(lambda: names.append(item()["name"]))
+        return item
+
+    mapped = create_root(lambda dispose: map_array(items, map_fn, key="id"))
+    getters = mapped()
+    names.clear()
+
+    # A refetch returns equal dicts: no remaps and no notifications.
+    set_items([dict(r) for r in rows])
+    assert mapped() == getters
+    assert calls == [0, 1, 2]
+    assert names == []
+
+    # One changed row notifies just that row, and it sees the new object.
+    fresh = [dict(r) for r in rows]
+    fresh[1]["name"] = "renamed"
+    set_items(fresh[::-1])
+    assert mapped() == getters[::-1]
+    assert calls == [0, 1, 2]
+    assert names == ["renamed"]
+    assert getters[1]() is fresh[1]
+
+
+def test_map_array_key_callable_and_attribute():
+    class User:
+        def __init__(self, uid):
+            self.uid = uid
+
+    items, set_items = create_signal([User(1), User(2)])
+    by_attr = map_array(items, lambda item, idx: item, key="uid")
+    by_fn = map_array(items, lambda item, idx: item, key=lambda user: user.uid)
+    first_attr, first_fn = by_attr(), by_fn()
+
+    set_items([User(2), User(3)])
+    assert by_attr()[0] is first_attr[1]
+    assert by_fn()[0] is first_fn[1]
+    assert by_attr()[0]().uid == 2
+    assert by_attr()[1] not in first_attr
+
+
 # ---------------------------------------------------------------------------
 # index_array — basic behaviour
 # ---------------------------------------------------------------------------
@@ -289,6 +343,33 @@ def test_create_selector_same_value_no_op():
     assert runs[0] == 1
 
 
+def test_create_multi_selector_notifies_only_toggled_keys():
+    checked, set_checked = create_signal(frozenset({1, 2}))
+    is_checked = create_multi_selector(checked)
+    runs = {k: 0 for k in range(5)}
+    seen = {}
+
+    def track(key):
+        def eff():
+            seen[key] = is_checked(key)
+            runs[key] += 1
+
+        return eff
+
+    create_root(lambda dispose: [create_effect(track(k)) for k in range(5)])
+    assert seen == {0: False, 1: True, 2: True, 3: False, 4: False}
+
+    set_checked(lambda keys: keys ^ {2, 3})
+    assert runs == {0: 1, 1: 1, 2: 2, 3: 2, 4: 1}
+    assert seen[2] is False and seen[3] is True
+
+    # An equal plain set is a no-op; None clears the selection.
+    set_checked({1, 3})
+    set_checked(None)
+    assert runs == {0: 1, 1: 2, 2: 2, 3: 3, 4: 1}
+    assert not any(seen.values())
+
+
 # ---------------------------------------------------------------------------
 # map_array / index_array rendered through VDOM
 # ---------------------------------------------------------------------------
@@ -0,0 +1,107 @@
+"""Array-slot dependency edges between sources and computations.
+
+Each edge is stored on both ends as a ``(node, slot)`` pair in a flat
+list: the source's ``_observers`` and the computation's ``_sources``.
+``slot`` is the index of the matching pair on the other end, so either
+side can unlink the edge with a swap-removal.
+"""
+
+import random
+
+from wybthon.reactivity import Signal, computed, create_effect, effect
+
+
+def _assert_consistent(comps, sources):
+    for comp in comps:
+        srcs = comp._sources or []
+        assert None not in srcs
+        for p in range(0, len(srcs), 2):
+            src, j = srcs[p], srcs[p + 1]
+            assert src._observers[j] is comp
+            assert src._observers[j + 1] == p
+    for src in sources:
+        obs = src._observers or []
+        for j in range(0, len(obs), 2):
+            comp, p = obs[j], obs[j + 1]
+            assert comp._sources[p] is src
+            assert comp._sources[p + 1] == j
+
+
+def test_signal_edges_are_flat_pairs():
+    a = Signal(1)
+    comps = [create_effect(lambda: a.get()) for _ in range(3)]
+    assert a._observers == [comps[0], 0, comps[1], 0, comps[2], 0]
+    assert comps[1]._sources == [a, 2]
+    _assert_consistent(comps, [a])
+
+
+def test_disposing_a_middle_observer_swaps_in_the_last():
+    a = Signal(1)
+    first, middle, last = (create_effect(lambda: a.get()) for _ in range(3))
+    middle.dispose()
+    assert a._observers[::2] == [first, last]
+    _assert_consistent([first, last], [a])
+
+    a.set(2)
+    _assert_consistent([first, last], [a])
+
+
+def test_disposed_memo_is_dropped_from_reader_sources():
+    a, b = Signal(1), Signal(2)
+    memo = computed(lambda: a.get() * 10)
+    seen = []
+    reader = effect(lambda: seen.append((a.get(), memo.get(), b.get())))
+    assert reader._sources[::2] == [a, memo._comp, b]
+
+    memo.dispose()
+    assert reader._sources[::2] == [a, b]
+    _assert_consistent([reader], [a, b])
+
+    b.set(3)
+    assert seen[-1] == (1, 10, 3)
+    _assert_consistent([reader], [a, b])
+
+
+def test_random_dependency_churn_keeps_slots_consistent():
+    rng = random.Random(1234)
+    signals = [Signal(0) for _ in range(8)]
+    plans = []
+    comps = []
+
+    def make(k):
+        def body():
+            for i in plans[k]:
+                signals[i].get()
+
+        return body
+
+    for k in range(12):
+        plans.append(rng.sample(range(8), rng.randint(0, 5)))
+        comps.append(create_effect(make(k)))
+    _assert_consistent(comps, signals)
+
+    for step in range(200):
+        k = rng.randrange(len(comps))
+        plan = rng.sample(range(8), rng.randint(0, 6))
+        if rng.random() < 0.5 and plan:
+            plan.insert(rng.randrange(len(plan)), rng.choice(plan))
+        plans[k] = plan
+        signals[rng.randrange(8)].set(step + 1)
+        comps[k]._update()
+        _assert_consistent(comps, signals)
+        for comp, plan in zip(comps, plans):
+            assert (comp._sources or [])[::2] == [signals[i] for i in dict.fromkeys(plan)]
+
+
+def test_wide_fan_in_reorder_with_duplicate_reads():
+    signals = [Signal(i) for i in range(2000)]
+    order = [signals + signals[:10]]
+    total = computed(lambda: sum(s.get() for s in order[0]))
+    assert total.get() == sum(range(2000)) + sum(range(10))
+    assert total._comp._sources[::2] == signals
+
+    order[0] = signals[::-1] + signals[-5:]
+    signals[0].set(10**6)
+    assert total.get() == sum(range(1, 2000)) + 10**6 + sum(range(1995, 2000))
+    assert total._comp._sources[::2] == signals[::-1]
+    _assert_consistent([total._comp], signals)
@@ -0,0 +1,139 @@
+"""Tests for update priority lanes.
+
+Within each flush phase, ``"user-blocking"`` work runs before
+``"normal"`` work; ``"idle"`` work waits for a later event-loop tick.
+"""
+
+import asyncio
+
+import pytest
+
+from wybthon.reactivity import batch, create_effect, create_memo, create_render_effect, create_signal
+
+
+def test_user_blocking_effect_runs_before_normal_ones():
+    value, set_value = create_signal(0)
+    order = []
+    create_effect(lambda: order.append(("normal", value())))
+    create_effect(lambda: order.append(("urgent", value())), priority="user-blocking")
+    order.clear()
+
+    set_value(1)
+    assert order == [("urgent", 1), ("normal", 1)]
+
+
+def test_batch_priority_tags_the_computations_it_marks_stale():
+    data, set_data = create_signal("old")
+    text, set_text = create_signal("")
+    order = []
+    create_render_effect(lambda: order.append(("refresh", data())))
+    create_render_effect(lambda: order.append(("echo", text())))
+    order.clear()
+
+    with batch():
+        set_data("new")
+        with batch(priority="user-blocking"):
+            set_text("k")
+    assert order == [("echo", "k"), ("refresh", "new")]
+
+    order.clear()
+    batch(lambda: set_text("ke"), priority="user-blocking")
+    set_data("newer")
+    assert order == [("echo", "ke"), ("refresh", "newer")]
+
+
+def test_idle_updates_wait_for_a_later_tick():
+    async def run():
+        rows, set_rows = create_signal(0)
+        seen = []
+        create_effect(lambda: seen.append(rows()))
+
+        with batch(priority="idle"):
+            set_rows(1)
+        assert seen == [0]
+
+        await asyncio.sleep(0)
+        assert seen == [0, 1]
+
+    asyncio.run(run())
+
+
+def test_idle_effect_is_deferred_for_any_update():
+    async def run():
+        value, set_value = create_signal(0)
+        seen = []
+        create_effect(lambda: seen.append(("idle", value())), priority="idle")
+        create_effect(lambda: seen.append(("normal", value())))
+        seen.clear()
+
+        set_value(1)
+        assert seen == [("normal", 1)]
+        await asyncio.sleep(0)
+        assert seen == [("normal", 1), ("idle", 1)]
+
+    asyncio.run(run())
+
+
+def test_more_urgent_update_promotes_queued_idle_work():
+    async def run():
+        value, set_value = create_signal(0)
+        other, set_other = create_signal(0)
+        seen = []
+        create_effect(lambda: seen.append((value(), other())))
+        seen.clear()
+
+        batch(lambda: set_value(1), priority="idle")
+        assert seen == []
+        batch(lambda: set_other(1), priority="user-blocking")
+        assert seen == [(1, 1)]
+
+        await asyncio.sleep(0)
+        assert seen == [(1, 1)]
+
+    asyncio.run(run())
+
+
+def test_urgent_write_promotes_idle_work_queued_through_a_memo():
+    async def run():
+        value, set_value = create_signal(0)
+        other, set_other = create_signal(0)
+        doubled = create_memo(lambda: value() * 2)
+        seen = []
+        create_effect(lambda: seen.append((doubled(), other())))
+        seen.clear()
+
+        # Idle leaves the effect CHECK; the normal write then makes it DIRTY.
+        batch(lambda: set_value(1), priority="idle")
+        set_other(1)
+        assert seen == [(2, 1)]
+
+        await asyncio.sleep(0)
+        assert seen == [(2, 1)]
+
+    asyncio.run(run())
+
+
+def test_urgent_write_through_an_already_stale_memo_promotes_idle_work():
+    async def run():
+        a, set_a = create_signal(0)
+        b, set_b = create_signal(0)
+        total = create_memo(lambda: a() + b())
+        seen = []
+        create_effect(lambda: seen.append(total()))
+        seen.clear()
+
+        batch(lambda: set_a(1), priority="idle")
+        set_b(10)
+        assert seen == [11]
+
+        await asyncio.sleep(0)
+        assert seen == [11]
+
+    asyncio.run(run())
+
+
+def test_unknown_priority_raises():
+    with pytest.raises(ValueError):
+        batch(priority="urgent")
+    with pytest.raises(ValueError):
+        create_effect(lambda: None, priority="later")
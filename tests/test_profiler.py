@@ -0,0 +1,101 @@
+"""Tests for the opt-in reactive graph profiler."""
+
+import pytest
+
+from wybthon import h, profiler
+from wybthon.reactivity import Computation, Signal, create_effect, create_memo, create_signal
+
+
+@pytest.fixture()
+def profiling():
+    profiler.reset()
+    profiler.enable()
+    yield
+    profiler.disable()
+    profiler.reset()
+
+
+def test_disabled_profiler_leaves_the_methods_untouched():
+    update, stale, dispose, set_ = Computation._update, Computation._stale, Computation.dispose, Signal.set
+    profiler.enable()
+    assert Computation._update is not update
+    profiler.disable()
+    assert (Computation._update, Computation._stale, Computation.dispose, Signal.set) == (update, stale, dispose, set_)
+
+
+def test_records_runs_and_triggering_write(profiling):
+    count, set_count = create_signal(0)
+    doubled = create_memo(lambda: count() * 2)
+
+    def log_doubled():
+        doubled()
+
+    create_effect(log_doubled)
+    set_count(1)
+    set_count(2)
+
+    stats = {row["name"]: row for row in profiler.snapshot()}
+    effect = stats["effect test_records_runs_and_triggering_write.<locals>.log_doubled"]
+    assert effect["runs"] == 3
+    assert effect["max_ms"] <= effect["total_ms"]
+    assert sum(effect["triggers"].values()) == 2
+    assert all(site.startswith("test_profiler.py:") for site in effect["triggers"])
+    memo = stats["memo test_records_runs_and_triggering_write.<locals>.<lambda>"]
+    assert memo["runs"] == 3
+    assert memo["total_ms"] <= effect["total_ms"]
+
+
+def test_disposed_computations_are_not_kept_alive(profiling):
+    from wybthon.reactivity import batch, create_root
+
+    count, set_count = create_signal(0)
+    roots = []
+    comp = create_root(lambda dispose: (roots.append(dispose), create_effect(lambda: count()))[1])
+
+    # Marked stale by the write, then disposed before it re-runs.
+    def write_then_dispose():
+        set_count(1)
+        assert comp in profiler._causes
+        roots[0]()
+
+    batch(write_then_dispose)
+    assert comp not in profiler._causes
+
+
+def test_create_effect_prev_wrapper_reports_the_user_function(profiling):
+    value, set_value = create_signal(0)
+
+    def accumulate(prev):
+        return (prev or 0) + value()
+
+    create_effect(accumulate)
+    names = [row["name"] for row in profiler.snapshot()]
+    assert names == ["effect test_create_effect_prev_wrapper_reports_the_user_function.<locals>.accumulate"]
+
+
+def test_holes_are_named_after_getter_and_component(wyb, root_element, profiling):
+    label, set_label = create_signal("a")
+
+    def Badge(props):
+        return h("span", {}, lambda: label().upper())
+
+    wyb["reconciler"].render(h(Badge, {}), root_element)
+    set_label("b")
+
+    rows = [row for row in profiler.snapshot() if row["name"].startswith("hole ")]
+    assert [row["name"] for row in rows] == [
+        "hole test_holes_are_named_after_getter_and_component.<locals>.Badge.<locals>.<lambda> in Badge"
+    ]
+    assert rows[0]["runs"] == 2
+
+
+def test_report_sorts_by_self_time_and_reset_clears(profiling):
+    value, set_value = create_signal(0)
+    create_effect(lambda: value())
+    set_value(1)
+
+    text = profiler.report(limit=5)
+    assert text.splitlines()[0].split()[:2] == ["self", "ms"]
+    assert "test_profiler.py:" in text
+    profiler.reset()
+    assert profiler.snapshot() == []
@@ -0,0 +1,222 @@
+"""Tests for `ResourceCache`: shared, de-duplicated resource fetches.
+
+Resources given the same cache share entries keyed by fetcher (or
+`key=`) and source value. Concurrent fetches for a key run once, cached
+values show immediately (revalidating in the background once stale),
+and entries leave by LRU, TTL, or prefix invalidation.
+"""
+
+import asyncio
+import gc
+
+from conftest import collect_texts
+
+from wybthon.reactivity import ResourceCache, create_resource, create_root, create_signal
+from wybthon.suspense import Suspense
+from wybthon.vnode import h
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_fetcher(calls):
+    async def fetcher(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(0)
+        return f"user {user_id}"
+
+    return fetcher
+
+
+def test_concurrent_resources_share_one_fetch():
+    async def run():
+        cache = ResourceCache()
+        calls = []
+        fetcher = _counting_fetcher(calls)
+        user_id, _ = create_signal(7)
+
+        a = create_root(lambda dispose: create_resource(user_id, fetcher, cache=cache))
+        b = create_root(lambda dispose: create_resource(user_id, fetcher, cache=cache))
+        await asyncio.sleep(0.01)
+
+        assert calls == [7]
+        assert a() == b() == "user 7"
+        assert a.state == b.state == "ready"
+        assert cache.get((fetcher, 7)) == "user 7"
+
+    asyncio.run(run())
+
+
+def test_cached_value_shows_immediately_and_revalidates_when_stale():
+    async def run():
+        clock = FakeClock()
+        cache = ResourceCache(stale_time=10, clock=clock)
+        calls = []
+        fetcher = _counting_fetcher(calls)
+        user_id, _ = create_signal(1)
+
+        create_root(lambda dispose: create_resource(user_id, fetcher, cache=cache, key="user"))
+        await asyncio.sleep(0.01)
+        assert len(cache) == 1
+
+        # Fresh: served from the cache without fetching.
+        fresh = create_root(lambda dispose: create_resource(user_id, fetcher, cache=cache, key="user"))
+        assert fresh.state == "ready"
+        assert fresh() == "user 1"
+        assert calls == [1]
+
+        # Stale: served at once, then refreshed in the background.
+        clock.now = 11
+        stale = create_root(lambda dispose: create_resource(user_id, fetcher, cache=cache, key="user"))
+        assert stale() == "user 1"
+        assert stale.state == "refreshing"
+        await asyncio.sleep(0.01)
+        assert stale.state == "ready"
+        assert calls == [1, 1]
+
+    asyncio.run(run())
+
+
+def test_source_change_switches_entries():
+    async def run():
+        cache = ResourceCache(stale_time=60)
+        calls = []
+        fetcher = _counting_fetcher(calls)
+        user_id, set_user_id = create_signal(1)
+        res = create_root(lambda dispose: create_resource(user_id, fetcher, cache=cache))
+        await asyncio.sleep(0.01)
+
+        set_user_id(2)
+        await asyncio.sleep(0.01)
+        set_user_id(1)
+        assert res() == "user 1"
+        assert res.state == "ready"
+        assert calls == [1, 2]
+
+    asyncio.run(run())
+
+
+def test_lru_and_ttl_eviction():
+    clock = FakeClock()
+    cache = ResourceCache(max_entries=2, ttl=5, clock=clock)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    assert cache.get(("a",)) == 1  # "a" is now the most recently used
+    cache.set(("c",), 3)
+    assert ("b",) not in cache
+    assert cache.get(("a",)) == 1
+
+    clock.now = 6
+    assert cache.get(("c",), "gone") == "gone"
+    assert len(cache) == 1
+
+
+def test_invalidate_by_prefix_refetches_live_resources():
+    async def run():
+        cache = ResourceCache(stale_time=60)
+        calls = []
+
+        async def fetcher(source):
+            calls.append(source)
+            return source
+
+        user, _ = create_signal(("user", 1))
+        post, _ = create_signal(("post", 9))
+        user_res = create_root(lambda dispose: create_resource(user, fetcher, cache=cache, key="api"))
+        post_res = create_root(lambda dispose: create_resource(post, fetcher, cache=cache, key="api"))
+        await asyncio.sleep(0.01)
+        assert ("api", ("user", 1)) in cache
+
+        assert cache.invalidate(("api", "user")) == 1
+        assert user_res.state == "refreshing"
+        assert post_res.state == "ready"
+        await asyncio.sleep(0.01)
+        assert calls == [("user", 1), ("post", 9), ("user", 1)]
+        assert user_res() == ("user", 1)
+
+        assert cache.invalidate("api") == 2
+
+    asyncio.run(run())
+
+
+def test_scalar_and_tuple_sources_do_not_share_entries():
+    async def run():
+        cache = ResourceCache(stale_time=60)
+
+        async def fetcher(source):
+            return repr(source)
+
+        scalar, _ = create_signal(1)
+        single, _ = create_signal((1,))
+        a = create_root(lambda dispose: create_resource(scalar, fetcher, cache=cache, key="k"))
+        await asyncio.sleep(0.01)
+        b = create_root(lambda dispose: create_resource(single, fetcher, cache=cache, key="k"))
+        await asyncio.sleep(0.01)
+        assert (a(), b()) == ("1", "(1,)")
+        assert len(cache) == 2
+        assert cache.invalidate(("k", 1)) == 2
+
+    asyncio.run(run())
+
+
+def test_collected_resources_leave_no_subscriber_records():
+    async def run():
+        cache = ResourceCache(stale_time=60)
+        fetcher = _counting_fetcher([])
+        resources = [
+            create_root(lambda dispose, u=user_id: create_resource(lambda: u, fetcher, cache=cache))
+            for user_id in range(50)
+        ]
+        while any(r.state != "ready" for r in resources):
+            await asyncio.sleep(0)
+        assert len(cache._subscribers) == 50
+
+        del resources
+        gc.collect()
+        assert len(cache) == 50
+        assert len(cache._subscribers) == 0
+
+    asyncio.run(run())
+
+
+def test_failed_fetch_is_not_cached():
+    async def run():
+        cache = ResourceCache()
+        attempts = []
+
+        async def fetcher():
+            attempts.append(1)
+            raise ValueError("down")
+
+        res = create_root(lambda dispose: create_resource(fetcher, cache=cache))
+        await asyncio.sleep(0.01)
+        assert res.state == "errored"
+        assert len(cache) == 0
+
+    asyncio.run(run())
+
+
+def test_cached_hit_skips_suspense_fallback(wyb, root_element):
+    reactivity = wyb["reactivity"]
+    vdom = wyb["reconciler"]
+
+    async def run():
+        cache = reactivity.ResourceCache(stale_time=60)
+
+        async def fetcher():
+            return "fetched"
+
+        cache.set(("profile", None), "cached")
+        res = reactivity.create_resource(fetcher, cache=cache, key="profile")
+        vdom.render(Suspense(fallback="Loading...", children=[h("p", {}, res)]), root_element)
+
+        texts = collect_texts(root_element.element)
+        assert "cached" in texts
+        assert "Loading..." not in texts
+
+    asyncio.run(run())
@@ -0,0 +1,113 @@
+"""Tests for pooled list-row records.
+
+With row pooling on, rows removed from a ``map_array`` / ``index_array``
+keep their record (owner and signals) in a bounded pool, and the next
+rows mapped reuse them instead of allocating new ones.
+"""
+
+import pytest
+
+from wybthon.reactivity import (
+    create_effect,
+    create_root,
+    create_signal,
+    get_owner,
+    index_array,
+    map_array,
+    on_cleanup,
+    set_row_pooling,
+)
+from wybthon.vnode import h
+
+
+@pytest.fixture()
+def pooling():
+    set_row_pooling(4)
+    yield
+    set_row_pooling(0)
+
+
+def test_removed_rows_are_reused(pooling):
+    items, set_items = create_signal(["a", "b", "c"])
+    owners = {}
+    cleanups = []
+
+    def map_fn(item, idx):
+        value = item()
+        owners[value] = get_owner()
+        on_cleanup(lambda: cleanups.append(value))
+        return value
+
+    mapped = create_root(lambda dispose: map_array(items, map_fn))
+    assert mapped() == ["a", "b", "c"]
+
+    set_items([])
+    assert mapped() == []
+    assert sorted(cleanups) == ["a", "b", "c"]
+
+    set_items(["x", "y"])
+    assert mapped() == ["x", "y"]
+    assert {id(owners["x"]), id(owners["y"])} <= {id(owners[k]) for k in "abc"}
+
+    # Revived scopes are fully live again: cleanups run on the next removal.
+    set_items(["y"])
+    assert mapped() == ["y"]
+    assert cleanups[-1] == "x"
+
+
+def test_pool_is_bounded_and_skips_observed_rows(pooling):
+    from wybthon.reactivity import _MappedRow, _row_pools
+
+    items, set_items = create_signal(list(range(10)))
+    leaked = []
+
+    def map_fn(item, idx):
+        if item() == 0:
+            leaked.append(item)
+        return item()
+
+    mapped = create_root(lambda dispose: map_array(items, map_fn))
+    mapped()
+    # Something outside row 0 keeps observing its item signal.
+    create_root(lambda dispose: create_effect(lambda: leaked[0]()))
+
+    set_items([])
+    mapped()
+    pool = _row_pools[_MappedRow]
+    assert len(pool) == 4
+    assert all(row.item_signal._value is None for row in pool)
+    assert leaked[0]() == 0
+
+
+def test_index_array_slots_are_reused(pooling):
+    items, set_items = create_signal(["a", "b"])
+    seen = []
+
+    def map_fn(item, index):
+        create_effect(lambda: seen.append((index, item())))
+        return index
+
+    mapped = create_root(lambda dispose: index_array(items, map_fn))
+    assert mapped() == [0, 1]
+    set_items([])
+    mapped()
+    seen.clear()
+
+    set_items(["p", "q", "r"])
+    assert mapped() == [0, 1, 2]
+    assert seen == [(0, "p"), (1, "q"), (2, "r")]
+    set_items(["p", "z", "r"])
+    mapped()
+    assert seen[-1] == (1, "z")
+
+
+def test_for_rows_render_after_reuse(wyb, root_element, pooling):
+    rx, rec, flow = wyb["reactivity"], wyb["reconciler"], wyb["flow"]
+    items, set_items = rx.create_signal([f"r{i}" for i in range(6)])
+    rec.render(h("ul", {}, flow.For(each=items, children=lambda item, idx: h("li", {}, item))), root_element)
+    ul = root_element.element.childNodes[0]
+
+    for batch in (["a", "b"], [], ["c", "d", "e"], ["e", "c"]):
+        set_items(batch)
+        texts = [n.childNodes[0].nodeValue for n in ul.childNodes if getattr(n, "tag", None) == "li"]
+        assert texts == batch
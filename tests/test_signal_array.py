@@ -0,0 +1,143 @@
+"""Tests for signal arrays.
+
+Each test runs against NumPy storage (when installed) and the
+pure-Python list fallback.
+"""
+
+import pytest
+
+from wybthon import reactivity
+from wybthon.reactivity import batch, create_effect, create_memo, create_signal_array
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(reactivity, "_numpy_module", None)
+    return request.param
+
+
+def _watch(arr, i, seen):
+    create_effect(lambda: seen.append((i, arr[i])))
+
+
+def test_reads_subscribe_per_cell(backend):
+    arr = create_signal_array([1.0, 2.0, 3.0])
+    seen = []
+    _watch(arr, 0, seen)
+    _watch(arr, 2, seen)
+    seen.clear()
+
+    arr.set(2, 30.0)
+    assert seen == [(2, 30.0)]
+    arr.set(2, 30.0)
+    assert seen == [(2, 30.0)]
+    assert arr.peek(-1) == 30.0
+    assert sorted(arr._cells) == [0, 2]
+
+
+def test_update_notifies_only_changed_cells_in_one_flush(backend):
+    arr = create_signal_array([0, 0, 0, 0])
+    seen = []
+    for i in range(4):
+        _watch(arr, i, seen)
+    total = create_memo(lambda: sum(arr()))
+    sums = []
+    create_effect(lambda: sums.append(total()))
+    seen.clear()
+
+    arr.update([0, 5, 0, 7])
+    assert seen == [(1, 5), (3, 7)]
+    assert sums == [0, 12]
+
+    seen.clear()
+    arr.set_many([0, 3], [9, 7])
+    assert seen == [(0, 9)]
+    assert sums == [0, 12, 21]
+
+
+def test_bulk_write_joins_an_enclosing_batch(backend):
+    arr = create_signal_array([1, 2])
+    seen = []
+    create_effect(lambda: seen.append((arr[0], arr[1])))
+    with batch():
+        arr.set(0, 10)
+        arr.update([10, 20])
+    assert seen == [(1, 2), (10, 20)]
+
+
+def test_unwatched_cells_are_dropped_on_write(backend):
+    arr = create_signal_array([1, 2, 3])
+    effect = create_effect(lambda: arr[1])
+    assert list(arr._cells) == [1]
+    effect.dispose()
+    arr.set(1, 4)
+    assert arr._cells == {}
+
+
+def test_length_and_index_errors(backend):
+    arr = create_signal_array([1, 2, 3])
+    assert len(arr) == 3
+    with pytest.raises(IndexError):
+        arr.peek(3)
+    with pytest.raises(ValueError):
+        arr.update([1, 2])
+
+
+def test_set_many_rejects_out_of_range_indices(backend):
+    arr = create_signal_array([1, 2, 3, 4, 5])
+    arr.set_many([-5], [10])
+    assert arr.peek(0) == 10
+    for bad in (-6, 5):
+        with pytest.raises(IndexError):
+            arr.set_many([1, bad], [20, 30])
+        assert [arr.peek(i) for i in range(5)] == [10, 2, 3, 4, 5]
+
+
+def test_nan_to_nan_is_not_a_change(backend):
+    nan = float("nan")
+    arr = create_signal_array([nan, 1.0])
+    seen = []
+    _watch(arr, 0, seen)
+    _watch(arr, 1, seen)
+    seen.clear()
+
+    arr.set_many([0, 1], [float("nan"), 2.0])
+    assert seen == [(1, 2.0)]
+    arr.update([float("nan"), 3.0])
+    assert seen == [(1, 2.0), (1, 3.0)]
+
+
+def test_numpy_mask_treats_nan_as_unchanged():
+    np = pytest.importorskip("numpy")
+    arr = create_signal_array(np.array([np.nan, 1.0]))
+    seen = []
+    _watch(arr, 0, seen)
+    _watch(arr, 1, seen)
+    seen.clear()
+
+    arr.update(np.array([np.nan, 2.0]))
+    assert seen == [(1, 2.0)]
+    with pytest.raises(ValueError):
+        create_signal_array(np.zeros((2, 2)))
+
+
+def test_sparse_watchers_on_a_large_array(backend):
+    arr = create_signal_array([0] * 1000)
+    seen = []
+    _watch(arr, 10, seen)
+    whole = []
+    create_effect(lambda: whole.append(len(arr())))
+    seen.clear()
+
+    changed = [0] * 1000
+    changed[500] = 1
+    arr.update(changed)
+    assert seen == []
+    assert whole == [1000, 1000]
+
+    changed[10] = 2
+    arr.update(changed)
+    assert seen == [(10, 2)]
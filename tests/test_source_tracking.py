@@ -0,0 +1,99 @@
+"""Incremental dependency tracking in ``Computation._update``.
+
+A re-run compares its reads against the previous run's sources by
+position: edges read again in the same order are left alone, and only
+sources that were dropped or newly read are unlinked or linked.
+"""
+
+from wybthon.reactivity import Signal, create_effect, create_memo, create_signal, effect
+
+
+def _count_edge_churn(monkeypatch):
+    churn = {"add": 0, "remove": 0}
+    add, remove = Signal._add_observer, Signal._remove_observer
+
+    def counting_add(self, comp, slot):
+        churn["add"] += 1
+        return add(self, comp, slot)
+
+    def counting_remove(self, index):
+        churn["remove"] += 1
+        remove(self, index)
+
+    monkeypatch.setattr(Signal, "_add_observer", counting_add)
+    monkeypatch.setattr(Signal, "_remove_observer", counting_remove)
+    return churn
+
+
+def test_stable_dependencies_keep_their_edges(monkeypatch):
+    churn = _count_edge_churn(monkeypatch)
+    a, set_a = create_signal(1)
+    b, _ = create_signal(2)
+    c, _ = create_signal(3)
+    seen = []
+    create_effect(lambda: seen.append(a() + b() + c()))
+    assert churn == {"add": 3, "remove": 0}
+
+    for i in range(5):
+        set_a(i + 10)
+
+    assert seen == [6, 15, 16, 17, 18, 19]
+    assert churn == {"add": 3, "remove": 0}
+
+
+def test_changed_dependencies_relink_only_the_difference(monkeypatch):
+    churn = _count_edge_churn(monkeypatch)
+    flag, set_flag = create_signal(True)
+    x, set_x = create_signal("x")
+    y, set_y = create_signal("y")
+    shared, _ = create_signal("!")
+    seen = []
+    create_effect(lambda: seen.append((x() if flag() else y()) + shared()))
+
+    set_flag(False)
+    assert churn == {"add": 4, "remove": 1}
+
+    set_x("X")
+    assert seen == ["x!", "y!"]
+    set_y("Y")
+    assert seen == ["x!", "y!", "Y!"]
+
+
+def test_repeated_reads_link_once():
+    a, b = Signal(1), Signal(1)
+    runs = []
+    comp = effect(lambda: runs.append(a.get() + b.get() + a.get() + b.get()))
+    a.set(2)
+    b.set(3)
+    assert runs == [4, 6, 10]
+    assert comp._sources[::2] == [a, b]
+    assert a._observers[::2] == [comp] and b._observers[::2] == [comp]
+
+
+def test_memo_recomputed_during_a_read_does_not_redirty_the_reader():
+    a, set_a = create_signal(1)
+    b = create_memo(lambda: a() + 1)
+    c = create_memo(lambda: a() * 2)
+    seen = []
+    create_effect(lambda: seen.append((b(), c())))
+
+    for value in (3, 10, 4):
+        set_a(value)
+    assert seen == [(2, 2), (4, 6), (11, 20), (5, 8)]
+
+
+def test_write_to_own_dependency_during_first_run_keeps_tracking():
+    count, set_count = create_signal(0)
+    other, set_other = create_signal("a")
+    seen = []
+
+    def eff():
+        value = count()
+        if value < 2:
+            set_count(value + 1)
+        seen.append((value, other()))
+
+    create_effect(eff)
+    set_other("b")
+    set_count(5)
+    assert seen[-2:] == [(2, "b"), (5, "b")]
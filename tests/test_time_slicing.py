@@ -0,0 +1,126 @@
+"""Tests for time-sliced effect flushing.
+
+With a budget set, a flush that overruns it commits the render effects
+run so far and resumes the rest when the driver fires. A fake clock
+makes every hole "cost" one millisecond.
+"""
+
+import pytest
+
+from wybthon import h
+from wybthon.reactivity import create_computed, create_effect, create_signal, set_time_slicing
+
+
+class _Clock:
+    """Driver whose clock only moves when a test advances it."""
+
+    def __init__(self):
+        self.ms = 0.0
+        self.pending = []
+
+    def now(self):
+        return self.ms
+
+    def schedule(self, fn):
+        self.pending.append(fn)
+
+    def tick(self):
+        pending, self.pending = self.pending, []
+        for fn in pending:
+            fn()
+
+
+@pytest.fixture()
+def clock():
+    clock = _Clock()
+    yield clock
+    set_time_slicing(None)
+
+
+def _mount_rows(wyb, root_element, clock, source, count=10):
+    def cell(i):
+        def text():
+            clock.ms += 1
+            return f"{i}:{source()}"
+
+        return h("span", {}, text)
+
+    wyb["reconciler"].render(h("div", {}, *[cell(i) for i in range(count)]), root_element)
+    return root_element.element.childNodes[0].childNodes
+
+
+def _texts(cells):
+    return [c.childNodes[0].nodeValue for c in cells]
+
+
+def test_flush_yields_between_render_effects_and_resumes(wyb, root_element, clock):
+    value, set_value = create_signal("a")
+    cells = _mount_rows(wyb, root_element, clock, value)
+    set_time_slicing(3, clock)
+
+    set_value("b")
+    assert _texts(cells)[:4] == ["0:b", "1:b", "2:b", "3:a"]
+    assert len(clock.pending) == 1
+
+    clock.tick()
+    clock.tick()
+    assert _texts(cells)[-1] == "9:a"
+    clock.tick()
+    assert _texts(cells) == [f"{i}:b" for i in range(10)]
+    assert clock.pending == []
+
+
+def test_pure_computations_settle_before_a_slice_yields(wyb, root_element, clock):
+    source, set_source = create_signal(1)
+    doubled, set_doubled = create_signal(2)
+    create_computed(lambda: set_doubled(source() * 2))
+    cells = _mount_rows(wyb, root_element, clock, lambda: f"{source()}/{doubled()}")
+    set_time_slicing(0, clock)
+
+    set_source(5)
+    assert doubled() == 10
+    assert _texts(cells)[0] == "0:1/2"
+    clock.tick()
+    assert _texts(cells)[:2] == ["0:5/10", "1:1/2"]
+
+
+def test_user_effects_wait_for_the_last_render_slice(wyb, root_element, clock):
+    value, set_value = create_signal("a")
+    cells = _mount_rows(wyb, root_element, clock, value, count=4)
+    seen = []
+    create_effect(lambda: seen.append((value(), _texts(cells))))
+    set_time_slicing(2, clock)
+
+    set_value("b")
+    assert len(seen) == 1
+    clock.tick()
+    assert len(seen) == 1
+    clock.tick()
+    assert seen[-1] == ("b", ["0:b", "1:b", "2:b", "3:b"])
+
+
+def test_writes_between_slices_join_the_pending_work(wyb, root_element, clock):
+    value, set_value = create_signal("a")
+    cells = _mount_rows(wyb, root_element, clock, value, count=6)
+    set_time_slicing(2, clock)
+
+    set_value("b")
+    set_value("c")
+    while clock.pending:
+        clock.tick()
+    assert _texts(cells) == [f"{i}:c" for i in range(6)]
+
+
+def test_disabling_slicing_finishes_pending_work(wyb, root_element, clock):
+    value, set_value = create_signal("a")
+    cells = _mount_rows(wyb, root_element, clock, value)
+    set_time_slicing(1, clock)
+
+    set_value("b")
+    set_time_slicing(None)
+    assert _texts(cells) == [f"{i}:b" for i in range(10)]
+
+
+def test_negative_budget_raises():
+    with pytest.raises(ValueError):
+        set_time_slicing(-1)
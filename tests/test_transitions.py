@@ -0,0 +1,114 @@
+"""Tests for transitions.
+
+Writes inside ``start_transition`` go to a shadow layer: reads inside the
+transition see them, the live graph does not, and they apply together
+once the resources the transition started fetching have settled.
+"""
+
+import asyncio
+
+from wybthon import h, kernel
+from wybthon.reactivity import (
+    create_effect,
+    create_memo,
+    create_resource,
+    create_signal,
+    start_transition,
+    use_transition,
+)
+
+
+def test_writes_apply_together_when_nothing_is_pending():
+    a, set_a = create_signal(1)
+    b, set_b = create_signal(1)
+    doubled = create_memo(lambda: a() * 2)
+    seen = []
+    inside = []
+    create_effect(lambda: seen.append((a(), b())))
+    seen.clear()
+
+    def writes():
+        set_a(2)
+        set_b(lambda v: v + 1)
+        inside.append((a(), doubled(), doubled.peek()))
+
+    start_transition(writes)
+    assert inside == [(2, 4, 4)]
+    assert seen == [(2, 2)]
+    assert doubled() == 4
+
+
+def test_transition_waits_for_the_resources_it_starts():
+    async def run():
+        user_id, set_user_id = create_signal(1)
+        gates = {}
+        calls = []
+
+        async def load(uid):
+            calls.append(uid)
+            gates[uid] = asyncio.Event()
+            await gates[uid].wait()
+            return f"user {uid}"
+
+        user = create_resource(user_id, load)
+        pending, start = use_transition()
+        seen = []
+        create_effect(lambda: seen.append((user_id(), user(), pending())))
+        await asyncio.sleep(0)
+        gates[1].set()
+        await asyncio.sleep(0)
+        assert seen[-1] == (1, "user 1", False)
+
+        start(lambda: set_user_id(2))
+        await asyncio.sleep(0)
+        assert calls == [1, 2]
+        assert seen[-1] == (1, "user 1", True)
+        assert user.state == "ready"
+
+        # The live graph stays interactive while the transition waits.
+        other, set_other = create_signal("x")
+        create_effect(lambda: seen.append(other()))
+        set_other("y")
+        assert seen[-1] == "y"
+
+        gates[2].set()
+        await asyncio.sleep(0)
+        assert seen[-1] == (2, "user 2", False)
+        assert calls == [1, 2]
+        assert user.state == "ready"
+
+    asyncio.run(run())
+
+
+def test_cancelled_fetch_releases_the_transition():
+    async def run():
+        user_id, set_user_id = create_signal(1)
+
+        async def load(uid):
+            await asyncio.Event().wait()
+
+        user = create_resource(user_id, load, initial_value="seed")
+        pending, start = use_transition()
+        start(lambda: set_user_id(2))
+        assert pending() is True
+        assert user_id() == 1
+
+        user.cancel()
+        assert pending() is False
+        assert user_id() == 2
+        assert user() == "seed"
+
+    asyncio.run(run())
+
+
+def test_transition_dom_ops_ship_in_one_commit(wyb, root_element):
+    value, set_value = create_signal("a")
+    wyb["reconciler"].render(h("div", {}, *[h("span", {}, value) for _ in range(5)]), root_element)
+    create_effect(lambda: value())
+    create_effect(lambda: value())
+    kernel.reset_stats()
+
+    start_transition(lambda: set_value("b"))
+    cells = root_element.element.childNodes[0].childNodes
+    assert [c.childNodes[0].nodeValue for c in cells] == ["b"] * 5
+    assert kernel.stats()["commits"] == 1